@@ -30,6 +30,8 @@ __version__ = "0.4.4"
 
 from hydrosim.climate import ClimateState, SiteConfig
 from hydrosim.config import ElevationAreaVolume, NetworkGraph, YAMLParser
+from hydrosim.network_cache import NetworkCache
+from hydrosim.timeseries_io import convert_csv_to_npy
 from hydrosim.nodes import Node, StorageNode, JunctionNode, SourceNode, DemandNode
 from hydrosim.links import Link
 from hydrosim.climate_engine import ClimateEngine
@@ -49,14 +51,23 @@ from hydrosim.strategies import (
 from hydrosim.controls import Control, FractionalControl, AbsoluteControl, SwitchControl
 from hydrosim.hydraulics import HydraulicModel, WeirModel, PipeModel
 from hydrosim.solver import NetworkSolver, LinearProgrammingSolver, COST_DEMAND, COST_STORAGE, COST_SPILL
+from hydrosim.tree_solver import TreeAllocationSolver
 from hydrosim.simulation import SimulationEngine
-from hydrosim.results import ResultsWriter
+from hydrosim.results import (
+    ResultsWriter,
+    ColumnarResultsWriter,
+    JSONLinesResultsWriter,
+    read_columnar_results,
+    iter_jsonl_results,
+    rank_binding_constraints,
+)
 from hydrosim.visualization import visualize_network, save_network_visualization
 from hydrosim.results_viz import ResultsVisualizer, visualize_results
 from hydrosim.exceptions import (
     HydroSimError,
     NegativeStorageError,
     InfeasibleNetworkError,
+    SolverTimeLimitError,
     ClimateDataError,
     EAVInterpolationError,
 )
@@ -80,6 +91,8 @@ __all__ = [
     'ElevationAreaVolume',
     'NetworkGraph',
     'YAMLParser',
+    'NetworkCache',
+    'convert_csv_to_npy',
     # Network components
     'Node',
     'StorageNode',
@@ -117,9 +130,15 @@ __all__ = [
     # Simulation and solving
     'NetworkSolver',
     'LinearProgrammingSolver',
+    'TreeAllocationSolver',
     'SimulationEngine',
     # Results and visualization
     'ResultsWriter',
+    'ColumnarResultsWriter',
+    'read_columnar_results',
+    'JSONLinesResultsWriter',
+    'iter_jsonl_results',
+    'rank_binding_constraints',
     'visualize_network',
     'save_network_visualization',
     'ResultsVisualizer',
@@ -128,6 +147,7 @@ __all__ = [
     'HydroSimError',
     'NegativeStorageError',
     'InfeasibleNetworkError',
+    'SolverTimeLimitError',
     'ClimateDataError',
     'EAVInterpolationError',
     # Cost constants
@@ -51,6 +51,10 @@ from hydrosim.climate_builder.project_structure import (
 from hydrosim.climate_builder.ghcn_fetcher import (
     GHCNDataFetcher,
 )
+from hydrosim.climate_builder.ghcn_batch import (
+    GHCNBatchFetcher,
+    StationDownload,
+)
 from hydrosim.climate_builder.dly_parser import (
     DLYParser,
 )
@@ -60,6 +64,9 @@ from hydrosim.climate_builder.data_quality import (
 from hydrosim.climate_builder.precipitation_params import (
     PrecipitationParameterCalculator,
 )
+from hydrosim.climate_builder.fourier import (
+    fit_fourier_series,
+)
 from hydrosim.climate_builder.temperature_params import (
     TemperatureParameterCalculator,
 )
@@ -72,6 +79,10 @@ from hydrosim.climate_builder.parameter_generator import (
 from hydrosim.climate_builder.parameter_csv import (
     ParameterCSVWriter,
 )
+from hydrosim.climate_builder.regional import (
+    RegionalParameterPipeline,
+    StationResult,
+)
 
 __all__ = [
     'ObservedClimateData',
@@ -79,13 +90,18 @@ __all__ = [
     'DataQualityReport',
     'ProjectStructure',
     'GHCNDataFetcher',
+    'GHCNBatchFetcher',
+    'StationDownload',
     'DLYParser',
     'DataQualityValidator',
     'PrecipitationParameterCalculator',
     'TemperatureParameterCalculator',
+    'fit_fourier_series',
     'SolarParameterCalculator',
     'WGENParameterGenerator',
     'ParameterCSVWriter',
+    'RegionalParameterPipeline',
+    'StationResult',
 ]
 
 __version__ = "0.1.0"
@@ -8,7 +8,7 @@ This module defines the data structures used throughout the Climate Builder:
 """
 
 import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict
 
 
@@ -228,9 +228,13 @@ class DataQualityReport:
         missing_tmax_pct: Percentage of missing tmax values (0-100)
         missing_tmin_pct: Percentage of missing tmin values (0-100)
         missing_solar_pct: Percentage of missing solar values (0-100, or None if no solar data)
-        unrealistic_values: List of dates with unrealistic values
+        unrealistic_values: List of dates with unrealistic values (may be
+                            truncated, see unrealistic_day_count)
         warnings: List of warning messages
         errors: List of error messages
+        unrealistic_day_count: Total number of days with unrealistic values
+                               (None means len(unrealistic_values))
+        unrealistic_summary: Number of occurrences of each type of issue
     
     Notes:
         - Warnings are issued for >10% missing data
@@ -248,9 +252,14 @@ class DataQualityReport:
     unrealistic_values: List[Dict[str, any]]
     warnings: List[str]
     errors: List[str]
+    unrealistic_day_count: Optional[int] = None
+    unrealistic_summary: Dict[str, int] = field(default_factory=dict)
     
     def __post_init__(self):
         """Validate report values."""
+        if self.unrealistic_day_count is None:
+            self.unrealistic_day_count = len(self.unrealistic_values)
+
         # Validate percentages are in valid range
         for pct, name in [
             (self.missing_precip_pct, 'missing_precip_pct'),
@@ -336,9 +345,9 @@ class DataQualityReport:
             )
         
         # Check for unrealistic values
-        if self.unrealistic_values:
+        if self.unrealistic_day_count:
             warnings.append(
-                f"Found {len(self.unrealistic_values)} days with unrealistic values. "
+                f"Found {self.unrealistic_day_count} days with unrealistic values. "
                 f"See unrealistic_values list for details."
             )
         
@@ -384,12 +393,17 @@ class DataQualityReport:
                 lines.append(f"  - {error}")
             lines.append("")
         
-        if self.unrealistic_values:
-            lines.append(f"Unrealistic Values ({len(self.unrealistic_values)} days):")
+        if self.unrealistic_day_count:
+            lines.append(f"Unrealistic Values ({self.unrealistic_day_count} days):")
             for item in self.unrealistic_values[:10]:  # Show first 10
                 lines.append(f"  - {item}")
-            if len(self.unrealistic_values) > 10:
-                lines.append(f"  ... and {len(self.unrealistic_values) - 10} more")
+            shown = min(len(self.unrealistic_values), 10)
+            if self.unrealistic_day_count > shown:
+                lines.append(f"  ... and {self.unrealistic_day_count - shown} more")
+            if self.unrealistic_summary:
+                lines.append("  Issue counts:")
+                for category, count in self.unrealistic_summary.items():
+                    lines.append(f"    {category}: {count}")
             lines.append("")
         
         lines.append("=" * 70)
@@ -9,6 +9,7 @@ is suitable for parameter generation.
 Requirements: 13.1, 13.2, 13.3, 13.4, 13.5, 13.6
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -31,6 +32,8 @@ class DataQualityValidator:
     Attributes:
         df: DataFrame with observed climate data
         station_id: Optional GHCN station identifier
+        max_reported_issues: Maximum number of days listed individually in
+                             the report (None for no limit)
         
     Example:
         >>> validator = DataQualityValidator(observed_df, station_id="USW00024233")
@@ -38,18 +41,32 @@ class DataQualityValidator:
         >>> validator.save_report(report, output_path)
     """
     
-    def __init__(self, df: pd.DataFrame, station_id: Optional[str] = None):
+    def __init__(self, df: pd.DataFrame, station_id: Optional[str] = None,
+                 max_reported_issues: Optional[int] = None):
         """Initialize validator with observed climate data.
         
         Args:
             df: DataFrame with columns: date, precipitation_mm, tmax_c, tmin_c
                 (and optionally solar_mjm2). Date should be index or column.
             station_id: Optional GHCN station identifier for reporting
+            max_reported_issues: Maximum number of days with unrealistic values
+                                 listed individually in the report. Counts of
+                                 all issues are always included in the report
+                                 summary. None (default) lists every day.
             
         Raises:
-            ValueError: If required columns are missing
+            ValueError: If required columns are missing or
+                        max_reported_issues is negative
         """
+        if max_reported_issues is not None and max_reported_issues < 0:
+            raise ValueError(
+                f"max_reported_issues must be non-negative, got {max_reported_issues}"
+            )
+        
         self.station_id = station_id
+        self.max_reported_issues = max_reported_issues
+        self.unrealistic_summary: Dict[str, int] = {}
+        self.unrealistic_day_count = 0
         
         # Ensure date is the index
         if 'date' in df.columns:
@@ -123,7 +140,9 @@ class DataQualityValidator:
             missing_solar_pct=missing_solar_pct,
             unrealistic_values=unrealistic_values,
             warnings=[],
-            errors=[]
+            errors=[],
+            unrealistic_day_count=self.unrealistic_day_count,
+            unrealistic_summary=self.unrealistic_summary
         )
         
         # Generate warnings based on metrics
@@ -161,55 +180,67 @@ class DataQualityValidator:
         - Tmax < Tmin
         - Negative solar radiation
         
+        Each check is evaluated as a boolean mask over the whole column;
+        issue messages are only formatted for the days that are reported.
+        Per-check counts for all days are stored in self.unrealistic_summary
+        and the number of affected days in self.unrealistic_day_count.
+        
         Returns:
-            List of dictionaries describing unrealistic values
+            List of dictionaries describing unrealistic values (at most
+            max_reported_issues entries if a cap is set)
             
         Requirements: 13.3, 13.4
         """
-        unrealistic = []
+        precip = self.df['precipitation_mm'].to_numpy(dtype=float)
+        tmax = self.df['tmax_c'].to_numpy(dtype=float)
+        tmin = self.df['tmin_c'].to_numpy(dtype=float)
         
-        # Check each row for unrealistic values
-        for date, row in self.df.iterrows():
-            issues = []
-            
-            # Check precipitation
-            if pd.notna(row['precipitation_mm']):
-                if row['precipitation_mm'] < 0:
-                    issues.append(f"negative precipitation ({row['precipitation_mm']:.2f} mm)")
-                elif row['precipitation_mm'] > 500:  # Extreme but possible
-                    issues.append(f"very high precipitation ({row['precipitation_mm']:.2f} mm)")
-            
-            # Check temperatures
-            if pd.notna(row['tmax_c']):
-                if row['tmax_c'] < -100 or row['tmax_c'] > 60:
-                    issues.append(f"extreme tmax ({row['tmax_c']:.1f}°C)")
-            
-            if pd.notna(row['tmin_c']):
-                if row['tmin_c'] < -100 or row['tmin_c'] > 60:
-                    issues.append(f"extreme tmin ({row['tmin_c']:.1f}°C)")
-            
-            # Check tmax >= tmin
-            if pd.notna(row['tmax_c']) and pd.notna(row['tmin_c']):
-                if row['tmax_c'] < row['tmin_c']:
-                    issues.append(
-                        f"tmax ({row['tmax_c']:.1f}°C) < tmin ({row['tmin_c']:.1f}°C)"
-                    )
-            
-            # Check solar radiation if present
-            if 'solar_mjm2' in self.df.columns and pd.notna(row['solar_mjm2']):
-                if row['solar_mjm2'] < 0:
-                    issues.append(f"negative solar ({row['solar_mjm2']:.2f} MJ/m²/day)")
-                elif row['solar_mjm2'] > 50:  # Theoretical max is ~40-45 at equator
-                    issues.append(f"very high solar ({row['solar_mjm2']:.2f} MJ/m²/day)")
-            
-            # Add to unrealistic list if any issues found
-            if issues:
-                # Convert date to string for JSON serialization
-                date_str = str(date.date()) if isinstance(date, pd.Timestamp) else str(date)
-                unrealistic.append({
-                    'date': date_str,
-                    'issues': issues
-                })
+        # (category, mask, message) in the order issues are listed per day.
+        # Comparisons with NaN are False, so missing values never match.
+        checks = [
+            ('negative_precipitation', precip < 0,
+             lambda i: f"negative precipitation ({precip[i]:.2f} mm)"),
+            ('very_high_precipitation', precip > 500,  # Extreme but possible
+             lambda i: f"very high precipitation ({precip[i]:.2f} mm)"),
+            ('extreme_tmax', (tmax < -100) | (tmax > 60),
+             lambda i: f"extreme tmax ({tmax[i]:.1f}°C)"),
+            ('extreme_tmin', (tmin < -100) | (tmin > 60),
+             lambda i: f"extreme tmin ({tmin[i]:.1f}°C)"),
+            ('tmax_below_tmin', tmax < tmin,
+             lambda i: f"tmax ({tmax[i]:.1f}°C) < tmin ({tmin[i]:.1f}°C)"),
+        ]
+        
+        # Check solar radiation if present
+        if 'solar_mjm2' in self.df.columns:
+            solar = self.df['solar_mjm2'].to_numpy(dtype=float)
+            checks += [
+                ('negative_solar', solar < 0,
+                 lambda i: f"negative solar ({solar[i]:.2f} MJ/m²/day)"),
+                ('very_high_solar', solar > 50,  # Theoretical max is ~40-45 at equator
+                 lambda i: f"very high solar ({solar[i]:.2f} MJ/m²/day)"),
+            ]
+        
+        any_issue = np.zeros(len(self.df), dtype=bool)
+        for _, mask, _ in checks:
+            any_issue |= mask
+        rows = np.flatnonzero(any_issue)
+        
+        self.unrealistic_summary = {
+            category: int(mask.sum()) for category, mask, _ in checks if mask.any()
+        }
+        self.unrealistic_day_count = len(rows)
+        if self.max_reported_issues is not None:
+            rows = rows[:self.max_reported_issues]
+        
+        unrealistic = []
+        for i in rows:
+            date = self.df.index[i]
+            # Convert date to string for JSON serialization
+            date_str = str(date.date()) if isinstance(date, pd.Timestamp) else str(date)
+            unrealistic.append({
+                'date': date_str,
+                'issues': [message(i) for _, mask, message in checks if mask[i]]
+            })
         
         return unrealistic
     
@@ -238,7 +269,8 @@ class DataQualityValidator:
     def validate_and_save(
         df: pd.DataFrame,
         output_path: Path,
-        station_id: Optional[str] = None
+        station_id: Optional[str] = None,
+        max_reported_issues: Optional[int] = None
     ) -> DataQualityReport:
         """Convenience method to validate data and save report in one call.
         
@@ -246,6 +278,8 @@ class DataQualityValidator:
             df: DataFrame with observed climate data
             output_path: Path to save report file
             station_id: Optional GHCN station identifier
+            max_reported_issues: Maximum number of days with unrealistic
+                                 values listed individually (None for all)
             
         Returns:
             DataQualityReport
@@ -257,7 +291,9 @@ class DataQualityValidator:
             ...     station_id="USW00024233"
             ... )
         """
-        validator = DataQualityValidator(df, station_id=station_id)
+        validator = DataQualityValidator(
+            df, station_id=station_id, max_reported_issues=max_reported_issues
+        )
         report = validator.validate()
         validator.save_report(report, output_path)
         return report
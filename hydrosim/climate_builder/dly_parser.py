@@ -22,10 +22,63 @@ Requirements: 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7
 
 import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
 
 
+def _record_matrix(buf: np.ndarray, starts: np.ndarray, lengths: np.ndarray,
+                   width: int) -> np.ndarray:
+    """Copy lines of a byte buffer into a space-padded (lines, width) matrix."""
+    if np.all(lengths == width) and np.all(np.diff(starts) == width + 1):
+        # Standard file: every record is exactly one full line
+        stop = starts[0] + len(starts) * (width + 1)
+        padded = np.append(buf[starts[0]:stop], np.uint8(ord('\n')))
+        return padded[:len(starts) * (width + 1)].reshape(-1, width + 1)[:, :width]
+    
+    matrix = np.full((len(starts), width), ord(' '), dtype=np.uint8)
+    cols = np.arange(width)
+    for chunk in range(0, len(starts), 10000):
+        rows = slice(chunk, chunk + 10000)
+        index = starts[rows, None] + cols
+        inside = cols < lengths[rows, None]
+        matrix[rows][inside] = buf[index[inside]]
+    return matrix
+
+
+def _parse_int_fields(fields: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parse space-padded integer fields along the last axis of a byte array.
+    
+    Args:
+        fields: uint8 array whose last axis holds the characters of each field
+        
+    Returns:
+        Tuple of (values, ok, blank): parsed values (int64), mask of fields
+        that are an optional sign followed by digits surrounded by spaces,
+        and mask of fields consisting only of spaces. Values are only
+        meaningful where ok is True.
+    """
+    width = fields.shape[-1]
+    pos = np.arange(width)
+    nonspace = fields != ord(' ')
+    is_digit = (fields >= ord('0')) & (fields <= ord('9'))
+    blank = ~nonspace.any(axis=-1)
+    
+    first = nonspace.argmax(axis=-1)[..., None]
+    last = (width - 1 - nonspace[..., ::-1].argmax(axis=-1))[..., None]
+    inside = (pos >= first) & (pos <= last)
+    first_char = np.take_along_axis(fields, first, axis=-1)
+    signed = (first_char == ord('-')) | (first_char == ord('+'))
+    digits = inside & ~((pos == first) & signed)
+    
+    ok = (~blank & (nonspace == inside).all(axis=-1)
+          & (is_digit | ~digits).all(axis=-1) & digits.any(axis=-1))
+    power = np.where(digits, 10 ** np.clip(last - pos, 0, None), 0)
+    magnitude = ((fields.astype(np.int64) - ord('0')) * power).sum(axis=-1)
+    values = np.where(first_char[..., 0] == ord('-'), -magnitude, magnitude)
+    return values, ok, blank
+
+
 class DLYParser:
     """Parser for GHCN Daily format (.dly) files.
     
@@ -48,6 +101,12 @@ class DLYParser:
     # Missing value flag in GHCN format
     MISSING_VALUE_FLAG = -9999
     
+    # Element codes and the output columns they map to
+    ELEMENT_COLUMNS = {'PRCP': 'precipitation_mm', 'TMAX': 'tmax_c', 'TMIN': 'tmin_c'}
+    
+    # Header (21 characters) plus 31 daily values of 8 characters
+    RECORD_WIDTH = 21 + 31 * 8
+    
     def __init__(self):
         """Initialize DLY parser."""
         pass
@@ -68,6 +127,9 @@ class DLYParser:
         - 1 character: Quality flag
         - 1 character: Source flag
         
+        ASCII files (all GHCN files) are parsed with array operations over
+        the whole file; other files are parsed line by line.
+        
         Args:
             dly_path: Path to .dly file
             
@@ -92,6 +154,162 @@ class DLYParser:
         
         print(f"Parsing .dly file: {dly_path}")
         
+        raw = dly_path.read_bytes()
+        if raw.isascii():
+            df = self._parse_records(raw)
+        else:
+            # Multi-byte characters shift the fixed-width columns of the
+            # decoded text; use the line-by-line parser for exact behaviour
+            df = self._parse_line_by_line(dly_path)
+        
+        if df.empty:
+            raise ValueError(
+                f"No valid data found in .dly file: {dly_path}\n"
+                f"File may be empty or corrupted."
+            )
+        
+        print(f"Parsed {len(df)} days of data")
+        print(f"Date range: {df['date'].min()} to {df['date'].max()}")
+        
+        # Report missing data
+        for col in ['precipitation_mm', 'tmax_c', 'tmin_c']:
+            missing_count = df[col].isna().sum()
+            missing_pct = 100 * missing_count / len(df)
+            print(f"  {col}: {missing_pct:.1f}% missing ({missing_count}/{len(df)} days)")
+        
+        return df
+    
+    def _parse_records(self, raw: bytes) -> pd.DataFrame:
+        """Parse the contents of an ASCII .dly file with array operations.
+        
+        The file is viewed as a matrix of fixed-width records (one row per
+        line, padded with spaces). PRCP/TMAX/TMIN rows are selected with
+        masks, the 31 day slots are reshaped into a (lines, 31) array, and
+        dates are computed with datetime64 arithmetic. Fields that are not
+        plain space-padded integers fall back to int() so that the result
+        is identical to the line-by-line parser.
+        
+        Args:
+            raw: File contents
+            
+        Returns:
+            DataFrame with columns: date, precipitation_mm, tmax_c, tmin_c
+            (empty if the file contains no valid values)
+        """
+        # Text-mode reading translates \r\n and \r to \n
+        if b'\r' in raw:
+            raw = raw.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        
+        buf = np.frombuffer(raw, dtype=np.uint8)
+        newlines = np.flatnonzero(buf == ord('\n'))
+        starts = np.concatenate(([0], newlines + 1))
+        ends = np.concatenate((newlines, [len(buf)]))
+        if starts[-1] == len(buf):
+            starts, ends = starts[:-1], ends[:-1]
+        if len(starts) == 0:
+            return self._empty_frame()
+        
+        content_lengths = ends - starts
+        # len(line) in text mode includes the newline terminator
+        line_lengths = content_lengths + (ends < len(buf))
+        lines = _record_matrix(buf, starts, content_lengths, self.RECORD_WIDTH)
+        
+        def line_text(i: int) -> str:
+            return raw[starts[i]:ends[i] + (ends[i] < len(buf))].decode('ascii')
+        
+        # Year and month; malformed headers are reported and skipped.
+        # Whitespace-only lines never have a valid year and are skipped
+        # silently in the fallback loop.
+        years, year_ok, _ = _parse_int_fields(lines[:, 11:15])
+        months, month_ok, _ = _parse_int_fields(lines[:, 15:17])
+        header_ok = year_ok & month_ok
+        for i in np.flatnonzero(~header_ok):
+            text = line_text(i)
+            if not text.strip():
+                continue
+            try:
+                years[i] = int(text[11:15])
+                months[i] = int(text[15:17])
+                header_ok[i] = True
+            except Exception as e:
+                print(f"Warning: Error parsing line {i + 1}: {str(e)}")
+        
+        elements = np.zeros(len(lines), dtype=np.int8)  # 0 = not used
+        for code, name in enumerate(self.ELEMENT_COLUMNS, 1):
+            match = (lines[:, 17:21] == np.frombuffer(name.encode(), dtype=np.uint8)).all(axis=1)
+            elements[match] = code
+        selected = np.flatnonzero(header_ok & (elements > 0))
+        
+        # Daily values: (lines, 31 days, 5 characters)
+        fields = lines[selected, 21:].reshape(len(selected), 31, 8)[:, :, :5]
+        values, value_ok, value_blank = _parse_int_fields(fields)
+        day_offsets = 21 + 8 * np.arange(31)
+        available = day_offsets + 5 <= line_lengths[selected, None]
+        for row, day in zip(*np.nonzero(available & ~value_ok & ~value_blank)):
+            pos = day_offsets[day]
+            value_str = line_text(selected[row])[pos:pos + 5]
+            if not value_str.strip():
+                continue
+            try:
+                values[row, day] = int(value_str)
+                value_ok[row, day] = True
+            except ValueError:
+                continue
+        valid = available & value_ok
+        
+        # Dates; invalid dates (e.g. Feb 30) and February 29th are skipped
+        year = np.broadcast_to(years[selected, None], valid.shape)
+        month = np.broadcast_to(months[selected, None], valid.shape)
+        day = np.broadcast_to(np.arange(1, 32), valid.shape)
+        in_range = (year >= 1) & (year <= 9999) & (month >= 1) & (month <= 12)
+        month_start = (
+            (np.where(in_range, year, 1970) - 1970) * 12 + np.where(in_range, month, 1) - 1
+        ).astype('datetime64[M]')
+        first_day = month_start.astype('datetime64[D]')
+        days_in_month = ((month_start + 1).astype('datetime64[D]') - first_day).astype(np.int64)
+        valid &= in_range & (day <= days_in_month) & ~((month == 2) & (day == 29))
+        
+        dates = (first_day + (day - 1))[valid]
+        values = values[valid]
+        codes = np.broadcast_to(elements[selected, None], valid.shape)[valid]
+        if len(dates) == 0:
+            return self._empty_frame()
+        
+        # Requirements 2.1-2.4: tenths to whole units, -9999 → NaN
+        converted = np.where(values == self.MISSING_VALUE_FLAG, np.nan, values / 10.0)
+        
+        all_dates = np.unique(dates)
+        columns = {'date': all_dates.astype(object)}
+        for code, column in enumerate(self.ELEMENT_COLUMNS.values(), 1):
+            mask = codes == code
+            # Later records for the same date override earlier ones
+            element_dates = dates[mask][::-1]
+            unique_dates, last = np.unique(element_dates, return_index=True)
+            series = np.full(len(all_dates), np.nan)
+            series[np.searchsorted(all_dates, unique_dates)] = converted[mask][::-1][last]
+            if np.isnan(series).all():
+                # No observed value at all: keep None entries like the
+                # record-by-record construction does
+                series = np.full(len(all_dates), None, dtype=object)
+            columns[column] = series
+        
+        return pd.DataFrame(columns)
+    
+    def _empty_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(columns=['date', *self.ELEMENT_COLUMNS.values()])
+    
+    def _parse_line_by_line(self, dly_path: Path) -> pd.DataFrame:
+        """Parse a .dly file one line and one day slot at a time.
+        
+        Reference implementation used for files that are not plain ASCII.
+        
+        Args:
+            dly_path: Path to .dly file
+            
+        Returns:
+            DataFrame with columns: date, precipitation_mm, tmax_c, tmin_c
+            (empty if the file contains no valid values)
+        """
         # Storage for parsed data
         data_by_date = {}
         
@@ -177,27 +395,12 @@ class DLYParser:
                     print(f"Warning: Error parsing line {line_num}: {str(e)}")
                     continue
         
-        # Convert to DataFrame
         if not data_by_date:
-            raise ValueError(
-                f"No valid data found in .dly file: {dly_path}\n"
-                f"File may be empty or corrupted."
-            )
+            return self._empty_frame()
         
         # Requirement 2.7: Output DataFrame with columns: date, precipitation_mm, tmax_c, tmin_c
         df = pd.DataFrame(list(data_by_date.values()))
-        df = df.sort_values('date').reset_index(drop=True)
-        
-        print(f"Parsed {len(df)} days of data")
-        print(f"Date range: {df['date'].min()} to {df['date'].max()}")
-        
-        # Report missing data
-        for col in ['precipitation_mm', 'tmax_c', 'tmin_c']:
-            missing_count = df[col].isna().sum()
-            missing_pct = 100 * missing_count / len(df)
-            print(f"  {col}: {missing_pct:.1f}% missing ({missing_count}/{len(df)} days)")
-        
-        return df
+        return df.sort_values('date').reset_index(drop=True)
     
     def parse_line(self, line: str) -> Dict[datetime.date, Dict[str, Optional[float]]]:
         """Parse a single line from a .dly file.
@@ -0,0 +1,82 @@
+"""
+Closed-form Fourier series fitting for Climate Builder.
+
+WGEN describes the seasonal cycle of temperature and solar radiation with a
+single-harmonic Fourier series over the periods of the year:
+
+    y(p) = mean + amplitude * cos(2π(p - peak) / N)
+
+Expanding the cosine gives
+
+    y(p) = mean + b * cos(2πp / N) + c * sin(2πp / N)
+
+with b = amplitude * cos(2π·peak / N) and c = amplitude * sin(2π·peak / N),
+which is linear in (mean, b, c). The least-squares fit is therefore a single
+linear solve, and many series (e.g. all stations × tmax dry/tmax wet/tmin/
+solar) can be fitted together by solving against all of them at once.
+"""
+
+import warnings
+from typing import Tuple
+
+import numpy as np
+
+
+def fourier_design_matrix(num_periods: int) -> np.ndarray:
+    """Build the (num_periods, 3) design matrix [1, cos, sin] for periods 1..N.
+
+    Args:
+        num_periods: Number of periods in the year
+
+    Returns:
+        Design matrix with columns 1, cos(2πp/N) and sin(2πp/N)
+    """
+    angles = 2 * np.pi * np.arange(1, num_periods + 1) / num_periods
+    return np.column_stack([np.ones(num_periods), np.cos(angles), np.sin(angles)])
+
+
+def fit_fourier_series(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fit y = mean + amplitude*cos(2π(p - peak)/N) to one or many series.
+
+    Args:
+        values: Array of shape (N,) or (K, N) holding K series of N period
+                values (p = 1..N)
+
+    Returns:
+        Tuple of (mean, amplitude, peak) with shape () for a single series or
+        (K,) for K series. The amplitude is non-negative and the peak lies
+        in (0, N]. Series containing non-finite values fall back to the
+        simple estimates mean(values) and (max - min) / 2 with a warning
+        (peak is NaN).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    series = np.atleast_2d(values)
+    num_periods = series.shape[1]
+
+    mean = np.full(len(series), np.nan)
+    amplitude = np.full(len(series), np.nan)
+    peak = np.full(len(series), np.nan)
+
+    finite = np.isfinite(series).all(axis=1)
+    if finite.any():
+        coefficients, _, _, _ = np.linalg.lstsq(
+            fourier_design_matrix(num_periods), series[finite].T, rcond=None
+        )
+        b, c = coefficients[1], coefficients[2]
+        mean[finite] = coefficients[0]
+        amplitude[finite] = np.hypot(b, c)
+        phase = np.arctan2(c, b) * num_periods / (2 * np.pi)
+        peak[finite] = np.where(phase <= 0, phase + num_periods, phase)
+
+    if not finite.all():
+        warnings.warn(
+            f"Fourier series fitting failed for {int((~finite).sum())} series with "
+            f"missing values. Using simple mean and amplitude estimates."
+        )
+        bad = series[~finite]
+        mean[~finite] = np.mean(bad, axis=1)
+        amplitude[~finite] = (np.max(bad, axis=1) - np.min(bad, axis=1)) / 2
+
+    if values.ndim == 1:
+        return mean[0], amplitude[0], peak[0]
+    return mean, amplitude, peak
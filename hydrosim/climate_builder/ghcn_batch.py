@@ -0,0 +1,416 @@
+"""
+Batch GHCN Data Acquisition for Climate Builder.
+
+This module provides the GHCNBatchFetcher class for downloading .dly files for
+many stations at once, as needed for regional parameter studies.
+
+Features:
+    - Concurrent downloads with a bounded thread pool
+    - Content-addressed local cache (files stored by SHA-256 of their content)
+    - Revalidation of cached files with ETag / Last-Modified headers, so
+      unchanged files are not downloaded again
+    - Resumption of interrupted downloads with HTTP Range requests
+    - Offline operation against a local mirror directory (file:// base URL
+      or plain directory path), which behaves like an HTTP server including
+      conditional and range requests
+
+Cache Layout:
+    <cache_dir>/objects/<sha[:2]>/<sha>.dly  - Downloaded file content
+    <cache_dir>/index/<station_id>.json      - Station → content hash, ETag,
+                                               Last-Modified and source URL
+    <cache_dir>/partial/<station_id>.dly.part - Incomplete download
+    <cache_dir>/partial/<station_id>.json     - Validators of the partial file
+
+Example:
+    >>> fetcher = GHCNBatchFetcher("./ghcn_cache", max_workers=8)
+    >>> results = fetcher.fetch(["USW00024233", "USW00024229"], dest_dir="./raw")
+    >>> for station_id, result in results.items():
+    ...     print(station_id, result.status, result.path)
+"""
+
+import email.utils
+import hashlib
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+import requests
+from requests.exceptions import RequestException
+
+from hydrosim.climate_builder.ghcn_fetcher import GHCNDataFetcher
+
+
+@dataclass
+class StationDownload:
+    """Outcome of fetching one station.
+
+    Attributes:
+        station_id: GHCN station identifier
+        status: 'downloaded' (new content), 'resumed' (partial download
+                completed), 'cached' (server confirmed cached copy is current),
+                'offline' (cached copy used without revalidation) or 'failed'
+        path: Path to the .dly file (None if failed)
+        sha256: Content hash of the file (None if failed)
+        error: Error message if failed
+    """
+    station_id: str
+    status: str
+    path: Optional[Path] = None
+    sha256: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether a usable file is available."""
+        return self.status != 'failed'
+
+
+@dataclass
+class _Response:
+    """Minimal response used by both HTTP and local mirror transports."""
+    status: int
+    headers: Dict[str, str]
+    chunks: Iterator[bytes]
+    on_close: Optional[Callable[[], None]] = None
+
+    def close(self) -> None:
+        """Release the underlying file or connection."""
+        close_chunks = getattr(self.chunks, 'close', None)
+        if close_chunks is not None:
+            close_chunks()
+        if self.on_close is not None:
+            self.on_close()
+
+
+def _file_response(path: Path, request_headers: Dict[str, str], chunk_size: int) -> _Response:
+    """Serve a local mirror file with HTTP-like conditional and range semantics."""
+    if not path.is_file():
+        return _Response(404, {}, iter(()))
+
+    stat = path.stat()
+    etag = f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+    last_modified = email.utils.formatdate(stat.st_mtime, usegmt=True)
+    headers = {'ETag': etag, 'Last-Modified': last_modified}
+
+    if request_headers.get('If-None-Match') == etag:
+        return _Response(304, headers, iter(()))
+    if 'If-None-Match' not in request_headers and 'If-Modified-Since' in request_headers:
+        since = email.utils.parsedate_to_datetime(request_headers['If-Modified-Since'])
+        if int(stat.st_mtime) <= since.timestamp():
+            return _Response(304, headers, iter(()))
+
+    offset = 0
+    status = 200
+    range_header = request_headers.get('Range')
+    if range_header and request_headers.get('If-Range', etag) == etag:
+        offset = int(range_header.split('=')[1].split('-')[0])
+        if offset >= stat.st_size:
+            return _Response(416, headers, iter(()))
+        status = 206
+
+    def read_chunks() -> Iterator[bytes]:
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                yield chunk
+
+    return _Response(status, headers, read_chunks())
+
+
+class GHCNBatchFetcher:
+    """Downloads GHCN .dly files for many stations with a shared local cache.
+
+    Attributes:
+        cache_dir: Root of the content-addressed cache
+        base_url: Server or mirror URL containing <station_id>.dly files
+        max_workers: Maximum number of concurrent downloads
+        timeout: HTTP request timeout in seconds
+
+    Example:
+        >>> fetcher = GHCNBatchFetcher("./cache", base_url="file:///data/ghcn/all")
+        >>> results = fetcher.fetch(station_ids)
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, cache_dir: Path | str,
+                 base_url: str = GHCNDataFetcher.GHCN_BASE_URL,
+                 max_workers: int = 8,
+                 timeout: int = 30):
+        """Initialize batch fetcher.
+
+        Args:
+            cache_dir: Directory for the local cache (created if missing)
+            base_url: Base URL of the GHCN 'all' directory. May be an http(s)
+                      URL, a file:// URL or a local directory path (mirror).
+            max_workers: Maximum number of concurrent downloads
+            timeout: HTTP request timeout in seconds
+
+        Raises:
+            ValueError: If max_workers is less than 1
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        self.cache_dir = Path(cache_dir)
+        self.base_url = base_url.rstrip('/')
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+        for subdir in ('objects', 'index', 'partial'):
+            (self.cache_dir / subdir).mkdir(parents=True, exist_ok=True)
+
+        self._local = threading.local()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def fetch(self, station_ids: Iterable[str], dest_dir: Optional[Path | str] = None,
+              revalidate: bool = True) -> Dict[str, StationDownload]:
+        """Fetch .dly files for a list of stations concurrently.
+
+        Failures are isolated: a station that cannot be fetched is reported
+        with status 'failed' and does not affect the others. Duplicate IDs
+        are fetched once.
+
+        Args:
+            station_ids: GHCN station identifiers
+            dest_dir: Optional directory to place <station_id>.dly copies in
+                      (hard links when possible)
+            revalidate: Check cached files with the server. If False, cached
+                        files are used as-is and only missing stations are
+                        downloaded.
+
+        Returns:
+            Dictionary mapping station ID to StationDownload, in input order
+        """
+        # Deduplicate so two workers never write the same partial file
+        station_ids = list(dict.fromkeys(s.strip().upper() for s in station_ids))
+        if dest_dir is not None:
+            Path(dest_dir).mkdir(parents=True, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [
+                pool.submit(self.fetch_station, station_id, dest_dir, revalidate)
+                for station_id in station_ids
+            ]
+            results = [future.result() for future in futures]
+
+        failed = sum(1 for r in results if not r.ok)
+        print(f"Fetched {len(results) - failed}/{len(results)} stations"
+              + (f" ({failed} failed)" if failed else ""))
+        return {r.station_id: r for r in results}
+
+    def fetch_station(self, station_id: str, dest_dir: Optional[Path | str] = None,
+                      revalidate: bool = True) -> StationDownload:
+        """Fetch one station's .dly file through the cache.
+
+        Args:
+            station_id: GHCN station identifier
+            dest_dir: Optional directory to place <station_id>.dly in
+            revalidate: Check a cached file with the server before using it
+
+        Returns:
+            StationDownload describing the outcome (never raises for
+            download errors)
+        """
+        station_id = station_id.strip().upper()
+        if not GHCNDataFetcher.STATION_ID_PATTERN.match(station_id):
+            return StationDownload(station_id, 'failed',
+                                   error=f"Invalid GHCN station ID format: '{station_id}'")
+
+        try:
+            result = self._fetch(station_id, revalidate)
+        except (RequestException, OSError, ValueError) as e:
+            result = StationDownload(station_id, 'failed', error=str(e))
+
+        if result.ok and dest_dir is not None:
+            result.path = self._materialise(result.path, Path(dest_dir) / f"{station_id}.dly")
+        return result
+
+    def cached_path(self, station_id: str) -> Optional[Path]:
+        """Return the cached file for a station, if any.
+
+        Args:
+            station_id: GHCN station identifier
+
+        Returns:
+            Path to cached content, or None if the station is not cached
+        """
+        entry = self._read_index(station_id.strip().upper())
+        if entry is None:
+            return None
+        path = self._object_path(entry['sha256'])
+        return path if path.exists() else None
+
+    # ------------------------------------------------------------------
+    # Cache internals
+    # ------------------------------------------------------------------
+
+    def _object_path(self, sha256: str) -> Path:
+        return self.cache_dir / 'objects' / sha256[:2] / f"{sha256}.dly"
+
+    def _index_path(self, station_id: str) -> Path:
+        return self.cache_dir / 'index' / f"{station_id}.json"
+
+    def _partial_paths(self, station_id: str) -> Tuple[Path, Path]:
+        partial_dir = self.cache_dir / 'partial'
+        return partial_dir / f"{station_id}.dly.part", partial_dir / f"{station_id}.json"
+
+    def _read_index(self, station_id: str) -> Optional[dict]:
+        path = self._index_path(station_id)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_json(path: Path, data: dict) -> None:
+        tmp = path.with_name(path.name + f".{threading.get_ident()}.tmp")
+        with open(tmp, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _materialise(source: Path, target: Path) -> Path:
+        """Place a cached object at target, preferring a hard link over a copy."""
+        if target.exists():
+            target.unlink()
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copyfile(source, target)
+        return target
+
+    # ------------------------------------------------------------------
+    # Transport
+    # ------------------------------------------------------------------
+
+    def _url(self, station_id: str) -> str:
+        return f"{self.base_url}/{station_id}.dly"
+
+    def _local_mirror_path(self, url: str) -> Optional[Path]:
+        parsed = urlparse(url)
+        if parsed.scheme == 'file':
+            return Path(url2pathname(parsed.path))
+        if parsed.scheme in ('http', 'https'):
+            return None
+        return Path(url)
+
+    def _session(self) -> requests.Session:
+        # requests sessions are not guaranteed thread-safe; keep one per worker
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
+
+    def _request(self, url: str, headers: Dict[str, str]) -> _Response:
+        local_path = self._local_mirror_path(url)
+        if local_path is not None:
+            return _file_response(local_path, headers, self.CHUNK_SIZE)
+
+        response = self._session().get(url, headers=headers, timeout=self.timeout, stream=True)
+        return _Response(
+            response.status_code,
+            {k: v for k, v in response.headers.items() if k in ('ETag', 'Last-Modified')},
+            response.iter_content(chunk_size=self.CHUNK_SIZE),
+            response.close
+        )
+
+    # ------------------------------------------------------------------
+    # Download logic
+    # ------------------------------------------------------------------
+
+    def _fetch(self, station_id: str, revalidate: bool) -> StationDownload:
+        entry = self._read_index(station_id)
+        cached = None
+        if entry is not None and self._object_path(entry['sha256']).exists():
+            cached = entry
+            if not revalidate:
+                return StationDownload(station_id, 'offline',
+                                       self._object_path(entry['sha256']), entry['sha256'])
+
+        part_path, part_meta_path = self._partial_paths(station_id)
+        headers: Dict[str, str] = {}
+        resuming = False
+
+        if part_path.exists() and part_meta_path.exists() and part_path.stat().st_size > 0:
+            with open(part_meta_path, 'r') as f:
+                part_meta = json.load(f)
+            validator = part_meta.get('etag') or part_meta.get('last_modified')
+            if validator:
+                headers['Range'] = f"bytes={part_path.stat().st_size}-"
+                headers['If-Range'] = validator
+                resuming = True
+        elif cached is not None:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        url = self._url(station_id)
+        with closing(self._request(url, headers)) as response:
+            if response.status == 304 and cached is not None:
+                return StationDownload(station_id, 'cached',
+                                       self._object_path(cached['sha256']), cached['sha256'])
+            if response.status == 404:
+                raise ValueError(f"Station '{station_id}' not found at {url}")
+            restart = response.status == 416 and resuming
+            if not restart:
+                if response.status not in (200, 206):
+                    raise ValueError(f"HTTP {response.status} fetching {url}")
+
+                validators = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                }
+                append = response.status == 206
+                self._write_json(part_meta_path, validators)
+
+                with open(part_path, 'ab' if append else 'wb') as f:
+                    for chunk in response.chunks:
+                        if chunk:
+                            f.write(chunk)
+
+        if restart:
+            # Partial file is already complete (or invalid); start over
+            part_path.unlink()
+            part_meta_path.unlink()
+            return self._fetch(station_id, revalidate)
+
+        # Content-address the completed file
+        sha = hashlib.sha256()
+        with open(part_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b''):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+
+        object_path = self._object_path(digest)
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        if object_path.exists():
+            part_path.unlink()
+        else:
+            os.replace(part_path, object_path)
+        part_meta_path.unlink()
+
+        self._write_json(self._index_path(station_id), {
+            'sha256': digest,
+            'url': url,
+            **validators,
+        })
+
+        return StationDownload(station_id, 'resumed' if append else 'downloaded',
+                               object_path, digest)
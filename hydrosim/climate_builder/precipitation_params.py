@@ -7,7 +7,7 @@ the algorithms from the legacy wgenpar.f FORTRAN code.
 """
 
 import warnings
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 from scipy import stats
@@ -48,6 +48,13 @@ class PrecipitationParameterCalculator:
     def calculate_parameters(self, df: pd.DataFrame) -> Dict[str, List[float]]:
         """Calculate all precipitation parameters from observed data.
         
+        Wet/dry transitions are only counted between consecutive calendar
+        days that both have observations, so gaps in the record and breaks
+        between years do not create spurious transitions. February 28 is
+        treated as adjacent to March 1 in leap years without a February 29
+        record (WGEN uses a 365-day calendar). Each transition is assigned
+        to the month of the second day.
+        
         Args:
             df: DataFrame with columns 'date' and 'precipitation_mm'
                 Date should be datetime.date or parseable to datetime
@@ -63,63 +70,148 @@ class PrecipitationParameterCalculator:
         Raises:
             ValueError: If required columns are missing or data is insufficient
         """
-        # Validate input
-        if 'date' not in df.columns:
-            raise ValueError("DataFrame must have 'date' column")
-        if 'precipitation_mm' not in df.columns:
-            raise ValueError("DataFrame must have 'precipitation_mm' column")
+        dates, precip = self._prepare_record(df)
+        counts, n_wet, mean, var = self._record_statistics(
+            np.zeros(len(dates), dtype=np.int64), dates, precip, n_stations=1
+        )
+        return self._parameters_from_statistics(counts[0], n_wet[0], mean[0], var[0])
+    
+    def calculate_parameters_batch(
+        self, station_data: Dict[str, pd.DataFrame]
+    ) -> Dict[str, Dict[str, List[float]]]:
+        """Calculate precipitation parameters for many stations in one pass.
         
-        # Ensure date is datetime
-        if not pd.api.types.is_datetime64_any_dtype(df['date']):
-            df = df.copy()
-            df['date'] = pd.to_datetime(df['date'])
+        All records are concatenated and the transition counts and wet-day
+        moments of every station and month are computed together with
+        np.bincount. Results are identical to calling calculate_parameters()
+        for each station.
         
-        # Add month column for grouping
-        df = df.copy()
-        df['month'] = df['date'].dt.month
+        Args:
+            station_data: Dictionary mapping station ID to a DataFrame with
+                          columns 'date' and 'precipitation_mm'
         
-        # Classify wet/dry days
-        df['is_wet'] = self._classify_wet_dry(df['precipitation_mm'])
+        Returns:
+            Dictionary mapping station ID to a parameter dictionary with
+            keys 'pww', 'pwd', 'alpha', 'beta' (12 monthly values each)
         
-        # Calculate Markov chain parameters by month
-        pww_list = []
-        pwd_list = []
+        Raises:
+            ValueError: If a DataFrame is missing required columns
+        """
+        station_ids = list(station_data)
+        records = [self._prepare_record(station_data[sid]) for sid in station_ids]
+        if not records:
+            return {}
+        
+        stations = np.concatenate([
+            np.full(len(dates), i, dtype=np.int64) for i, (dates, _) in enumerate(records)
+        ])
+        dates = np.concatenate([dates for dates, _ in records])
+        precip = np.concatenate([precip for _, precip in records])
+        
+        counts, n_wet, mean, var = self._record_statistics(
+            stations, dates, precip, n_stations=len(station_ids)
+        )
+        return {
+            sid: self._parameters_from_statistics(
+                counts[i], n_wet[i], mean[i], var[i], station=sid
+            )
+            for i, sid in enumerate(station_ids)
+        }
+    
+    def _prepare_record(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Validate a record and return its dates (datetime64[D]) and precipitation."""
+        if 'date' not in df.columns:
+            raise ValueError("DataFrame must have 'date' column")
+        if 'precipitation_mm' not in df.columns:
+            raise ValueError("DataFrame must have 'precipitation_mm' column")
         
-        for month in range(1, 13):
-            month_data = df[df['month'] == month].copy()
-            pww, pwd = self._calculate_markov_params(month_data, month)
-            pww_list.append(pww)
-            pwd_list.append(pwd)
+        dates = pd.to_datetime(df['date']).to_numpy().astype('datetime64[D]')
+        precip = df['precipitation_mm'].to_numpy(dtype=np.float64)
+        return dates, precip
+    
+    def _record_statistics(
+        self, stations: np.ndarray, dates: np.ndarray, precip: np.ndarray, n_stations: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Compute transition counts and wet-day moments per station and month.
         
-        # Calculate Gamma distribution parameters by month
-        alpha_list = []
-        beta_list = []
+        Args:
+            stations: Station index (0..n_stations-1) of each record
+            dates: Dates of each record (datetime64[D])
+            precip: Precipitation of each record in mm (NaN for missing)
+            n_stations: Number of stations
         
+        Returns:
+            Tuple of (counts, n_wet, mean, var):
+                - counts: (n_stations, 12, 2, 2) transition counts indexed by
+                  [station, month - 1, previous day wet, current day wet]
+                - n_wet: (n_stations, 12) number of wet days
+                - mean: (n_stations, 12) mean wet-day precipitation
+                - var: (n_stations, 12) sample variance of wet-day precipitation
+        """
+        order = np.lexsort((dates, stations))
+        stations, dates, precip = stations[order], dates[order], precip[order]
+        
+        month_start = dates.astype('datetime64[M]')
+        month = month_start.astype(np.int64) % 12 + 1
+        observed = ~np.isnan(precip)
+        is_wet = self._classify_wet_dry(precip)
+        
+        # Calendar adjacency: one day apart, or Feb 28 -> Mar 1 in a leap year
+        year = dates.astype('datetime64[Y]').astype(np.int64) + 1970
+        is_leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+        is_feb_28 = (month == 2) & ((dates - month_start).astype(np.int64) == 27)
+        gap = np.diff(dates).astype(np.int64)
+        adjacent = (gap == 1) | ((gap == 2) & is_feb_28[:-1] & is_leap[:-1])
+        valid = (adjacent & (stations[1:] == stations[:-1])
+                 & observed[1:] & observed[:-1])
+        
+        group = stations * 12 + month - 1
+        transition = group[1:] * 4 + is_wet[:-1] * 2 + is_wet[1:]
+        counts = np.bincount(transition[valid], minlength=n_stations * 48)
+        counts = counts.reshape(n_stations, 12, 2, 2)
+        
+        # Wet-day moments (two-pass sample variance)
+        wet = is_wet & observed
+        wet_group, amounts = group[wet], precip[wet]
+        n_wet = np.bincount(wet_group, minlength=n_stations * 12)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.bincount(wet_group, weights=amounts, minlength=n_stations * 12) / n_wet
+            deviations = (amounts - mean[wet_group]) ** 2
+            var = np.bincount(wet_group, weights=deviations, minlength=n_stations * 12) / (n_wet - 1)
+        
+        shape = (n_stations, 12)
+        return counts, n_wet.reshape(shape), mean.reshape(shape), var.reshape(shape)
+    
+    def _parameters_from_statistics(
+        self, counts: np.ndarray, n_wet: np.ndarray, mean: np.ndarray, var: np.ndarray,
+        station: Optional[str] = None
+    ) -> Dict[str, List[float]]:
+        """Convert per-month statistics of one station into parameter lists."""
+        params = {'pww': [], 'pwd': [], 'alpha': [], 'beta': []}
         for month in range(1, 13):
-            month_data = df[df['month'] == month].copy()
-            alpha, beta = self._calculate_gamma_params(month_data, month)
-            alpha_list.append(alpha)
-            beta_list.append(beta)
-        
-        return {
-            'pww': pww_list,
-            'pwd': pwd_list,
-            'alpha': alpha_list,
-            'beta': beta_list
-        }
+            label = f"month {month}" if station is None else f"month {month} at station {station}"
+            pww, pwd = self._markov_from_counts(counts[month - 1], label)
+            alpha, beta = self._gamma_from_moments(
+                int(n_wet[month - 1]), mean[month - 1], var[month - 1], label
+            )
+            params['pww'].append(pww)
+            params['pwd'].append(pwd)
+            params['alpha'].append(alpha)
+            params['beta'].append(beta)
+        return params
     
     def _classify_wet_dry(self, precip_series: pd.Series) -> pd.Series:
         """Classify days as wet or dry based on precipitation threshold.
         
         Args:
-            precip_series: Series of precipitation values in mm
+            precip_series: Series (or array) of precipitation values in mm
         
         Returns:
-            Boolean series: True for wet days, False for dry days, NaN for missing
+            Boolean series: True for wet days, False for dry or missing days
         """
         # Days with precipitation >= threshold are wet
         # Days with precipitation < threshold are dry
-        # Missing values (NaN) remain NaN
+        # Missing values (NaN) compare False
         return precip_series >= self.wet_day_threshold
     
     def _calculate_markov_params(self, month_data: pd.DataFrame, month: int) -> Tuple[float, float]:
@@ -135,52 +227,53 @@ class PrecipitationParameterCalculator:
         - NWD = number of dry-to-wet transitions
         - NDD = number of dry-to-dry transitions
         
+        Only transitions between consecutive calendar days are counted.
+        
         Args:
-            month_data: DataFrame for a specific month with 'is_wet' column
-            month: Month number (1-12) for warning messages
+            month_data: DataFrame for a specific month with 'date' and
+                        'is_wet' columns (NaN in 'is_wet' for missing days)
+            month: Month number (1-12)
         
         Returns:
             Tuple of (pww, pwd)
         """
-        # Remove rows with missing wet/dry classification
-        valid_data = month_data.dropna(subset=['is_wet'])
+        observed = month_data['is_wet'].notna().to_numpy()
+        is_wet = month_data['is_wet'].where(observed, False).to_numpy(dtype=bool)
+        dates = pd.to_datetime(month_data['date']).to_numpy().astype('datetime64[D]')
+        
+        # Express the wet/dry flags as precipitation so the shared counter applies
+        precip = np.where(observed, np.where(is_wet, np.inf, -np.inf), np.nan)
+        counts, _, _, _ = self._record_statistics(
+            np.zeros(len(dates), dtype=np.int64), dates, precip, n_stations=1
+        )
+        return self._markov_from_counts(counts[0, month - 1], f"month {month}")
+    
+    def _markov_from_counts(self, counts: np.ndarray, label: str) -> Tuple[float, float]:
+        """Calculate PWW and PWD from a 2x2 [previous, current] transition count matrix.
+        
+        Args:
+            counts: Transition counts indexed by [previous day wet, current day wet]
+            label: Description of the month for warning messages
         
-        if len(valid_data) < 2:
+        Returns:
+            Tuple of (pww, pwd)
+        """
+        ndd, nwd = int(counts[0, 0]), int(counts[0, 1])
+        ndw, nww = int(counts[1, 0]), int(counts[1, 1])
+        
+        if nww + ndw + nwd + ndd == 0:
             warnings.warn(
-                f"Insufficient data for month {month} Markov chain calculation. "
+                f"Insufficient data for {label} Markov chain calculation. "
                 f"Using default values (PWW=0.5, PWD=0.3)."
             )
             return 0.5, 0.3
         
-        # Count transitions
-        is_wet = valid_data['is_wet'].values
-        
-        # Calculate transitions (current day, previous day)
-        nww = 0  # wet -> wet
-        ndw = 0  # wet -> dry
-        nwd = 0  # dry -> wet
-        ndd = 0  # dry -> dry
-        
-        for i in range(1, len(is_wet)):
-            prev_wet = is_wet[i-1]
-            curr_wet = is_wet[i]
-            
-            if prev_wet and curr_wet:
-                nww += 1
-            elif prev_wet and not curr_wet:
-                ndw += 1
-            elif not prev_wet and curr_wet:
-                nwd += 1
-            else:  # not prev_wet and not curr_wet
-                ndd += 1
-        
-        # Calculate probabilities
         # PWW = P(wet | previous wet) = NWW / (NWW + NDW)
         if nww + ndw > 0:
             pww = nww / (nww + ndw)
         else:
             warnings.warn(
-                f"No wet days found in month {month} for PWW calculation. "
+                f"No wet days found in {label} for PWW calculation. "
                 f"Using default value (PWW=0.5)."
             )
             pww = 0.5
@@ -190,7 +283,7 @@ class PrecipitationParameterCalculator:
             pwd = nwd / (nwd + ndd)
         else:
             warnings.warn(
-                f"No dry days found in month {month} for PWD calculation. "
+                f"No dry days found in {label} for PWD calculation. "
                 f"Using default value (PWD=0.3)."
             )
             pwd = 0.3
@@ -218,38 +311,55 @@ class PrecipitationParameterCalculator:
         # Filter out zero or near-zero values (should already be classified as dry, but double-check)
         wet_amounts = wet_days[wet_days >= self.wet_day_threshold].values
         
-        if len(wet_amounts) < self.min_wet_days:
+        if len(wet_amounts) < max(self.min_wet_days, 2):
+            return self._gamma_from_moments(len(wet_amounts), np.nan, np.nan, f"month {month}")
+        
+        return self._gamma_from_moments(
+            len(wet_amounts), np.mean(wet_amounts), np.var(wet_amounts, ddof=1), f"month {month}"
+        )
+    
+    def _gamma_from_moments(self, n_wet: int, mean_precip: float, var_precip: float,
+                            label: str) -> Tuple[float, float]:
+        """Estimate Gamma parameters from wet-day moments (method of moments).
+        
+        Args:
+            n_wet: Number of wet days
+            mean_precip: Mean wet-day precipitation
+            var_precip: Sample variance of wet-day precipitation
+            label: Description of the month for warning messages
+        
+        Returns:
+            Tuple of (alpha, beta), or defaults (1.5, 5.0) if there are too
+            few wet days or the moments are invalid
+        """
+        if n_wet < self.min_wet_days:
             warnings.warn(
-                f"Insufficient wet days in month {month} for Gamma parameter estimation. "
-                f"Found {len(wet_amounts)} wet days, need at least {self.min_wet_days}. "
+                f"Insufficient wet days in {label} for Gamma parameter estimation. "
+                f"Found {n_wet} wet days, need at least {self.min_wet_days}. "
                 f"Using neighboring month values or defaults."
             )
             # Return reasonable default values
             # These are typical values for moderate precipitation climates
             return 1.5, 5.0
         
-        # Method of moments estimation
         # For Gamma distribution: mean = alpha * beta, variance = alpha * beta^2
         # Therefore: alpha = mean^2 / variance, beta = variance / mean
-        mean_precip = np.mean(wet_amounts)
-        var_precip = np.var(wet_amounts, ddof=1)  # Use sample variance
-        
-        if var_precip <= 0 or mean_precip <= 0:
+        if not (var_precip > 0 and mean_precip > 0):
             warnings.warn(
-                f"Invalid statistics for month {month} Gamma fitting "
+                f"Invalid statistics for {label} Gamma fitting "
                 f"(mean={mean_precip:.2f}, var={var_precip:.2f}). "
                 f"Using default values."
             )
             return 1.5, 5.0
         
         # Calculate parameters
-        beta = var_precip / mean_precip
-        alpha = mean_precip / beta
+        beta = float(var_precip / mean_precip)
+        alpha = float(mean_precip / beta)
         
         # Validate parameters are positive
         if alpha <= 0 or beta <= 0:
             warnings.warn(
-                f"Invalid Gamma parameters for month {month} "
+                f"Invalid Gamma parameters for {label} "
                 f"(alpha={alpha:.2f}, beta={beta:.2f}). "
                 f"Using default values."
             )
@@ -0,0 +1,325 @@
+"""
+Regional WGEN parameter generation for Climate Builder.
+
+This module provides the RegionalParameterPipeline class that runs the
+single-station workflow (parse .dly → validate data quality → fit WGEN
+parameters → write wgen_params.csv) for many stations in parallel worker
+processes, and consolidates the results into a single parameter table.
+
+Output Layout:
+    <output_dir>/regional_parameters.csv        - One row per station
+    <output_dir>/stations/<station_id>/data/processed/
+        observed_climate.csv                    - Parsed observations
+        data_quality_report.txt                 - Data quality report
+        wgen_params.csv                         - WGEN parameters
+
+A failure at one station (missing file, unparseable data, invalid
+parameters) is recorded in its row of the consolidated table with status
+'failed' and does not affect the other stations.
+
+Example:
+    >>> pipeline = RegionalParameterPipeline("./region", max_workers=8)
+    >>> results = pipeline.run_directory("./raw_dly", latitudes=station_latitudes)
+    >>> print(pipeline.table_path)
+"""
+
+import contextlib
+import io
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+import pandas as pd
+
+from hydrosim.climate_builder.data_quality import DataQualityValidator
+from hydrosim.climate_builder.dly_parser import DLYParser
+from hydrosim.climate_builder.ghcn_batch import GHCNBatchFetcher
+from hydrosim.climate_builder.parameter_csv import ParameterCSVWriter
+from hydrosim.climate_builder.parameter_generator import WGENParameterGenerator
+from hydrosim.climate_builder.project_structure import ProjectStructure
+
+
+@dataclass
+class StationResult:
+    """Outcome of parameter generation for one station.
+
+    Attributes:
+        station_id: GHCN station identifier
+        latitude: Station latitude in decimal degrees
+        status: 'ok' or 'failed'
+        params: WGEN parameter dictionary (None if failed)
+        wgen_params_path: Path to the station's wgen_params.csv (None if failed)
+        data_start: First date of observations
+        data_end: Last date of observations
+        total_days: Number of parsed days
+        missing_pct: Missing data percentage per variable
+        quality_warnings: Data quality warnings for the station
+        warnings: Warnings issued while fitting parameters
+        error: Error message if failed
+    """
+    station_id: str
+    latitude: Optional[float]
+    status: str
+    params: Optional[Dict[str, Any]] = None
+    wgen_params_path: Optional[Path] = None
+    data_start: Optional[str] = None
+    data_end: Optional[str] = None
+    total_days: int = 0
+    missing_pct: Dict[str, float] = field(default_factory=dict)
+    quality_warnings: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether parameters were generated."""
+        return self.status == 'ok'
+
+    def to_row(self) -> Dict[str, Any]:
+        """Flatten the result into one row of the consolidated table.
+
+        Monthly parameters become columns '<name>_<month>' (e.g. 'pww_1').
+        """
+        row: Dict[str, Any] = {
+            'station_id': self.station_id,
+            'latitude': self.latitude,
+            'status': self.status,
+            'data_start': self.data_start,
+            'data_end': self.data_end,
+            'total_days': self.total_days,
+        }
+        for name in ('precip', 'tmax', 'tmin'):
+            row[f'missing_{name}_pct'] = self.missing_pct.get(name)
+
+        if self.params is not None:
+            for name in ParameterCSVWriter.MONTHLY_PARAMS:
+                for month, value in enumerate(self.params[name], 1):
+                    row[f'{name}_{month}'] = value
+            for name in ParameterCSVWriter.TEMPERATURE_PARAMS:
+                row[name] = self.params[name]
+            for name in ParameterCSVWriter.RADIATION_PARAMS:
+                value = self.params[name]
+                if isinstance(value, (list, tuple)):
+                    for month, monthly in enumerate(value, 1):
+                        row[f'{name}_{month}'] = monthly
+                else:
+                    row[name] = value
+
+        row['wgen_params_path'] = str(self.wgen_params_path) if self.wgen_params_path else None
+        row['n_quality_warnings'] = len(self.quality_warnings)
+        row['error'] = self.error
+        return row
+
+
+def _process_station(station_id: str, dly_path: Optional[Path], latitude: Optional[float],
+                     output_dir: Path, wet_day_threshold: float,
+                     max_reported_issues: Optional[int]) -> StationResult:
+    """Run the single-station workflow; never raises.
+
+    Runs in a worker process, so it only takes picklable arguments and
+    returns a picklable result.
+    """
+    result = StationResult(station_id=station_id, latitude=latitude, status='failed')
+
+    try:
+        if latitude is None:
+            raise ValueError(f"No latitude given for station {station_id}")
+        if dly_path is None or not Path(dly_path).exists():
+            raise FileNotFoundError(f"No .dly file for station {station_id}")
+
+        project = ProjectStructure(output_dir / 'stations' / station_id)
+        project.initialize_structure()
+
+        # Per-station progress output would interleave across workers
+        with contextlib.redirect_stdout(io.StringIO()), \
+                warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+
+            df = DLYParser().parse(Path(dly_path))
+            result.total_days = len(df)
+            result.data_start = str(df['date'].min())
+            result.data_end = str(df['date'].max())
+
+            report = DataQualityValidator.validate_and_save(
+                df, project.get_data_quality_report_path(), station_id=station_id,
+                max_reported_issues=max_reported_issues
+            )
+            result.quality_warnings = list(report.warnings)
+            result.missing_pct = {
+                'precip': report.missing_precip_pct,
+                'tmax': report.missing_tmax_pct,
+                'tmin': report.missing_tmin_pct,
+            }
+
+            observed_path = project.get_observed_climate_path()
+            df.to_csv(observed_path, index=False, date_format='%Y-%m-%d')
+
+            generator = WGENParameterGenerator(
+                observed_data_path=observed_path,
+                latitude=latitude,
+                output_dir=project.root_dir,
+                wet_day_threshold=wet_day_threshold
+            )
+            params = generator.generate_all_parameters()
+            result.wgen_params_path = generator.save_parameters_to_csv(params)
+
+        result.warnings = [str(w.message) for w in caught]
+        result.params = params
+        result.status = 'ok'
+
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+
+    return result
+
+
+class RegionalParameterPipeline:
+    """Generates WGEN parameters for many stations in parallel.
+
+    Attributes:
+        output_dir: Root directory for all outputs
+        wet_day_threshold: Precipitation threshold for wet day classification (mm)
+        max_workers: Number of worker processes (1 runs in the current process)
+        max_reported_issues: Cap on unrealistic-value days listed per station
+                             data quality report
+        table_path: Path of the consolidated parameter table
+
+    Example:
+        >>> pipeline = RegionalParameterPipeline("./region")
+        >>> results = pipeline.run({"USW00024233": 47.45, "USW00024229": 45.59},
+        ...                        fetcher=GHCNBatchFetcher("./ghcn_cache"))
+    """
+
+    TABLE_FILENAME = "regional_parameters.csv"
+
+    def __init__(self, output_dir: Path | str, wet_day_threshold: float = 0.1,
+                 max_workers: Optional[int] = None,
+                 max_reported_issues: Optional[int] = 100):
+        """Initialize regional pipeline.
+
+        Args:
+            output_dir: Root directory for outputs (created if missing)
+            wet_day_threshold: Precipitation threshold for wet day classification in mm
+            max_workers: Number of worker processes (default: CPU count)
+            max_reported_issues: Maximum number of unrealistic-value days listed
+                                 in each station's quality report (None for all)
+
+        Raises:
+            ValueError: If max_workers is less than 1
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.wet_day_threshold = wet_day_threshold
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_reported_issues = max_reported_issues
+        self.table_path = self.output_dir / self.TABLE_FILENAME
+
+    def run(self, stations: Mapping[str, float],
+            dly_dir: Optional[Path | str] = None,
+            fetcher: Optional[GHCNBatchFetcher] = None) -> Dict[str, StationResult]:
+        """Generate parameters for a list of stations.
+
+        .dly files are looked up as <dly_dir>/<station_id>.dly. Stations
+        without a local file are downloaded with the fetcher (into
+        <output_dir>/raw) if one is given.
+
+        Args:
+            stations: Mapping of station ID to latitude (decimal degrees)
+            dly_dir: Directory containing <station_id>.dly files
+            fetcher: Optional batch fetcher for stations without a local file
+
+        Returns:
+            Dictionary mapping station ID to StationResult, in input order
+        """
+        dly_paths: Dict[str, Optional[Path]] = {}
+        for station_id in stations:
+            path = Path(dly_dir) / f"{station_id}.dly" if dly_dir is not None else None
+            dly_paths[station_id] = path if path is not None and path.exists() else None
+
+        missing = [sid for sid, path in dly_paths.items() if path is None]
+        if missing and fetcher is not None:
+            downloads = fetcher.fetch(missing, dest_dir=self.output_dir / 'raw')
+            for station_id, download in downloads.items():
+                if download.ok:
+                    dly_paths[station_id] = download.path
+
+        print(f"Generating WGEN parameters for {len(stations)} stations "
+              f"({self.max_workers} worker(s))...")
+
+        args = [
+            (sid, dly_paths[sid], stations[sid], self.output_dir,
+             self.wet_day_threshold, self.max_reported_issues)
+            for sid in stations
+        ]
+        results = self._map(args)
+
+        for result in results:
+            if result.ok:
+                print(f"  {result.station_id}: ok ({result.total_days} days)")
+            else:
+                print(f"  {result.station_id}: FAILED - {result.error}")
+
+        self.write_table(results)
+        failed = sum(1 for r in results if not r.ok)
+        print(f"Parameters generated for {len(results) - failed}/{len(results)} stations")
+        print(f"Consolidated table saved to: {self.table_path}")
+
+        return {r.station_id: r for r in results}
+
+    def run_directory(self, dly_dir: Path | str,
+                      latitudes: Union[Mapping[str, float], float]) -> Dict[str, StationResult]:
+        """Generate parameters for every .dly file in a directory.
+
+        Args:
+            dly_dir: Directory containing <station_id>.dly files
+            latitudes: Mapping of station ID to latitude, or a single latitude
+                       used for all stations. Stations missing from the
+                       mapping are reported as failed.
+
+        Returns:
+            Dictionary mapping station ID to StationResult
+        """
+        station_ids = sorted(path.stem for path in Path(dly_dir).glob('*.dly'))
+        if isinstance(latitudes, Mapping):
+            stations = {sid: latitudes.get(sid) for sid in station_ids}
+        else:
+            stations = {sid: float(latitudes) for sid in station_ids}
+        return self.run(stations, dly_dir=dly_dir)
+
+    def _map(self, args: List[tuple]) -> List[StationResult]:
+        """Run _process_station over all stations, isolating worker crashes."""
+        if self.max_workers == 1 or len(args) <= 1:
+            return [_process_station(*a) for a in args]
+
+        results = []
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(args))) as pool:
+            futures = [pool.submit(_process_station, *a) for a in args]
+            for a, future in zip(args, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    # Worker process died (e.g. out of memory)
+                    results.append(StationResult(
+                        station_id=a[0], latitude=a[2], status='failed',
+                        error=f"{type(e).__name__}: {e}"
+                    ))
+        return results
+
+    def write_table(self, results: List[StationResult]) -> Path:
+        """Write the consolidated parameter table.
+
+        Args:
+            results: Station results (successful and failed)
+
+        Returns:
+            Path to the written CSV file
+        """
+        table = pd.DataFrame([result.to_row() for result in results])
+        table.to_csv(self.table_path, index=False)
+        return self.table_path
@@ -10,7 +10,8 @@ import warnings
 from typing import Dict, Tuple, Optional
 import pandas as pd
 import numpy as np
-from scipy.optimize import curve_fit
+
+from hydrosim.climate_builder.fourier import fit_fourier_series
 
 
 class SolarParameterCalculator:
@@ -390,37 +391,6 @@ class SolarParameterCalculator:
             rmd_list
         )
         
-        # Define Fourier model
-        def fourier_model(period, mean, amplitude, phase):
-            """Fourier series model with mean, amplitude, and phase."""
-            return mean + amplitude * np.cos(2 * np.pi * (period - phase) / self.num_periods)
+        _, amplitude, _ = fit_fourier_series(period_values)
         
-        try:
-            # Initial guess
-            mean_guess = np.mean(period_values)
-            amplitude_guess = (np.max(period_values) - np.min(period_values)) / 2
-            phase_guess = np.argmax(period_values) + 1
-            
-            # Fit the model
-            popt, _ = curve_fit(
-                fourier_model,
-                periods,
-                period_values,
-                p0=[mean_guess, amplitude_guess, phase_guess],
-                maxfev=10000
-            )
-            
-            mean, amplitude, phase = popt
-            
-            # Ensure amplitude is positive
-            amplitude = abs(amplitude)
-            
-        except Exception as e:
-            warnings.warn(
-                f"Fourier series fitting failed for solar radiation: {e}. "
-                f"Using simple amplitude estimate."
-            )
-            # Fallback to simple estimate
-            amplitude = (np.max(period_values) - np.min(period_values)) / 2
-        
-        return amplitude
+        return float(amplitude)
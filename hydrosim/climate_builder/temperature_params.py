@@ -9,7 +9,8 @@ import warnings
 from typing import Dict, Tuple
 import pandas as pd
 import numpy as np
-from scipy.optimize import curve_fit
+
+from hydrosim.climate_builder.fourier import fit_fourier_series
 
 
 class TemperatureParameterCalculator:
@@ -94,13 +95,14 @@ class TemperatureParameterCalculator:
         tmax_wet_stats = self._calculate_period_stats(df, 'tmax_c', wet_status=True)
         tmin_stats = self._calculate_period_stats(df, 'tmin_c', wet_status=None)
         
-        # Fit Fourier series to means
-        txmd, atx_dry = self._fit_fourier_series(tmax_dry_stats['means'])
-        txmw, atx_wet = self._fit_fourier_series(tmax_wet_stats['means'])
-        tn, atn = self._fit_fourier_series(tmin_stats['means'])
+        # Fit Fourier series to means (all three series in one solve)
+        means, amplitudes = self._fit_fourier_series(np.vstack([
+            tmax_dry_stats['means'], tmax_wet_stats['means'], tmin_stats['means']
+        ]))
+        txmd, txmw, tn = (float(m) for m in means)
         
         # Use dry day amplitude for atx (as per wgenpar.f)
-        atx = atx_dry
+        atx, atn = float(amplitudes[0]), float(amplitudes[2])
         
         # Calculate coefficient of variation parameters
         cvtx, acvtx = self._calculate_cv_params(tmax_dry_stats)
@@ -288,50 +290,17 @@ class TemperatureParameterCalculator:
         """Fit 13-period Fourier series to period means.
         
         Fits the model: T = mean + amplitude * cos(2π(period - peak) / 13)
+        by linear least squares (see fit_fourier_series).
         
         Args:
-            period_means: Array of 13 mean values (one per period)
+            period_means: Array of 13 mean values (one per period), or an
+                          array of shape (K, 13) to fit K series at once
         
         Returns:
-            Tuple of (mean, amplitude) coefficients
+            Tuple of (mean, amplitude) coefficients (arrays of length K for
+            a 2-D input)
         """
-        # Period indices (1-13)
-        periods = np.arange(1, self.num_periods + 1)
-        
-        # Define Fourier model
-        def fourier_model(period, mean, amplitude, phase):
-            """Fourier series model with mean, amplitude, and phase."""
-            return mean + amplitude * np.cos(2 * np.pi * (period - phase) / self.num_periods)
-        
-        try:
-            # Initial guess: mean = average, amplitude = half range, phase = period of max
-            mean_guess = np.mean(period_means)
-            amplitude_guess = (np.max(period_means) - np.min(period_means)) / 2
-            phase_guess = np.argmax(period_means) + 1  # Period of maximum
-            
-            # Fit the model
-            popt, _ = curve_fit(
-                fourier_model,
-                periods,
-                period_means,
-                p0=[mean_guess, amplitude_guess, phase_guess],
-                maxfev=10000
-            )
-            
-            mean, amplitude, phase = popt
-            
-            # Ensure amplitude is positive
-            amplitude = abs(amplitude)
-            
-        except Exception as e:
-            warnings.warn(
-                f"Fourier series fitting failed: {e}. "
-                f"Using simple mean and amplitude estimates."
-            )
-            # Fallback to simple estimates
-            mean = np.mean(period_means)
-            amplitude = (np.max(period_means) - np.min(period_means)) / 2
-        
+        mean, amplitude, _ = fit_fourier_series(period_means)
         return mean, amplitude
     
     def _calculate_cv_params(self, stats: Dict[str, np.ndarray]) -> Tuple[float, float]:
@@ -49,9 +49,12 @@ used interchangeably for historical analysis or stochastic planning.
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Tuple, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Optional
+import numpy as np
 import pandas as pd
 import logging
+from hydrosim.timeseries_io import load_npy_table
 from hydrosim.wgen import WGENParams, WGENState, wgen_step
 from hydrosim.exceptions import ClimateDataError
 
@@ -76,7 +79,10 @@ class ClimateSource(ABC):
 
 
 class TimeSeriesClimateSource(ClimateSource):
-    """Climate source that reads from time series data (CSV).
+    """Climate source that reads from time series data (CSV or binary .npy).
+    
+    Values are held as one float array per variable with a date index, so a
+    source created from a memory-mapped binary table never copies the data.
     
     Attributes:
         data: DataFrame with columns for date, precip, t_max, t_min, solar
@@ -86,6 +92,7 @@ class TimeSeriesClimateSource(ClimateSource):
         solar_col: Name of solar radiation column
         start_date: First date in the time series
         end_date: Last date in the time series
+        source_path: Binary table the data is mapped from (None for in-memory data)
     """
     
     def __init__(self, 
@@ -103,11 +110,11 @@ class TimeSeriesClimateSource(ClimateSource):
             tmin_col: Name of minimum temperature column (°C)
             solar_col: Name of solar radiation column (MJ/m²/day)
         """
-        self.data = data
         self.precip_col = precip_col
         self.tmax_col = tmax_col
         self.tmin_col = tmin_col
         self.solar_col = solar_col
+        self.source_path: Optional[str] = None
         
         # Validate required columns exist
         required_cols = [precip_col, tmax_col, tmin_col, solar_col]
@@ -115,14 +122,34 @@ class TimeSeriesClimateSource(ClimateSource):
         if missing_cols:
             raise ValueError(f"Missing required columns: {missing_cols}")
         
+        self._frame = data
+        self._set_arrays(data.index, [data[col].to_numpy(dtype=float) for col in required_cols])
+    
+    def _set_arrays(self, index: pd.Index, values: List[np.ndarray]) -> None:
+        """Store the date index and per-variable arrays."""
+        self._index = index
+        self._precip, self._tmax, self._tmin, self._solar = values
+        
         # Store date range for error messages
-        if len(data) > 0:
-            self.start_date = data.index.min()
-            self.end_date = data.index.max()
+        if len(index) > 0:
+            self.start_date = index.min()
+            self.end_date = index.max()
         else:
             self.start_date = None
             self.end_date = None
     
+    @property
+    def data(self) -> pd.DataFrame:
+        """Climate data as a DataFrame indexed by date."""
+        if self._frame is None:
+            self._frame = pd.DataFrame({
+                self.precip_col: self._precip,
+                self.tmax_col: self._tmax,
+                self.tmin_col: self._tmin,
+                self.solar_col: self._solar,
+            }, index=self._index)
+        return self._frame
+    
     @classmethod
     def from_csv(cls, 
                  filepath: str,
@@ -148,6 +175,72 @@ class TimeSeriesClimateSource(ClimateSource):
         data = data.set_index(date_col)
         return cls(data, precip_col, tmax_col, tmin_col, solar_col)
     
+    @classmethod
+    def from_npy(cls,
+                 filepath: str,
+                 precip_col: str = 'precip',
+                 tmax_col: str = 't_max',
+                 tmin_col: str = 't_min',
+                 solar_col: str = 'solar') -> 'TimeSeriesClimateSource':
+        """Create climate source from a memory-mapped binary table.
+        
+        The table is created with hydrosim.timeseries_io.convert_csv_to_npy()
+        and must include dates. Columns are used as read-only views of the
+        mapping. When the source is pickled (e.g. sent to a worker process)
+        only the file path is stored and the table is mapped again on load.
+        
+        Args:
+            filepath: Path to .npy table
+            precip_col: Name of precipitation column
+            tmax_col: Name of maximum temperature column
+            tmin_col: Name of minimum temperature column
+            solar_col: Name of solar radiation column
+            
+        Returns:
+            TimeSeriesClimateSource instance
+            
+        Raises:
+            ValueError: If the table has no dates or lacks a required column
+        """
+        source = cls.__new__(cls)
+        source.precip_col = precip_col
+        source.tmax_col = tmax_col
+        source.tmin_col = tmin_col
+        source.solar_col = solar_col
+        source.source_path = str(Path(filepath).resolve())
+        source._map_table()
+        return source
+    
+    def _map_table(self) -> None:
+        """Map the binary table at source_path and bind the variable arrays."""
+        values, columns, dates = load_npy_table(self.source_path)
+        if dates is None:
+            raise ValueError(f"Climate table {self.source_path} has no dates")
+        
+        required_cols = [self.precip_col, self.tmax_col, self.tmin_col, self.solar_col]
+        missing_cols = [col for col in required_cols if col not in columns]
+        if missing_cols:
+            raise ValueError(f"Missing required columns: {missing_cols}")
+        
+        self._frame = None
+        self._set_arrays(
+            pd.DatetimeIndex(dates),
+            [values[:, columns.index(col)] for col in required_cols]
+        )
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        if self.source_path is not None:
+            # Mapped data is re-opened from the file instead of being copied
+            for key in ('_frame', '_index', '_precip', '_tmax', '_tmin', '_solar'):
+                state[key] = None
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if self.source_path is not None:
+            self._map_table()
+    
     def validate_date_range(self, start_date: datetime, end_date: datetime) -> None:
         """
         Validate that climate data is available for the entire simulation period.
@@ -193,12 +286,12 @@ class TimeSeriesClimateSource(ClimateSource):
             ClimateDataError: If date is not in the time series
         """
         try:
-            row = self.data.loc[date]
+            i = self._index.get_loc(date)
             return (
-                float(row[self.precip_col]),
-                float(row[self.tmax_col]),
-                float(row[self.tmin_col]),
-                float(row[self.solar_col])
+                float(self._precip[i]),
+                float(self._tmax[i]),
+                float(self._tmin[i]),
+                float(self._solar[i])
             )
         except KeyError:
             # Provide helpful error message with available date range
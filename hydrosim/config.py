@@ -45,8 +45,8 @@ with all specified parameters and strategies.
 from typing import Dict, List, Any, Optional
 import numpy as np
 import yaml
-import pandas as pd
 import logging
+import math
 from pathlib import Path
 from hydrosim.nodes import Node, StorageNode, JunctionNode, SourceNode, DemandNode
 from hydrosim.links import Link
@@ -61,6 +61,8 @@ from hydrosim.controls import FractionalControl, AbsoluteControl, SwitchControl
 from hydrosim.hydraulics import WeirModel, PipeModel
 from hydrosim.wgen import WGENParams
 from hydrosim.exceptions import EAVInterpolationError
+from hydrosim.network_cache import NetworkCache
+from hydrosim.timeseries_io import TimeSeriesFileRegistry, npy_table_files
 from datetime import datetime
 
 # Configure logger
@@ -503,12 +505,16 @@ class NetworkGraph:
 class YAMLParser:
     """Parser for YAML configuration files."""
     
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, cache_dir: Optional[str] = None):
         """
         Initialize YAML parser.
         
         Args:
             config_path: Path to YAML configuration file
+            cache_dir: Optional directory for the parsed-network cache. When
+                       given and a valid entry exists for this configuration,
+                       parse() returns the cached network without reading the
+                       YAML or any referenced CSV file.
             
         Raises:
             FileNotFoundError: If config file doesn't exist
@@ -520,25 +526,92 @@ class YAMLParser:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
+        self.cache = NetworkCache(cache_dir) if cache_dir is not None else None
+        self.cache_key: Optional[str] = None
+        self.cache_hit = False
+        self._referenced_files: List[Path] = []
+        self._timeseries_files = TimeSeriesFileRegistry()
+        self._config: Optional[Dict[str, Any]] = None
+        self._cache_checked = False
+        
+        if self.cache is not None:
+            self.cache_key = self.cache.key_for(self.config_path)
+            if self.cache.is_valid(self.cache_key):
+                # Warm cache: YAML is only loaded if config is accessed
+                self._cache_checked = True
+                return
+        
+        self._load_config()
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Parsed YAML configuration dictionary (loaded on first access)."""
+        if self._config is None:
+            self._load_config()
+        return self._config
+    
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        self._config = value
+    
+    def _load_config(self) -> None:
+        """
+        Load and parse the YAML configuration file.
+        
+        Raises:
+            yaml.YAMLError: If YAML syntax is invalid
+            ValueError: If the file is empty
+        """
         try:
             with open(self.config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
+                self._config = yaml.safe_load(f)
         except yaml.YAMLError as e:
-            raise yaml.YAMLError(f"Invalid YAML syntax in {config_path}: {e}")
+            raise yaml.YAMLError(f"Invalid YAML syntax in {self.config_path}: {e}")
         
-        if self.config is None:
-            raise ValueError(f"Empty configuration file: {config_path}")
+        if self._config is None:
+            raise ValueError(f"Empty configuration file: {self.config_path}")
     
     def parse(self) -> tuple[NetworkGraph, ClimateSource, SiteConfig]:
         """
         Parse the complete configuration and construct network.
         
+        When a cache directory was given, a valid cached network is returned
+        directly (cache_hit is set to True); otherwise the configuration is
+        parsed and validated and the result is stored in the cache.
+        
         Returns:
             Tuple of (NetworkGraph, ClimateSource, SiteConfig)
             
         Raises:
             ValueError: If configuration is invalid
         """
+        cache_valid = self.cache is not None and (
+            self._cache_checked or self.cache.is_valid(self.cache_key)
+        )
+        self._cache_checked = False
+        if cache_valid:
+            cached = self.cache.load(self.cache_key)
+            if cached is not None:
+                self.cache_hit = True
+                logger.info(f"Loaded parsed network for {self.config_path} from cache")
+                return cached
+        
+        self.cache_hit = False
+        self._referenced_files = []
+        self._timeseries_files = TimeSeriesFileRegistry()
+        try:
+            result = self._parse_config()
+        finally:
+            # Strategies keep views of the columns they use; drop the registry's references
+            self._timeseries_files.clear()
+        
+        if self.cache is not None:
+            self.cache.store(self.cache_key, result, self._referenced_files)
+        
+        return result
+    
+    def _parse_config(self) -> tuple[NetworkGraph, ClimateSource, SiteConfig]:
+        """Parse and validate the configuration without using the cache."""
         # Validate configuration structure
         self._validate_configuration()
         
@@ -567,6 +640,15 @@ class YAMLParser:
         if not nodes_config:
             raise ValueError("Configuration must include 'nodes' section")
         
+        # Announce time series columns so each file is read once
+        for node_params in nodes_config.values():
+            if (isinstance(node_params, dict) and node_params.get('strategy') == 'timeseries'
+                    and node_params.get('filepath')):
+                self._timeseries_files.request(
+                    self._resolve_path(node_params['filepath']),
+                    node_params.get('column', 'inflow')
+                )
+        
         for node_id, node_params in nodes_config.items():
             node = self._parse_node(node_id, node_params)
             network.add_node(node)
@@ -587,6 +669,19 @@ class YAMLParser:
         
         return network, climate_source, site_config
     
+    def _add_referenced_file(self, filepath: Path) -> None:
+        """Record an input file (and binary table sidecars) for cache validation."""
+        if filepath.suffix == '.npy':
+            self._referenced_files.extend(npy_table_files(filepath))
+        else:
+            self._referenced_files.append(filepath)
+    
+    def _resolve_path(self, filepath: str) -> Path:
+        """Resolve a path from the configuration relative to the config file."""
+        if not Path(filepath).is_absolute():
+            return self.config_dir / filepath
+        return Path(filepath)
+    
     def _validate_configuration(self) -> None:
         """
         Validate configuration structure and parameters.
@@ -675,6 +770,9 @@ class YAMLParser:
         """
         Parse time series climate source configuration.
         
+        The filepath may be a CSV file or a memory-mapped binary table (.npy)
+        created with convert_csv_to_npy().
+        
         Args:
             climate_config: Climate configuration dictionary
             
@@ -689,6 +787,8 @@ class YAMLParser:
         if not Path(filepath).is_absolute():
             filepath = self.config_dir / filepath
         
+        self._add_referenced_file(Path(filepath))
+        
         # Get column names (with defaults)
         date_col = climate_config.get('date_col', 'date')
         precip_col = climate_config.get('precip_col', 'precip')
@@ -697,6 +797,14 @@ class YAMLParser:
         solar_col = climate_config.get('solar_col', 'solar')
         
         try:
+            if Path(filepath).suffix == '.npy':
+                return TimeSeriesClimateSource.from_npy(
+                    str(filepath),
+                    precip_col=precip_col,
+                    tmax_col=tmax_col,
+                    tmin_col=tmin_col,
+                    solar_col=solar_col
+                )
             return TimeSeriesClimateSource.from_csv(
                 str(filepath),
                 date_col=date_col,
@@ -799,6 +907,8 @@ class YAMLParser:
             if not Path(csv_path).is_absolute():
                 csv_path = self.config_dir / csv_path
             
+            self._referenced_files.append(Path(csv_path))
+            
             # Parse CSV file
             from hydrosim.wgen_params import CSVWGENParamsParser
             params = CSVWGENParamsParser.parse(str(csv_path))
@@ -919,16 +1029,15 @@ class YAMLParser:
             raise ValueError(f"TimeSeriesStrategy for {node_id} requires 'filepath'")
         
         # Resolve relative paths
-        if not Path(filepath).is_absolute():
-            filepath = self.config_dir / filepath
+        filepath = self._resolve_path(filepath)
         
         column = node_params.get('column', 'inflow')
+        self._add_referenced_file(filepath)
         
         try:
-            data = pd.read_csv(filepath)
-            if column not in data.columns:
-                raise ValueError(f"Column '{column}' not found in {filepath}")
-            return TimeSeriesStrategy(data, column)
+            values = self._timeseries_files.get_column(filepath, column)
+            source_path = str(filepath.resolve()) if filepath.suffix == '.npy' else None
+            return TimeSeriesStrategy(values, column, source_path=source_path)
         except Exception as e:
             raise ValueError(f"Failed to load time series for {node_id} from {filepath}: {e}")
     
@@ -1265,7 +1374,12 @@ class YAMLParser:
             'solver_type': 'linear_programming',  # Default solver
             'perfect_foresight': True,  # Assume perfect foresight for V1
             'carryover_cost': -1.0,  # Cost for storing water (hedging penalty)
-            'rolling_horizon': True  # Use rolling horizon approach
+            'rolling_horizon': True,  # Use rolling horizon approach
+            'shadow_prices': False,  # Record node and link duals in results
+            'time_limit': None,  # Solve time budget per timestep (seconds)
+            'horizon_schedule': None,  # (period_days, periods) blocks of the horizon
+            'reoptimize_every': 1,  # Re-solve the horizon at least every k days
+            'reoptimize_tolerance': 1e-6  # Relative deviation from the plan that forces a re-solve
         }
         
         # Parse lookahead_days
@@ -1309,4 +1423,71 @@ class YAMLParser:
                 raise ValueError("rolling_horizon must be a boolean (true/false)")
             result['rolling_horizon'] = rolling_horizon
         
+        # Parse shadow_prices
+        if 'shadow_prices' in opt_config:
+            shadow_prices = opt_config['shadow_prices']
+            if not isinstance(shadow_prices, bool):
+                raise ValueError("shadow_prices must be a boolean (true/false)")
+            result['shadow_prices'] = shadow_prices
+        
+        # Parse time_limit (booleans and strings are not numbers here)
+        if 'time_limit' in opt_config:
+            time_limit = opt_config['time_limit']
+            if isinstance(time_limit, bool) or not isinstance(time_limit, (int, float)) or time_limit <= 0:
+                raise ValueError(f"Invalid time_limit: {time_limit}. Must be a positive number of seconds")
+            result['time_limit'] = float(time_limit)
+        
+        # Parse horizon_schedule
+        if 'horizon_schedule' in opt_config:
+            schedule = opt_config['horizon_schedule']
+            if not isinstance(schedule, list) or not schedule:
+                raise ValueError("horizon_schedule must be a non-empty list of {period_days, periods} entries")
+            blocks = []
+            for entry in schedule:
+                if not isinstance(entry, dict) or 'period_days' not in entry or 'periods' not in entry:
+                    raise ValueError(f"Invalid horizon_schedule entry: {entry}. Must have 'period_days' and 'periods'")
+                # Whole numbers only, as in LookaheadSolver (7.0 is fine, 7.9 is not)
+                values = (entry['period_days'], entry['periods'])
+                if any(isinstance(value, bool) or not isinstance(value, (int, float))
+                       or not math.isfinite(value) or value != int(value) or value < 1
+                       for value in values):
+                    raise ValueError(f"Invalid horizon_schedule entry: {entry}. Values must be positive integers")
+                blocks.append((int(values[0]), int(values[1])))
+            if blocks[0][0] != 1:
+                raise ValueError("horizon_schedule must start with one-day periods (period_days: 1)")
+            result['horizon_schedule'] = blocks
+            result['lookahead_days'] = sum(days * n for days, n in blocks)
+        
+        # Parse reoptimize_every (whole numbers only)
+        if 'reoptimize_every' in opt_config:
+            reoptimize_every = opt_config['reoptimize_every']
+            if isinstance(reoptimize_every, bool) or not isinstance(reoptimize_every, (int, float)) \
+                    or not math.isfinite(reoptimize_every) or reoptimize_every != int(reoptimize_every) \
+                    or reoptimize_every < 1:
+                raise ValueError(f"Invalid reoptimize_every: {reoptimize_every}. Must be a positive integer")
+            result['reoptimize_every'] = int(reoptimize_every)
+            
+            # Plans are only kept for the leading one-day periods after today
+            if result['horizon_schedule'] is not None:
+                daily_periods = 0
+                for period_days, periods in result['horizon_schedule']:
+                    if period_days != 1:
+                        break
+                    daily_periods += periods
+            else:
+                daily_periods = result['lookahead_days']
+            if result['reoptimize_every'] > 1 and daily_periods < 2:
+                raise ValueError(
+                    "reoptimize_every > 1 requires a look-ahead horizon with at least two "
+                    "one-day periods (lookahead_days > 1)"
+                )
+        
+        # Parse reoptimize_tolerance
+        if 'reoptimize_tolerance' in opt_config:
+            reoptimize_tolerance = opt_config['reoptimize_tolerance']
+            if isinstance(reoptimize_tolerance, bool) or not isinstance(reoptimize_tolerance, (int, float)) \
+                    or reoptimize_tolerance < 0:
+                raise ValueError(f"Invalid reoptimize_tolerance: {reoptimize_tolerance}. Must be a non-negative number")
+            result['reoptimize_tolerance'] = float(reoptimize_tolerance)
+        
         return result
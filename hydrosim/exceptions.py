@@ -67,6 +67,26 @@ class InfeasibleNetworkError(HydroSimError):
         super().__init__(full_message)
 
 
+class SolverTimeLimitError(HydroSimError):
+    """Raised when the LP solver does not finish within its time limit."""
+    
+    def __init__(self, time_limit: float, message: str = ""):
+        """
+        Initialize solver time limit error.
+        
+        Args:
+            time_limit: Time limit that was exceeded (seconds)
+            message: Status message from the solver
+        """
+        self.time_limit = time_limit
+        
+        full_message = f"Network flow optimization exceeded its time limit of {time_limit:.3f} s"
+        if message:
+            full_message += f": {message}"
+        
+        super().__init__(full_message)
+
+
 class ClimateDataError(HydroSimError):
     """Raised when climate data is missing or unavailable."""
     
@@ -0,0 +1,95 @@
+"""
+Rolling future data for look-ahead optimization.
+
+The look-ahead solver needs, on every timestep, the next few days of inflow
+and demand for each source and demand node. RollingFutureData holds one
+NumPy array per entity for the whole run and a cursor at the current
+timestep. The simulation engine advances the cursor once per step, and
+horizon windows are returned as slices of the stored arrays (views, no
+copies), so memory stays at one float per entity and day and each advance
+is O(1).
+
+Example:
+    >>> future = RollingFutureData({'river': [10.0, 12.0, 8.0, 9.0]})
+    >>> future.window('river', 2)
+    array([10., 12.])
+    >>> future.advance()
+    >>> future.window('river', 2)
+    array([12.,  8.])
+"""
+
+import logging
+from typing import Dict, Iterator, Optional, Sequence
+
+import numpy as np
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+class RollingFutureData:
+    """
+    Per-entity future series with a cursor at the current timestep.
+
+    Attributes:
+        cursor: Index of the current timestep in every series
+    """
+
+    def __init__(self, series: Optional[Dict[str, Sequence[float]]] = None):
+        """
+        Initialize from a mapping of entity ID to future values.
+
+        Args:
+            series: Dict mapping entity ID (node_id) to values for every
+                    timestep, starting at the current one
+        """
+        self._arrays: Dict[str, np.ndarray] = {
+            entity_id: np.ascontiguousarray(values, dtype=np.float64)
+            for entity_id, values in (series or {}).items()
+        }
+        self.cursor = 0
+
+    def advance(self, steps: int = 1) -> None:
+        """
+        Move the cursor forward.
+
+        Args:
+            steps: Number of timesteps to advance
+
+        Raises:
+            ValueError: If steps is negative
+        """
+        if steps < 0:
+            raise ValueError(f"steps must be non-negative, got {steps}")
+        self.cursor += steps
+
+    def window(self, entity_id: str, length: int) -> Optional[np.ndarray]:
+        """
+        Get the next length values of an entity, starting at the cursor.
+
+        The window is a read-only view of the stored array. It is shorter
+        than length (possibly empty) when the series ends within the window.
+
+        Args:
+            entity_id: Entity (node) ID
+            length: Number of timesteps in the window
+
+        Returns:
+            Array view of up to length values, or None if the entity has no
+            future data
+        """
+        values = self._arrays.get(entity_id)
+        if values is None:
+            return None
+        window = values[self.cursor:self.cursor + length]
+        window.flags.writeable = False
+        return window
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._arrays
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._arrays)
+
+    def __len__(self) -> int:
+        return len(self._arrays)
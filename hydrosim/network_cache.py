@@ -0,0 +1,195 @@
+"""
+On-disk cache of parsed network configurations.
+
+Parsing a configuration reads the YAML file, reads every referenced CSV file
+and rebuilds all nodes, links and EAV tables. When the same configuration is
+parsed repeatedly (for example in ensemble runs) this work is identical each
+time. The NetworkCache stores the fully constructed, validated parse result
+in a binary file keyed by a content hash of the YAML file, so a warm parse
+only has to hash files and load one binary payload.
+
+Cache layout (one pair of files per configuration):
+    <cache_dir>/<key>.json: Manifest with the content hash of every file the
+                            configuration references
+    <cache_dir>/<key>.pkl:  Pickled (NetworkGraph, ClimateSource, SiteConfig)
+
+An entry is only used when every referenced file still has the recorded
+content hash, so editing a time series invalidates the cached network.
+
+Note:
+    Payloads are stored with pickle. Only point the cache at directories
+    you control.
+
+Example:
+    >>> parser = hs.YAMLParser('network.yaml', cache_dir='.hydrosim_cache')
+    >>> network, climate_source, site_config = parser.parse()
+    >>> parser.cache_hit
+    True
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Bump when the structure of cached objects changes incompatibly
+CACHE_FORMAT_VERSION = 1
+
+
+def file_digest(path: Path) -> str:
+    """
+    Compute the SHA-256 content hash of a file.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest string
+    """
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+class NetworkCache:
+    """
+    Content-hash-keyed on-disk cache of parsed network configurations.
+
+    Attributes:
+        cache_dir: Directory holding manifests and payloads
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize network cache.
+
+        Args:
+            cache_dir: Directory for cache files (created if missing)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def key_for(self, config_path: Path) -> str:
+        """
+        Compute the cache key for a configuration file.
+
+        The key covers the YAML content, the directory relative paths are
+        resolved against, the hydrosim version and the cache format version.
+
+        Args:
+            config_path: Path to YAML configuration file
+
+        Returns:
+            Hex digest cache key
+        """
+        import hydrosim
+
+        sha = hashlib.sha256()
+        sha.update(f"{CACHE_FORMAT_VERSION}|{hydrosim.__version__}|".encode())
+        sha.update(str(Path(config_path).resolve().parent).encode())
+        sha.update(b'|')
+        sha.update(Path(config_path).read_bytes())
+        return sha.hexdigest()
+
+    def _manifest_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _payload_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def is_valid(self, key: str) -> bool:
+        """
+        Check whether a cache entry exists and its referenced files are unchanged.
+
+        Args:
+            key: Cache key from key_for()
+
+        Returns:
+            True if the entry can be loaded
+        """
+        manifest_path = self._manifest_path(key)
+        if not manifest_path.exists() or not self._payload_path(key).exists():
+            return False
+
+        try:
+            with open(manifest_path, 'r') as f:
+                manifest = json.load(f)
+            for path, digest in manifest['files'].items():
+                if not Path(path).exists() or file_digest(Path(path)) != digest:
+                    logger.info(f"Network cache entry {key[:12]} is stale: {path} changed")
+                    return False
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable network cache manifest {manifest_path}: {e}")
+            return False
+
+        return True
+
+    def load(self, key: str) -> Optional[Any]:
+        """
+        Load a cached parse result.
+
+        Callers should check is_valid() first; load() does not re-hash the
+        referenced files.
+
+        Args:
+            key: Cache key from key_for()
+
+        Returns:
+            Cached (NetworkGraph, ClimateSource, SiteConfig), or None if the
+            payload is missing or cannot be read
+        """
+        try:
+            with open(self._payload_path(key), 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logger.warning(f"Ignoring unreadable network cache entry {key[:12]}: {e}")
+            return None
+
+    def store(self, key: str, result: Any, referenced_files: Iterable[Path]) -> None:
+        """
+        Store a parse result together with its referenced file hashes.
+
+        Files are written to temporary names and moved into place, so
+        concurrent readers never see a partial entry.
+
+        Args:
+            key: Cache key from key_for()
+            result: Parse result to cache
+            referenced_files: Files the configuration depends on
+        """
+        manifest = {
+            'format_version': CACHE_FORMAT_VERSION,
+            'files': {
+                str(Path(path).resolve()): file_digest(Path(path))
+                for path in referenced_files
+            }
+        }
+
+        payload_path = self._payload_path(key)
+        manifest_path = self._manifest_path(key)
+        tmp_suffix = f".{os.getpid()}.tmp"
+
+        payload_tmp = payload_path.with_name(payload_path.name + tmp_suffix)
+        with open(payload_tmp, 'wb') as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(payload_tmp, payload_path)
+
+        manifest_tmp = manifest_path.with_name(manifest_path.name + tmp_suffix)
+        with open(manifest_tmp, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(manifest_tmp, manifest_path)
+
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        for path in self.cache_dir.glob('*.pkl'):
+            path.unlink()
+        for path in self.cache_dir.glob('*.json'):
+            path.unlink()
@@ -0,0 +1,212 @@
+"""
+Topology presolve for the network flow LP.
+
+Networks often contain chains of junctions that exist only for reporting
+(canal reaches, gauge points). A junction with exactly one inflow link and
+one outflow link forces both links to carry the same flow, so every such
+junction adds a mass-balance row and a flow column to the daily LP without
+adding a decision.
+
+SeriesReduction merges each chain of series links through such junctions
+into a single arc:
+    bounds: max of the chain's lower bounds, min of the upper bounds
+    cost:   sum of the chain's costs
+and removes the interior junctions. The reduced LP has the same optimum as
+the original one; flows on the merged arc are copied back onto every link
+of the chain. Duals of the merged links and removed junctions can be
+recovered the same way (see SeriesReduction.expand_duals).
+
+The chain mapping only depends on the topology, so it is built once per
+network. Bounds and costs are merged from the current constraints each
+timestep.
+
+Example:
+    >>> reduction = SeriesReduction(nodes, links)
+    >>> reduced = reduction.reduce(nodes, links, constraints)
+    >>> flows = reduction.expand_flows(solve(*reduced), links)
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from hydrosim.nodes import Node
+    from hydrosim.links import Link
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SeriesArc:
+    """
+    A chain of series links merged into a single arc.
+
+    Attributes:
+        link_id: Identifier of the merged arc (format: "_series_<n>")
+        source: Source node of the first link in the chain
+        target: Target node of the last link in the chain
+        links: Original links of the chain, in flow order
+    """
+    link_id: str
+    source: 'Node'
+    target: 'Node'
+    links: List['Link'] = field(default_factory=list)
+
+
+class SeriesReduction:
+    """
+    Series-link reduction of a network topology.
+
+    The reduction is stored as node and link positions, so it can be applied
+    to any node and link lists with the same topology (for example the
+    per-timestep copies built by the look-ahead solver).
+
+    Attributes:
+        chains: Link positions of each merged chain, in flow order
+        kept_nodes: Positions of the nodes that remain in the reduced network
+        kept_links: Positions of the links that are not part of a chain
+        removed_nodes: IDs of the junctions removed by the reduction
+    """
+
+    def __init__(self, nodes: List['Node'], links: List['Link']):
+        """
+        Build the reduction for a network topology.
+
+        Args:
+            nodes: List of all nodes in the network
+            links: List of all links in the network
+        """
+        in_links: Dict[str, List[int]] = {}
+        out_links: Dict[str, List[int]] = {}
+        for j, link in enumerate(links):
+            out_links.setdefault(link.source.node_id, []).append(j)
+            in_links.setdefault(link.target.node_id, []).append(j)
+
+        # Junctions that pass a single link straight through
+        series = {
+            node.node_id for node in nodes
+            if node.node_type == "junction"
+            and len(in_links.get(node.node_id, [])) == 1
+            and len(out_links.get(node.node_id, [])) == 1
+            and in_links[node.node_id][0] != out_links[node.node_id][0]
+        }
+
+        self.chains: List[List[int]] = []
+        merged = set()
+        removed = set()
+
+        # Chains start at a link leaving a node that is not a series junction.
+        # Closed loops of series junctions have no start and stay unmerged.
+        for j, link in enumerate(links):
+            if link.source.node_id in series:
+                continue
+            chain = [j]
+            while links[chain[-1]].target.node_id in series:
+                chain.append(out_links[links[chain[-1]].target.node_id][0])
+            if len(chain) < 2 or links[chain[-1]].target.node_id == link.source.node_id:
+                continue
+
+            self.chains.append(chain)
+            merged.update(chain)
+            removed.update(links[k].target.node_id for k in chain[:-1])
+
+        self.removed_nodes = removed
+        self.kept_nodes = [i for i, node in enumerate(nodes) if node.node_id not in removed]
+        self.kept_links = [j for j in range(len(links)) if j not in merged]
+
+        if self.chains:
+            logger.debug(
+                f"Presolve merged {len(merged)} series links into {len(self.chains)} arcs "
+                f"and removed {len(removed)} junctions"
+            )
+
+    def reduce(self, nodes: List['Node'], links: List['Link'],
+               constraints: Dict[str, Tuple[float, float, float]]) \
+            -> Tuple[List['Node'], list, Dict[str, Tuple[float, float, float]]]:
+        """
+        Build the reduced network for the current nodes, links and constraints.
+
+        The original constraint entries are kept so that infeasibility
+        diagnostics can still look up links by their original IDs.
+
+        Args:
+            nodes: Nodes with the topology the reduction was built for
+            links: Links with the topology the reduction was built for
+            constraints: Dict mapping link_id to (q_min, q_max, cost)
+
+        Returns:
+            Tuple of (reduced nodes, reduced links, constraints with an entry
+            for every merged arc)
+        """
+        reduced_constraints = dict(constraints)
+        arcs = []
+        for k, chain in enumerate(self.chains):
+            chain_links = [links[j] for j in chain]
+            arc = SeriesArc(f"_series_{k}", chain_links[0].source, chain_links[-1].target, chain_links)
+            bounds = [constraints[link.link_id] for link in chain_links]
+            reduced_constraints[arc.link_id] = (
+                max(q_min for q_min, _, _ in bounds),
+                min(q_max for _, q_max, _ in bounds),
+                sum(cost for _, _, cost in bounds),
+            )
+            arcs.append(arc)
+
+        reduced_nodes = [nodes[i] for i in self.kept_nodes]
+        reduced_links = [links[j] for j in self.kept_links] + arcs
+        return reduced_nodes, reduced_links, reduced_constraints
+
+    def expand_flows(self, flows: Dict[str, float], links: List['Link']) -> Dict[str, float]:
+        """
+        Copy merged arc flows back onto the original links.
+
+        Args:
+            flows: Flows of the reduced network
+            links: Original links
+
+        Returns:
+            New dict without merged arcs and with every chain link's flow set
+        """
+        expanded = dict(flows)
+        for k, chain in enumerate(self.chains):
+            flow = expanded.pop(f"_series_{k}")
+            for j in chain:
+                expanded[links[j].link_id] = flow
+        return expanded
+    
+    def expand_duals(self, duals: Dict[str, Dict[str, float]], links: List['Link'],
+                     constraints: Dict[str, Tuple[float, float, float]]) -> None:
+        """
+        Recover duals of chain links and removed junctions in place.
+        
+        The reduced cost of a merged arc belongs to the chain link holding
+        the arc's binding bound; every other chain link has reduced cost 0.
+        With reduced cost = cost + dual(source) - dual(target), this fixes the
+        dual of each removed junction from its upstream neighbour.
+        
+        Args:
+            duals: Dict with 'nodes' and 'links' dicts from the reduced solve
+            links: Original links
+            constraints: Original constraints (link_id -> (q_min, q_max, cost))
+        """
+        for k, chain in enumerate(self.chains):
+            arc_dual = duals['links'].pop(f"_series_{k}", 0.0)
+            bounds = [constraints[links[j].link_id] for j in chain]
+            
+            binding = None
+            if arc_dual > 0:
+                q_min = max(b[0] for b in bounds)
+                binding = next(i for i, b in enumerate(bounds) if b[0] == q_min)
+            elif arc_dual < 0:
+                q_max = min(b[1] for b in bounds)
+                binding = next(i for i, b in enumerate(bounds) if b[1] == q_max)
+            
+            value = duals['nodes'].get(links[chain[0]].source.node_id, 0.0)
+            for i, j in enumerate(chain):
+                link = links[j]
+                reduced_cost = arc_dual if i == binding else 0.0
+                duals['links'][link.link_id] = reduced_cost
+                value += bounds[i][2] - reduced_cost
+                if i < len(chain) - 1:
+                    duals['nodes'][link.target.node_id] = value
@@ -2,8 +2,9 @@
 Results output system for HydroSim simulations.
 
 The results writer provides structured output of simulation results in
-CSV or JSON format for time series analysis. It captures all key simulation
-outputs including flows, storage levels, demand deficits, and inflows.
+CSV, JSON or columnar (Parquet / NumPy .npz) format for time series analysis.
+It captures all key simulation outputs including flows, storage levels, demand
+deficits, inflows and climate drivers.
 
 Example:
     >>> import hydrosim as hs
@@ -25,26 +26,699 @@ Example:
     >>> 
     >>> # Export to JSON for programmatic analysis
     >>> writer.write_json('results.json')
+    >>> 
+    >>> # Columnar output for long runs (one table per result family)
+    >>> writer = hs.ResultsWriter(output_dir='output/', format='parquet')
 
 Output Files:
-    - flows.csv: Daily flow values for all links
+    - flows.csv: Daily flow values for all links (long format by default;
+      layout='wide' writes one row per day and one column per entity)
     - storage.csv: Daily storage volumes for all StorageNodes  
     - demands.csv: Daily demand and deficit values for all DemandNodes
     - inflows.csv: Daily inflow values for all SourceNodes
     - results.json: Complete results in structured JSON format
+    - <prefix>_all.jsonl[.gz]: Streaming JSON Lines, one timestep per line
+    - <prefix>_<family>.parquet / .npz: Columnar tables for flows, storage,
+      demands, sources and climate (one row per timestep, one column per
+      entity/variable)
+    - duals.csv / node_duals, link_duals and storage_duals tables: Shadow
+      prices, when the solver records them (see rank_binding_constraints)
+    - fallbacks.csv / <prefix>_fallbacks.parquet / .npz: Timesteps the
+      solver answered with a cheaper problem because it ran out of time
 
 All outputs include timestamps and are suitable for time series analysis
 and visualization tools.
 """
 
 import csv
+import gzip
 import json
+import logging
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
 from hydrosim.nodes import StorageNode, DemandNode, SourceNode
 
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+# Variables recorded for each result family, in column order
+RESULT_FAMILIES: Dict[str, Tuple[str, ...]] = {
+    'flows': ('flow',),
+    'storage': ('storage', 'elevation', 'surface_area', 'evap_loss'),
+    'demands': ('request', 'delivered', 'deficit'),
+    'sources': ('inflow',),
+    'climate': ('precip', 't_max', 't_min', 'solar', 'et0'),
+    'node_duals': ('dual',),
+    'link_duals': ('dual',),
+    'storage_duals': ('dual',),
+}
+
+# Families that are only written when present in the results
+OPTIONAL_FAMILIES = ('climate', 'node_duals', 'link_duals', 'storage_duals')
+
+# Result families holding duals, keyed by the 'duals' entry they come from
+DUAL_FAMILIES = {'nodes': 'node_duals', 'links': 'link_duals', 'storage': 'storage_duals'}
+
+# Output formats understood by ResultsWriter
+ROW_FORMATS = ('csv', 'json', 'jsonl')
+COLUMNAR_FORMATS = ('parquet', 'npz')
+
+
+def _node_family(state: Dict[str, Any]) -> Optional[str]:
+    """
+    Classify a node state dictionary into its result family.
+    
+    Uses the same key conventions as the CSV writers: storage nodes report
+    'storage', demand nodes report 'deficit' and source nodes report 'inflow'.
+    
+    Args:
+        state: Node state dictionary from Node.get_state()
+    
+    Returns:
+        Family name, or None for stateless nodes (junctions)
+    """
+    if 'storage' in state:
+        return 'storage'
+    if 'deficit' in state:
+        return 'demands'
+    if 'inflow' in state:
+        return 'sources'
+    return None
+
+
+@dataclass
+class ResultTable:
+    """
+    Columnar view of one result family.
+    
+    Values are held in a single (timesteps x entities x variables) array so
+    that tables can be written, sliced and aggregated without per-value
+    Python objects.
+    
+    Attributes:
+        family: Result family name (flows, storage, demands, sources, climate)
+        timesteps: Timestep numbers, shape (T,)
+        dates: Dates as datetime64[D], shape (T,)
+        entities: Link or node identifiers in column order ('' for climate)
+        variables: Variable names recorded for each entity
+        values: Value block, shape (T, len(entities), len(variables))
+    """
+    family: str
+    timesteps: np.ndarray
+    dates: np.ndarray
+    entities: List[str]
+    variables: Tuple[str, ...]
+    values: np.ndarray
+    
+    def column_names(self) -> List[str]:
+        """
+        Return wide-format column names in entity-major order.
+        
+        Single-variable families (flows, sources) use the entity id, climate
+        uses the variable name and multi-variable node families use
+        '<node_id>.<variable>'.
+        
+        Returns:
+            List of column names matching wide_values() columns
+        """
+        if len(self.variables) == 1:
+            return list(self.entities)
+        return [
+            f"{entity}.{var}" if entity else var
+            for entity in self.entities
+            for var in self.variables
+        ]
+    
+    def wide_values(self) -> np.ndarray:
+        """
+        Return values as a (timesteps x columns) matrix.
+        
+        Returns:
+            2-D array whose columns match column_names()
+        """
+        n_rows = self.values.shape[0]
+        return self.values.reshape(n_rows, len(self.entities) * len(self.variables))
+
+
+class _FamilyBlock:
+    """Growable value block used while collecting one result family."""
+    
+    def __init__(self, variables: Tuple[str, ...], n_rows: int, dtype,
+                 entities: Optional[List[str]] = None):
+        self.variables = variables
+        self.entities: Dict[str, int] = {}
+        self.values = np.full((n_rows, max(len(entities or ()), 8), len(variables)),
+                              np.nan, dtype=dtype)
+        for entity_id in entities or ():
+            self.column(entity_id)
+    
+    def column(self, entity_id: str) -> int:
+        """Return the column index for an entity, adding it if needed."""
+        idx = self.entities.get(entity_id)
+        if idx is None:
+            idx = len(self.entities)
+            self.entities[entity_id] = idx
+            if idx >= self.values.shape[1]:
+                grow = np.full_like(self.values, np.nan)
+                self.values = np.concatenate([self.values, grow], axis=1)
+        return idx
+    
+    def table(self, family: str, timesteps: np.ndarray, dates: np.ndarray) -> ResultTable:
+        """Trim unused capacity and wrap the block as a ResultTable."""
+        n_entities = len(self.entities)
+        return ResultTable(
+            family=family,
+            timesteps=timesteps,
+            dates=dates,
+            entities=list(self.entities),
+            variables=self.variables,
+            values=np.ascontiguousarray(self.values[:, :n_entities, :])
+        )
+
+
+def collect_result_tables(results: List[Dict[str, Any]], dtype=np.float64,
+                          entities: Optional[Dict[str, List[str]]] = None) -> Dict[str, ResultTable]:
+    """
+    Convert timestep result dictionaries into columnar tables in one pass.
+    
+    Every family is filled from the same walk over the results, so the cost
+    is a single pass regardless of how many tables are produced. Entities
+    missing from a timestep are recorded as NaN.
+    
+    Args:
+        results: Timestep results as produced by SimulationEngine.step()
+        dtype: Floating point dtype for value blocks
+        entities: Optional mapping of family to a fixed leading entity order
+                  (used to keep column order stable across chunks)
+    
+    Returns:
+        Dictionary mapping family name to ResultTable. Families with no
+        entities (e.g. no demand nodes) are omitted.
+    """
+    n_rows = len(results)
+    entities = entities or {}
+    timesteps = np.empty(n_rows, dtype=np.int64)
+    dates = np.empty(n_rows, dtype='datetime64[D]')
+    blocks = {
+        family: _FamilyBlock(variables, n_rows, dtype, entities.get(family))
+        for family, variables in RESULT_FAMILIES.items()
+    }
+    flows_block = blocks['flows']
+    climate_block = blocks['climate']
+    node_families: Dict[str, Optional[str]] = {}
+    nan = float('nan')
+    
+    for row, result in enumerate(results):
+        timesteps[row] = result['timestep']
+        dates[row] = np.datetime64(result['date'], 'D')
+        
+        # Link flows: fast path when link order matches the established order
+        flows = result.get('flows') or {}
+        if list(flows) == list(flows_block.entities):
+            flows_block.values[row, :len(flows), 0] = list(flows.values())
+        else:
+            for link_id, flow in flows.items():
+                flows_block.values[row, flows_block.column(link_id), 0] = flow
+        
+        # Node states: classify each node once, then fill its family row
+        for node_id, state in (result.get('node_states') or {}).items():
+            if node_id in node_families:
+                family = node_families[node_id]
+            else:
+                family = node_families[node_id] = _node_family(state)
+            if family is None:
+                continue
+            block = blocks[family]
+            block.values[row, block.column(node_id)] = [
+                state.get(var, nan) for var in block.variables
+            ]
+        
+        climate = result.get('climate')
+        if climate is not None:
+            climate_block.values[row, climate_block.column('')] = [
+                getattr(climate, var) for var in climate_block.variables
+            ]
+        
+        duals = result.get('duals')
+        if duals is not None:
+            for key, family in DUAL_FAMILIES.items():
+                block = blocks[family]
+                for entity_id, value in duals.get(key, {}).items():
+                    block.values[row, block.column(entity_id), 0] = value
+    
+    return {
+        family: block.table(family, timesteps, dates)
+        for family, block in blocks.items()
+        if block.entities
+    }
+
+
+class ColumnarResultsWriter:
+    """
+    Incremental columnar writer for simulation results.
+    
+    Writes one table per result family (flows, storage, demands, sources,
+    climate) with one row per timestep and one typed float column per
+    entity/variable. Timesteps solved with a time-budget fallback are
+    written to a separate fallbacks table (timestep, date, fallback). Timesteps are buffered and flushed in row groups, so the
+    writer can be fed directly from a running simulation and memory use is
+    bounded by the row group size.
+    
+    Two formats are supported:
+    - 'parquet': Compressed Parquet files written with pyarrow, one row group
+      per flush (requires the optional pyarrow dependency)
+    - 'npz': NumPy archives, used as a fallback when pyarrow is unavailable
+    
+    Example:
+        >>> with ColumnarResultsWriter('output/', prefix='run1') as writer:
+        ...     for _ in range(36500):
+        ...         writer.add_timestep(engine.step())
+    """
+    
+    def __init__(self, output_dir: str = ".", prefix: str = "results",
+                 format: str = "parquet", compression: Optional[str] = "snappy",
+                 row_group_size: int = 365, dtype: str = "float64"):
+        """
+        Initialize columnar results writer.
+        
+        Args:
+            output_dir: Directory path for output files
+            prefix: Prefix for output filenames
+            format: 'parquet' or 'npz'. Parquet falls back to npz with a
+                    warning if pyarrow is not installed.
+            compression: Parquet compression codec (e.g. 'snappy', 'zstd').
+                         For npz any non-None value selects savez_compressed.
+            row_group_size: Number of timesteps buffered per row group
+            dtype: Value column dtype, 'float64' or 'float32'
+        
+        Raises:
+            ValueError: If format, row_group_size or dtype is invalid
+        """
+        if format not in COLUMNAR_FORMATS:
+            raise ValueError(f"Columnar format must be 'parquet' or 'npz', got '{format}'")
+        if row_group_size < 1:
+            raise ValueError(f"row_group_size must be positive, got {row_group_size}")
+        if dtype not in ('float64', 'float32'):
+            raise ValueError(f"dtype must be 'float64' or 'float32', got '{dtype}'")
+        
+        if format == 'parquet':
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                logger.warning(
+                    "pyarrow is not installed; writing columnar results as .npz instead. "
+                    "Install pyarrow for Parquet output."
+                )
+                format = 'npz'
+        
+        self.output_dir = Path(output_dir)
+        self.prefix = prefix
+        self.format = format
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.dtype = np.dtype(dtype)
+        
+        self._buffer: List[Dict[str, Any]] = []
+        self._entities: Dict[str, List[str]] = {}
+        self._parquet_writers: Dict[str, Any] = {}
+        self._npz_chunks: Dict[str, List[ResultTable]] = {}
+        self._fallbacks: List[Tuple[int, Any, str]] = []
+        self._closed = False
+        
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+    
+    def __enter__(self) -> 'ColumnarResultsWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def add_timestep(self, timestep_results: Dict[str, Any]) -> None:
+        """
+        Buffer results from a single timestep, flushing full row groups.
+        
+        Args:
+            timestep_results: Dictionary from SimulationEngine.step()
+        
+        Raises:
+            RuntimeError: If the writer has already been closed
+        """
+        if self._closed:
+            raise RuntimeError("Cannot add timesteps to a closed ColumnarResultsWriter")
+        if 'fallback' in timestep_results:
+            self._fallbacks.append((timestep_results['timestep'], timestep_results['date'],
+                                    timestep_results['fallback']))
+        self._buffer.append(timestep_results)
+        if len(self._buffer) >= self.row_group_size:
+            self.flush()
+    
+    def flush(self) -> None:
+        """
+        Convert buffered timesteps to columns and append them to each table.
+        
+        The column layout of every table is fixed by the first flush. Entities
+        that first appear in a later row group cannot be added to an existing
+        table.
+        
+        Raises:
+            ValueError: If a new entity appears after the layout was fixed
+        """
+        if not self._buffer:
+            return
+        
+        tables = collect_result_tables(self._buffer, self.dtype, self._entities)
+        self._buffer = []
+        layout_fixed = bool(self._entities)
+        
+        for family, table in tables.items():
+            known = self._entities.get(family)
+            if known is None:
+                if layout_fixed:
+                    # Family appeared after the first row group: earlier rows are absent
+                    raise ValueError(
+                        f"Result family '{family}' first appeared after the first row group; "
+                        f"columnar tables require a fixed layout"
+                    )
+                self._entities[family] = table.entities
+            elif len(table.entities) != len(known):
+                new_entities = table.entities[len(known):]
+                raise ValueError(
+                    f"New {family} entities {new_entities} appeared after the "
+                    f"columnar layout was fixed"
+                )
+            
+            if self.format == 'parquet':
+                self._write_parquet_row_group(table)
+            else:
+                self._npz_chunks.setdefault(family, []).append(table)
+    
+    def close(self) -> Dict[str, str]:
+        """
+        Flush remaining timesteps and finalize all output files.
+        
+        Returns:
+            Dictionary mapping family name to written file path, plus
+            'fallbacks' if any timestep used a time-budget fallback
+        """
+        if not self._closed:
+            self.flush()
+            if self.format == 'parquet':
+                for writer in self._parquet_writers.values():
+                    writer.close()
+            else:
+                self._write_npz_files()
+            if self._fallbacks:
+                self._write_fallbacks()
+            self._closed = True
+        
+        files = {family: str(self._path(family)) for family in self._entities}
+        if self._fallbacks:
+            files['fallbacks'] = str(self._path('fallbacks'))
+        return files
+    
+    def _path(self, family: str) -> Path:
+        """Return the output path for a result family."""
+        return self.output_dir / f"{self.prefix}_{family}.{self.format}"
+    
+    def _write_parquet_row_group(self, table: ResultTable) -> None:
+        """Append a table chunk to its Parquet file as one row group."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        wide = table.wide_values()
+        arrays = [
+            pa.array(table.timesteps.astype(np.int32)),
+            pa.array(table.dates),
+        ] + [pa.array(wide[:, i]) for i in range(wide.shape[1])]
+        names = ['timestep', 'date'] + table.column_names()
+        arrow_table = pa.Table.from_arrays(arrays, names=names)
+        
+        writer = self._parquet_writers.get(table.family)
+        if writer is None:
+            writer = pq.ParquetWriter(
+                str(self._path(table.family)),
+                arrow_table.schema,
+                compression=self.compression or 'none'
+            )
+            self._parquet_writers[table.family] = writer
+        writer.write_table(arrow_table, row_group_size=len(table.timesteps))
+    
+    def _write_npz_files(self) -> None:
+        """Concatenate buffered chunks and write one .npz archive per family."""
+        save = np.savez_compressed if self.compression else np.savez
+        for family, chunks in self._npz_chunks.items():
+            columns = chunks[0].column_names()
+            wide = np.concatenate([chunk.wide_values() for chunk in chunks], axis=0)
+            arrays = {
+                'timestep': np.concatenate([chunk.timesteps for chunk in chunks]).astype(np.int32),
+                'date': np.concatenate([chunk.dates for chunk in chunks]),
+            }
+            arrays.update({name: wide[:, i] for i, name in enumerate(columns)})
+            with open(self._path(family), 'wb') as f:
+                save(f, **arrays)
+        self._npz_chunks = {}
+    
+    def _write_fallbacks(self) -> None:
+        """Write the timesteps solved with a time-budget fallback as one table."""
+        timesteps, dates, fallbacks = zip(*self._fallbacks)
+        arrays = {
+            'timestep': np.array(timesteps, dtype=np.int32),
+            'date': np.array([np.datetime64(date, 'D') for date in dates]),
+            'fallback': np.array(fallbacks, dtype=str),
+        }
+        if self.format == 'parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            
+            pq.write_table(
+                pa.Table.from_arrays([pa.array(v) for v in arrays.values()], names=list(arrays)),
+                str(self._path('fallbacks')),
+                compression=self.compression or 'none'
+            )
+        else:
+            save = np.savez_compressed if self.compression else np.savez
+            with open(self._path('fallbacks'), 'wb') as f:
+                save(f, **arrays)
+
+
+def read_columnar_results(filepath: str) -> pd.DataFrame:
+    """
+    Read a columnar results table written by ColumnarResultsWriter.
+    
+    Args:
+        filepath: Path to a .parquet or .npz table
+    
+    Returns:
+        DataFrame with 'timestep', 'date' and one column per entity/variable
+    
+    Raises:
+        ValueError: If the file extension is not recognised
+    """
+    path = Path(filepath)
+    if path.suffix == '.parquet':
+        import pyarrow.parquet as pq
+        return pq.read_table(str(path)).to_pandas(date_as_object=False)
+    if path.suffix == '.npz':
+        with np.load(path) as archive:
+            return pd.DataFrame({name: archive[name] for name in archive.files})
+    raise ValueError(f"Unrecognised columnar results file: {filepath}")
+
+
+def _json_record(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a timestep result into a JSON-serialisable record.
+    
+    Args:
+        result: Timestep results dictionary from SimulationEngine.step()
+    
+    Returns:
+        Dictionary with timestep, date (YYYY-MM-DD), flows, node_states, and
+        duals and fallback (if present)
+    """
+    record = {
+        'timestep': result['timestep'],
+        'date': result['date'].strftime('%Y-%m-%d'),
+        'flows': result['flows'],
+        'node_states': result['node_states']
+    }
+    if 'duals' in result:
+        record['duals'] = result['duals']
+    if 'fallback' in result:
+        record['fallback'] = result['fallback']
+    return record
+
+
+def _json_default(value: Any) -> Any:
+    """Serialise NumPy scalars that the json module does not handle natively."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JSONLinesResultsWriter:
+    """
+    Streaming JSON Lines writer for simulation results.
+    
+    Each timestep is serialised to a single line as soon as it is added, so
+    memory use does not grow with simulation length. Records use the same
+    schema as the JSON output of ResultsWriter. Output is gzip-compressed
+    when requested or when the filename ends in '.gz'.
+    
+    The writer can be passed to SimulationEngine.run() as a sink:
+    
+    Example:
+        >>> with JSONLinesResultsWriter('output/run.jsonl.gz') as sink:
+        ...     engine.run(36500, sinks=[sink], keep_results=False)
+        >>> for record in iter_jsonl_results('output/run.jsonl.gz'):
+        ...     print(record['date'], record['flows'])
+    """
+    
+    def __init__(self, filepath: str, compress: Optional[bool] = None):
+        """
+        Open a JSON Lines file for writing.
+        
+        Args:
+            filepath: Output file path
+            compress: Gzip-compress output. If None, compression is enabled
+                      when filepath ends in '.gz'.
+        """
+        self.filepath = Path(filepath)
+        if compress is None:
+            compress = self.filepath.suffix == '.gz'
+        self.compress = compress
+        self.timesteps_written = 0
+        
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        if compress:
+            self._file = gzip.open(self.filepath, 'wt', encoding='utf-8')
+        else:
+            self._file = open(self.filepath, 'w', encoding='utf-8')
+    
+    def __enter__(self) -> 'JSONLinesResultsWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def add_timestep(self, timestep_results: Dict[str, Any]) -> None:
+        """
+        Serialise one timestep and append it to the file.
+        
+        Args:
+            timestep_results: Dictionary from SimulationEngine.step()
+        
+        Raises:
+            RuntimeError: If the writer has already been closed
+        """
+        if self._file.closed:
+            raise RuntimeError("Cannot add timesteps to a closed JSONLinesResultsWriter")
+        self._file.write(json.dumps(_json_record(timestep_results), default=_json_default))
+        self._file.write('\n')
+        self.timesteps_written += 1
+    
+    def close(self) -> str:
+        """
+        Flush and close the output file.
+        
+        Returns:
+            Path to the written file
+        """
+        if not self._file.closed:
+            self._file.close()
+        return str(self.filepath)
+
+
+def iter_jsonl_results(filepath: str) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over timestep records in a JSON Lines results file.
+    
+    Records are read lazily one line at a time, so files larger than memory
+    can be processed. Gzip-compressed files are detected by their '.gz'
+    extension.
+    
+    Args:
+        filepath: Path to a .jsonl or .jsonl.gz file
+    
+    Yields:
+        Timestep record dictionaries (timestep, date, flows, node_states)
+    """
+    path = Path(filepath)
+    opener = gzip.open if path.suffix == '.gz' else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def rank_binding_constraints(results: List[Dict[str, Any]], top: Optional[int] = None,
+                             tolerance: float = 1e-9) -> pd.DataFrame:
+    """
+    Rank link and storage bounds by their shadow prices over a run.
+    
+    A bound is binding on a timestep when the dual of its link is non-zero:
+    negative duals belong to upper bounds (link capacity, max_storage) and
+    positive duals to lower bounds (minimum flow, min_storage). The total
+    absolute dual over the run is the objective improvement one more unit of
+    the bound would have bought on every binding day, so it ranks the
+    constraints most worth relaxing.
+    
+    Args:
+        results: Timestep results containing 'duals' (from SimulationEngine
+                 with a solver that records duals, or iter_jsonl_results())
+        top: Number of rows to return (default: all binding bounds)
+        tolerance: Absolute dual below which a bound is not binding
+    
+    Returns:
+        DataFrame with columns element ('link' or 'storage'), element_id,
+        bound ('upper' or 'lower'), binding_days, total_dual, mean_dual and
+        max_dual (absolute values), sorted by total_dual descending
+    
+    Raises:
+        ValueError: If the results contain no duals
+    """
+    tables = collect_result_tables(results)
+    if not any(family in tables for family in ('link_duals', 'storage_duals')):
+        raise ValueError(
+            "Results contain no duals; run the simulation with a solver that "
+            "records them (e.g. LinearProgrammingSolver(compute_duals=True))"
+        )
+    
+    rows = []
+    for element, family in (('link', 'link_duals'), ('storage', 'storage_duals')):
+        table = tables.get(family)
+        if table is None:
+            continue
+        values = np.nan_to_num(table.values[:, :, 0])
+        for bound, mask in (('upper', values < -tolerance), ('lower', values > tolerance)):
+            magnitude = np.where(mask, np.abs(values), 0.0)
+            days = mask.sum(axis=0)
+            totals = magnitude.sum(axis=0)
+            peaks = magnitude.max(axis=0, initial=0.0)
+            for i in np.flatnonzero(days):
+                rows.append({
+                    'element': element,
+                    'element_id': table.entities[i],
+                    'bound': bound,
+                    'binding_days': int(days[i]),
+                    'total_dual': float(totals[i]),
+                    'mean_dual': float(totals[i] / days[i]),
+                    'max_dual': float(peaks[i]),
+                })
+    
+    columns = ['element', 'element_id', 'bound', 'binding_days',
+               'total_dual', 'mean_dual', 'max_dual']
+    ranking = pd.DataFrame(rows, columns=columns)
+    ranking = ranking.sort_values(['total_dual', 'binding_days'], ascending=False,
+                                  kind='stable').reset_index(drop=True)
+    return ranking if top is None else ranking.head(top)
+
 
 class ResultsWriter:
     """
@@ -60,26 +734,46 @@ class ResultsWriter:
     
     Attributes:
         output_dir: Directory for output files
-        format: Output format ('csv' or 'json')
+        format: Output format ('csv', 'json', 'jsonl', 'parquet' or 'npz')
+        layout: CSV layout ('long' or 'wide')
         results: Accumulated results from simulation timesteps
     """
     
-    def __init__(self, output_dir: str = ".", format: str = "csv"):
+    def __init__(self, output_dir: str = ".", format: str = "csv",
+                 compression: Optional[str] = "snappy", row_group_size: int = 365,
+                 dtype: str = "float64", layout: str = "long"):
         """
         Initialize results writer.
         
         Args:
             output_dir: Directory path for output files
-            format: Output format, either 'csv' or 'json'
+            format: Output format: 'csv', 'json', 'jsonl' (JSON Lines), or a
+                    columnar format ('parquet', or 'npz' when pyarrow is unavailable)
+            compression: Compression codec for columnar formats. For 'jsonl',
+                         'gzip' writes a gzip-compressed file.
+            row_group_size: Timesteps per row group for columnar formats
+            dtype: Value column dtype for columnar formats ('float64' or 'float32')
+            layout: CSV layout. 'long' writes one row per entity per day;
+                    'wide' writes one row per day with one column per
+                    entity/variable, built in a single pass.
         
         Raises:
-            ValueError: If format is not 'csv' or 'json'
+            ValueError: If format or layout is not recognised
         """
-        if format not in ['csv', 'json']:
-            raise ValueError(f"Format must be 'csv' or 'json', got '{format}'")
+        if format not in ROW_FORMATS + COLUMNAR_FORMATS:
+            raise ValueError(
+                f"Format must be 'csv' or 'json' (or 'jsonl', 'parquet', 'npz'), "
+                f"got '{format}'"
+            )
+        if layout not in ('long', 'wide'):
+            raise ValueError(f"Layout must be 'long' or 'wide', got '{layout}'")
         
         self.output_dir = Path(output_dir)
         self.format = format
+        self.layout = layout
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.dtype = dtype
         self.results: List[Dict[str, Any]] = []
         
         # Ensure output directory exists
@@ -109,6 +803,9 @@ class ResultsWriter:
         - Storage node states
         - Demand node states
         - Source node states
+        - Climate drivers (columnar formats and wide CSV only)
+        - Node and link duals (if recorded by the solver)
+        - Solver time-budget fallbacks (if any)
         
         Args:
             prefix: Prefix for output filenames
@@ -121,16 +818,89 @@ class ResultsWriter:
         
         written_files = {}
         
-        if self.format == 'csv':
+        if self.format == 'csv' and self.layout == 'wide':
+            written_files.update(self._write_wide_csv(prefix))
+        elif self.format == 'csv':
             written_files['flows'] = self._write_flows_csv(prefix)
             written_files['storage'] = self._write_storage_csv(prefix)
             written_files['demands'] = self._write_demands_csv(prefix)
             written_files['sources'] = self._write_sources_csv(prefix)
-        else:  # json
+            if any('duals' in result for result in self.results):
+                written_files['duals'] = self._write_duals_csv(prefix)
+            if any('fallback' in result for result in self.results):
+                written_files['fallbacks'] = self._write_fallbacks_csv(prefix)
+        elif self.format == 'json':
             written_files['all'] = self._write_json(prefix)
+        elif self.format == 'jsonl':
+            written_files['all'] = self._write_jsonl(prefix)
+        else:  # parquet / npz
+            written_files.update(self._write_columnar(prefix))
         
         return written_files
     
+    def _write_wide_csv(self, prefix: str) -> Dict[str, str]:
+        """
+        Write all results as wide-format CSV files.
+        
+        Results are converted to per-family value blocks in a single pass and
+        each block is written with one bulk DataFrame.to_csv call. Output
+        format per file:
+        timestep, date, <entity or entity.variable columns...>
+        
+        Args:
+            prefix: Filename prefix
+        
+        Returns:
+            Dictionary mapping family name to written file path
+        """
+        tables = collect_result_tables(self.results)
+        if not tables:
+            return {}
+        any_table = next(iter(tables.values()))
+        timesteps, dates = any_table.timesteps, any_table.dates
+        
+        written_files = {}
+        for family in RESULT_FAMILIES:
+            table = tables.get(family)
+            if table is None and family in OPTIONAL_FAMILIES:
+                continue
+            
+            frame = pd.DataFrame({
+                'timestep': timesteps,
+                'date': np.datetime_as_string(dates, unit='D'),
+            })
+            if table is not None:
+                values = pd.DataFrame(table.wide_values(), columns=table.column_names())
+                frame = pd.concat([frame, values], axis=1)
+            
+            filename = self.output_dir / f"{prefix}_{family}.csv"
+            frame.to_csv(filename, index=False)
+            written_files[family] = str(filename)
+        
+        return written_files
+    
+    def _write_columnar(self, prefix: str) -> Dict[str, str]:
+        """
+        Write all results as columnar tables, one file per result family.
+        
+        Args:
+            prefix: Filename prefix
+        
+        Returns:
+            Dictionary mapping family name to written file path
+        """
+        with ColumnarResultsWriter(
+            self.output_dir,
+            prefix=prefix,
+            format=self.format,
+            compression=self.compression,
+            row_group_size=self.row_group_size,
+            dtype=self.dtype
+        ) as writer:
+            for result in self.results:
+                writer.add_timestep(result)
+        return writer.close()
+    
     def _write_flows_csv(self, prefix: str) -> str:
         """
         Write link flows to CSV file.
@@ -265,6 +1035,69 @@ class ResultsWriter:
         
         return str(filename)
     
+    def _write_duals_csv(self, prefix: str) -> str:
+        """
+        Write node and link duals to CSV file.
+        
+        Output format:
+        timestep, date, element, element_id, dual
+        
+        where element is 'node', 'link' or 'storage'.
+        
+        Args:
+            prefix: Filename prefix
+        
+        Returns:
+            Path to written file
+        """
+        filename = self.output_dir / f"{prefix}_duals.csv"
+        
+        with open(filename, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['timestep', 'date', 'element', 'element_id', 'dual'])
+            
+            for result in self.results:
+                duals = result.get('duals')
+                if duals is None:
+                    continue
+                timestep = result['timestep']
+                date = result['date'].strftime('%Y-%m-%d')
+                
+                for key, element in (('nodes', 'node'), ('links', 'link'), ('storage', 'storage')):
+                    for element_id, dual in duals.get(key, {}).items():
+                        writer.writerow([timestep, date, element, element_id, dual])
+        
+        return str(filename)
+    
+    def _write_fallbacks_csv(self, prefix: str) -> str:
+        """
+        Write the timesteps solved with a time-budget fallback to CSV file.
+        
+        Output format:
+        timestep, date, fallback
+        
+        Args:
+            prefix: Filename prefix
+        
+        Returns:
+            Path to written file
+        """
+        filename = self.output_dir / f"{prefix}_fallbacks.csv"
+        
+        with open(filename, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['timestep', 'date', 'fallback'])
+            
+            for result in self.results:
+                if 'fallback' in result:
+                    writer.writerow([
+                        result['timestep'],
+                        result['date'].strftime('%Y-%m-%d'),
+                        result['fallback']
+                    ])
+        
+        return str(filename)
+    
     def _write_json(self, prefix: str) -> str:
         """
         Write all results to JSON file.
@@ -281,21 +1114,32 @@ class ResultsWriter:
         filename = self.output_dir / f"{prefix}_all.json"
         
         # Convert datetime objects to strings for JSON serialization
-        json_results = []
-        for result in self.results:
-            json_result = {
-                'timestep': result['timestep'],
-                'date': result['date'].strftime('%Y-%m-%d'),
-                'flows': result['flows'],
-                'node_states': result['node_states']
-            }
-            json_results.append(json_result)
+        json_results = [_json_record(result) for result in self.results]
         
         with open(filename, 'w') as f:
             json.dump(json_results, f, indent=2)
         
         return str(filename)
     
+    def _write_jsonl(self, prefix: str) -> str:
+        """
+        Write all results to a JSON Lines file, one timestep per line.
+        
+        Args:
+            prefix: Filename prefix
+        
+        Returns:
+            Path to written file
+        """
+        compress = self.compression == 'gzip'
+        filename = self.output_dir / f"{prefix}_all.jsonl{'.gz' if compress else ''}"
+        
+        with JSONLinesResultsWriter(filename, compress=compress) as writer:
+            for result in self.results:
+                writer.add_timestep(result)
+        
+        return str(filename)
+    
     def clear(self) -> None:
         """Clear accumulated results."""
         self.results = []
@@ -2,16 +2,131 @@
 Results visualization for HydroSim simulations.
 
 This module provides automated time series plotting based on YAML configuration.
+
+Long runs are kept responsive by reducing each trace before plotting. The
+following keys may be set in the visualization ``layout`` section (global) or
+on an individual plot (override):
+
+    - max_points: Maximum points per trace after decimation (default 2000;
+      0 disables decimation)
+    - decimation: 'lttb' (largest-triangle-three-buckets, default), 'minmax'
+      (min and max of each bucket) or 'none'
+    - webgl: Render traces with Scattergl instead of Scatter (default false)
+    - aggregate: 'daily' (default), 'monthly' or 'annual' mean values
+      (plot-level only)
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
+import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
-from hydrosim.results import ResultsWriter
+from hydrosim.results import ResultsWriter, ResultTable, collect_result_tables
 from hydrosim.config import NetworkGraph
 
 
+# Default maximum number of points per trace
+DEFAULT_MAX_POINTS = 2000
+
+# pandas resampling rules for aggregated plot views
+AGGREGATION_RULES = {
+    'monthly': 'MS',
+    'annual': 'YS',
+}
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select points with the Largest-Triangle-Three-Buckets algorithm.
+    
+    The first and last points are always kept. The interior is split into
+    n_out - 2 buckets and from each bucket the point forming the largest
+    triangle with the previously selected point and the mean of the next
+    bucket is kept, which preserves peaks and troughs visually.
+    
+    Args:
+        x: Monotonic x values (numeric), shape (n,)
+        y: y values, shape (n,); NaN values are never selected over finite ones
+        n_out: Number of points to keep
+    
+    Returns:
+        Sorted integer indices of the selected points
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    
+    # Mean of each bucket, used as the third triangle vertex for the previous bucket
+    counts = np.diff(edges)
+    x_means = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / counts
+    y_means = np.add.reduceat(np.nan_to_num(y[1:n - 1]), edges[:-1] - 1) / counts
+    
+    selected = np.empty(n_out, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for b in range(n_out - 2):
+        start, end = edges[b], edges[b + 1]
+        if b + 1 < n_out - 2:
+            cx, cy = x_means[b + 1], y_means[b + 1]
+        else:
+            cx, cy = x[n - 1], y[n - 1]
+        ax, ay = x[a], y[a]
+        area = np.abs(
+            (ax - cx) * (y[start:end] - ay) - (ax - x[start:end]) * (cy - ay)
+        )
+        a = start + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        selected[b + 1] = a
+    
+    return selected
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select the minimum and maximum point of each bucket.
+    
+    The series is split into n_out // 2 equal buckets and the positions of
+    the smallest and largest value in each bucket are kept, so every
+    extreme survives decimation.
+    
+    Args:
+        y: y values, shape (n,)
+        n_out: Approximate number of points to keep
+    
+    Returns:
+        Sorted unique integer indices of the selected points
+    """
+    n = len(y)
+    n_buckets = n_out // 2
+    if n_out >= n or n_buckets < 1:
+        return np.arange(n)
+    
+    size = -(-n // n_buckets)
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:n] = y
+    blocks = padded.reshape(n_buckets, size)
+    offsets = np.arange(n_buckets) * size
+    
+    lows = offsets + np.argmin(np.where(np.isnan(blocks), np.inf, blocks), axis=1)
+    highs = offsets + np.argmax(np.where(np.isnan(blocks), -np.inf, blocks), axis=1)
+    indices = np.unique(np.concatenate([lows, highs, [0, n - 1]]))
+    return indices[indices < n]
+
+
+# Long-format id column and renamed variables for each result family
+_FAMILY_FRAMES = {
+    'flows': ('link_id', {}),
+    'storage': ('node_id', {}),
+    'demands': ('node_id', {}),
+    'sources': ('node_id', {}),
+    'climate': (None, {'t_max': 'tmax', 't_min': 'tmin'}),
+}
+
+
 class ResultsVisualizer:
     """
     Automated results visualization based on configuration.
@@ -20,101 +135,119 @@ class ResultsVisualizer:
     based on YAML visualization configuration.
     """
     
-    def __init__(self, results_writer: ResultsWriter, network: NetworkGraph, 
-                 viz_config: Optional[Dict[str, Any]] = None):
+    def __init__(self, results_writer: Optional[ResultsWriter], network: NetworkGraph, 
+                 viz_config: Optional[Dict[str, Any]] = None,
+                 tables: Optional[Dict[str, ResultTable]] = None):
         """
         Initialize results visualizer.
         
         Args:
             results_writer: ResultsWriter with accumulated simulation results
+                            (may be None when tables are given)
             network: NetworkGraph with model structure
             viz_config: Visualization configuration from YAML (optional)
+            tables: Pre-built columnar result tables, as returned by
+                    collect_result_tables(). Used instead of converting the
+                    writer's results when provided.
         """
         self.results_writer = results_writer
         self.network = network
         self.viz_config = viz_config or {}
         
+        if tables is None:
+            results = results_writer.get_results() if results_writer else []
+            tables = collect_result_tables(results) if results else {}
+        self.tables = tables
+        self._node_flow_totals: Optional[Dict[str, pd.DataFrame]] = None
+        
         # Convert results to dataframes for easier plotting
         self._prepare_dataframes()
     
     def _prepare_dataframes(self) -> None:
-        """Convert results to pandas DataFrames."""
-        results = self.results_writer.get_results()
-        
-        if not results:
-            self.df_flows = pd.DataFrame()
-            self.df_storage = pd.DataFrame()
-            self.df_demands = pd.DataFrame()
-            self.df_sources = pd.DataFrame()
-            self.df_climate = pd.DataFrame()
-            return
+        """
+        Convert columnar result tables to long-format pandas DataFrames.
+        
+        Each family is built with a single DataFrame constructor from its
+        (timesteps x entities x variables) value block: dates are repeated
+        per entity and entity ids tiled per date, giving the same row order
+        as iterating timestep by timestep.
+        """
+        for family, (id_column, renames) in _FAMILY_FRAMES.items():
+            table = self.tables.get(family)
+            frame = pd.DataFrame() if table is None else self._long_frame(table, id_column, renames)
+            setattr(self, f"df_{family}", frame)
+    
+    @staticmethod
+    def _long_frame(table: ResultTable, id_column: Optional[str],
+                    renames: Dict[str, str]) -> pd.DataFrame:
+        """Build a long-format DataFrame from one result table."""
+        n_rows, n_entities, n_vars = table.values.shape
+        values = table.values.reshape(n_rows * n_entities, n_vars)
+        
+        columns = {'date': pd.to_datetime(np.repeat(table.dates, n_entities))}
+        if id_column is not None:
+            columns[id_column] = np.tile(np.asarray(table.entities, dtype=object), n_rows)
+        for j, var in enumerate(table.variables):
+            columns[renames.get(var, var)] = values[:, j]
+        frame = pd.DataFrame(columns)
+        
+        # Entities absent from a timestep are NaN in the block; drop those rows
+        present = ~np.isnan(values).all(axis=1)
+        if not present.all():
+            frame = frame[present].reset_index(drop=True)
+        return frame
+    
+    def _plot_option(self, config: Dict, key: str, default: Any) -> Any:
+        """Return a plot option, falling back to the global layout setting."""
+        if key in config:
+            return config[key]
+        return self.viz_config.get('layout', {}).get(key, default)
+    
+    def _trace(self, config: Dict, x: Any, y: Any, **kwargs) -> Union[go.Scatter, go.Scattergl]:
+        """
+        Build a line trace, reduced according to the plot configuration.
+        
+        Applies the plot's aggregation (monthly/annual means), then decimates
+        the series to at most max_points points and returns a Scattergl
+        trace when webgl is enabled, otherwise a Scatter trace.
         
-        # Flows dataframe
-        flows_data = []
-        for r in results:
-            for link_id, flow in r['flows'].items():
-                flows_data.append({
-                    'date': r['date'],
-                    'link_id': link_id,
-                    'flow': flow
-                })
-        self.df_flows = pd.DataFrame(flows_data)
-        
-        # Storage dataframe
-        storage_data = []
-        for r in results:
-            for node_id, state in r['node_states'].items():
-                if 'storage' in state:
-                    storage_data.append({
-                        'date': r['date'],
-                        'node_id': node_id,
-                        'storage': state['storage'],
-                        'elevation': state['elevation'],
-                        'surface_area': state['surface_area'],
-                        'evap_loss': state['evap_loss']
-                    })
-        self.df_storage = pd.DataFrame(storage_data)
-        
-        # Demands dataframe
-        demands_data = []
-        for r in results:
-            for node_id, state in r['node_states'].items():
-                if 'deficit' in state:
-                    demands_data.append({
-                        'date': r['date'],
-                        'node_id': node_id,
-                        'request': state['request'],
-                        'delivered': state['delivered'],
-                        'deficit': state['deficit']
-                    })
-        self.df_demands = pd.DataFrame(demands_data)
-        
-        # Sources dataframe
-        sources_data = []
-        for r in results:
-            for node_id, state in r['node_states'].items():
-                if 'inflow' in state and 'deficit' not in state:
-                    sources_data.append({
-                        'date': r['date'],
-                        'node_id': node_id,
-                        'inflow': state['inflow']
-                    })
-        self.df_sources = pd.DataFrame(sources_data)
-        
-        # Climate dataframe
-        climate_data = []
-        for r in results:
-            if 'climate' in r:
-                climate = r['climate']
-                climate_data.append({
-                    'date': r['date'],
-                    'precip': climate.precip,
-                    'tmax': climate.t_max,
-                    'tmin': climate.t_min,
-                    'solar': climate.solar,
-                    'et0': climate.et0
-                })
-        self.df_climate = pd.DataFrame(climate_data)
+        Args:
+            config: Plot configuration
+            x: Dates
+            y: Values
+            **kwargs: Additional trace properties (name, mode, line, fill, ...)
+        
+        Returns:
+            Plotly trace
+        
+        Raises:
+            ValueError: If aggregate or decimation is not recognised
+        """
+        x = pd.DatetimeIndex(x)
+        y = np.asarray(y, dtype=float)
+        
+        aggregate = config.get('aggregate', 'daily')
+        if aggregate != 'daily':
+            if aggregate not in AGGREGATION_RULES:
+                raise ValueError(
+                    f"aggregate must be 'daily', 'monthly' or 'annual', got '{aggregate}'"
+                )
+            series = pd.Series(y, index=x).resample(AGGREGATION_RULES[aggregate]).mean()
+            x, y = series.index, series.to_numpy()
+        
+        max_points = self._plot_option(config, 'max_points', DEFAULT_MAX_POINTS)
+        method = self._plot_option(config, 'decimation', 'lttb')
+        if method not in ('lttb', 'minmax', 'none'):
+            raise ValueError(f"decimation must be 'lttb', 'minmax' or 'none', got '{method}'")
+        if max_points and method != 'none' and len(y) > max_points:
+            if method == 'lttb':
+                keep = lttb_indices(x.asi8, y, max_points)
+            else:
+                keep = minmax_indices(y, max_points)
+            x, y = x[keep], y[keep]
+        
+        trace_cls = go.Scattergl if self._plot_option(config, 'webgl', False) else go.Scatter
+        return trace_cls(x=x, y=y, **kwargs)
     
     def generate_all_plots(self) -> go.Figure:
         """
@@ -232,9 +365,8 @@ class ResultsVisualizer:
         for var in y1_config.get('variables', []):
             if var in self.df_climate.columns:
                 fig.add_trace(
-                    go.Scatter(
-                        x=self.df_climate['date'],
-                        y=self.df_climate[var],
+                    self._trace(
+                        config, self.df_climate['date'], self.df_climate[var],
                         name=var.capitalize(),
                         mode='lines'
                     ),
@@ -245,9 +377,8 @@ class ResultsVisualizer:
         for var in y2_config.get('variables', []):
             if var in self.df_climate.columns:
                 fig.add_trace(
-                    go.Scatter(
-                        x=self.df_climate['date'],
-                        y=self.df_climate[var],
+                    self._trace(
+                        config, self.df_climate['date'], self.df_climate[var],
                         name=var.upper(),
                         mode='lines',
                         line=dict(dash='dash')
@@ -271,9 +402,8 @@ class ResultsVisualizer:
         for var in y1_config.get('variables', []):
             if var in df_node.columns:
                 fig.add_trace(
-                    go.Scatter(
-                        x=df_node['date'],
-                        y=df_node[var],
+                    self._trace(
+                        config, df_node['date'], df_node[var],
                         name=f"{node_id} {var}",
                         mode='lines'
                     ),
@@ -296,9 +426,8 @@ class ResultsVisualizer:
         for var in y1_config.get('variables', []):
             if var in df_node.columns:
                 fig.add_trace(
-                    go.Scatter(
-                        x=df_node['date'],
-                        y=df_node[var],
+                    self._trace(
+                        config, df_node['date'], df_node[var],
                         name=f"{node_id} {var}",
                         mode='lines',
                         fill='tozeroy'
@@ -314,9 +443,8 @@ class ResultsVisualizer:
         
         if not inflows.empty:
             fig.add_trace(
-                go.Scatter(
-                    x=inflows['date'],
-                    y=inflows['flow'],
+                self._trace(
+                    config, inflows['date'], inflows['flow'],
                     name=f"{node_id} inflow",
                     mode='lines'
                 ),
@@ -325,9 +453,8 @@ class ResultsVisualizer:
         
         if not outflows.empty:
             fig.add_trace(
-                go.Scatter(
-                    x=outflows['date'],
-                    y=outflows['flow'],
+                self._trace(
+                    config, outflows['date'], outflows['flow'],
                     name=f"{node_id} outflow",
                     mode='lines'
                 ),
@@ -337,9 +464,8 @@ class ResultsVisualizer:
         # Evaporation loss
         if 'evap_loss' in df_node.columns:
             fig.add_trace(
-                go.Scatter(
-                    x=df_node['date'],
-                    y=df_node['evap_loss'],
+                self._trace(
+                    config, df_node['date'], df_node['evap_loss'],
                     name=f"{node_id} evap_loss",
                     mode='lines',
                     line=dict(dash='dot')
@@ -350,9 +476,8 @@ class ResultsVisualizer:
         # Spills
         if not spills.empty:
             fig.add_trace(
-                go.Scatter(
-                    x=spills['date'],
-                    y=spills['flow'],
+                self._trace(
+                    config, spills['date'], spills['flow'],
                     name=f"{node_id} spill",
                     mode='lines',
                     line=dict(dash='dash')
@@ -375,9 +500,8 @@ class ResultsVisualizer:
         for var in y1_config.get('variables', []):
             if var in df_node.columns:
                 fig.add_trace(
-                    go.Scatter(
-                        x=df_node['date'],
-                        y=df_node[var],
+                    self._trace(
+                        config, df_node['date'], df_node[var],
                         name=f"{node_id} {var}",
                         mode='lines'
                     ),
@@ -386,50 +510,76 @@ class ResultsVisualizer:
         
         fig.update_yaxes(title_text=y1_config.get('label', ''), row=row, col=1, secondary_y=False)
     
-    def _calculate_node_inflows(self, node_id: str) -> pd.DataFrame:
-        """Calculate total inflows to a node."""
-        node = self.network.nodes.get(node_id)
-        if not node or not node.inflows:
-            return pd.DataFrame()
+    def _calculate_node_flow_totals(self) -> Dict[str, pd.DataFrame]:
+        """
+        Aggregate link flows into per-node inflow, outflow and spill series.
         
-        inflow_links = [link.link_id for link in node.inflows if not link.link_id.endswith('_carryover')]
+        Builds (links x nodes) incidence matrices from the network and
+        multiplies the (timesteps x links) flow matrix by each of them, so
+        all node aggregates are computed with three matrix products.
+        Inflows exclude carryover links; outflows exclude spill and carryover
+        links; spills include only spill links.
         
-        if not inflow_links or self.df_flows.empty:
-            return pd.DataFrame()
+        Returns:
+            Dictionary with 'inflow', 'outflow' and 'spill' DataFrames indexed
+            by date, one column per node that has at least one such link
+        """
+        if self._node_flow_totals is not None:
+            return self._node_flow_totals
+        
+        table = self.tables.get('flows')
+        node_ids = list(self.network.nodes)
+        node_index = {node_id: i for i, node_id in enumerate(node_ids)}
+        totals = {kind: pd.DataFrame() for kind in ('inflow', 'outflow', 'spill')}
+        
+        if table is not None:
+            n_links = len(table.entities)
+            incidence = {kind: np.zeros((n_links, len(node_ids))) for kind in totals}
+            for i, link_id in enumerate(table.entities):
+                link = self.network.links.get(link_id)
+                if link is None:
+                    continue
+                is_spill = link_id.endswith('_spill')
+                is_carryover = link_id.endswith('_carryover')
+                if not is_carryover and link.target.node_id in node_index:
+                    incidence['inflow'][i, node_index[link.target.node_id]] = 1.0
+                if link.source.node_id in node_index:
+                    if is_spill:
+                        incidence['spill'][i, node_index[link.source.node_id]] = 1.0
+                    elif not is_carryover:
+                        incidence['outflow'][i, node_index[link.source.node_id]] = 1.0
+            
+            flows = np.nan_to_num(table.values[:, :, 0])
+            dates = pd.to_datetime(table.dates)
+            for kind, matrix in incidence.items():
+                has_links = matrix.any(axis=0)
+                totals[kind] = pd.DataFrame(
+                    flows @ matrix[:, has_links],
+                    index=dates,
+                    columns=[node_id for node_id, keep in zip(node_ids, has_links) if keep]
+                )
         
-        df_inflows = self.df_flows[self.df_flows['link_id'].isin(inflow_links)]
-        return df_inflows.groupby('date')['flow'].sum().reset_index()
+        self._node_flow_totals = totals
+        return totals
+    
+    def _node_flow_series(self, node_id: str, kind: str) -> pd.DataFrame:
+        """Return one node's aggregated flow series as a (date, flow) frame."""
+        totals = self._calculate_node_flow_totals()[kind]
+        if node_id not in totals.columns:
+            return pd.DataFrame()
+        return pd.DataFrame({'date': totals.index, 'flow': totals[node_id].to_numpy()})
+    
+    def _calculate_node_inflows(self, node_id: str) -> pd.DataFrame:
+        """Calculate total inflows to a node."""
+        return self._node_flow_series(node_id, 'inflow')
     
     def _calculate_node_outflows(self, node_id: str) -> pd.DataFrame:
         """Calculate total outflows from a node (excluding spills and carryover)."""
-        node = self.network.nodes.get(node_id)
-        if not node or not node.outflows:
-            return pd.DataFrame()
-        
-        outflow_links = [
-            link.link_id for link in node.outflows 
-            if not link.link_id.endswith('_spill') and not link.link_id.endswith('_carryover')
-        ]
-        
-        if not outflow_links or self.df_flows.empty:
-            return pd.DataFrame()
-        
-        df_outflows = self.df_flows[self.df_flows['link_id'].isin(outflow_links)]
-        return df_outflows.groupby('date')['flow'].sum().reset_index()
+        return self._node_flow_series(node_id, 'outflow')
     
     def _calculate_node_spills(self, node_id: str) -> pd.DataFrame:
         """Calculate spills from a node."""
-        node = self.network.nodes.get(node_id)
-        if not node or not node.outflows:
-            return pd.DataFrame()
-        
-        spill_links = [link.link_id for link in node.outflows if link.link_id.endswith('_spill')]
-        
-        if not spill_links or self.df_flows.empty:
-            return pd.DataFrame()
-        
-        df_spills = self.df_flows[self.df_flows['link_id'].isin(spill_links)]
-        return df_spills.groupby('date')['flow'].sum().reset_index()
+        return self._node_flow_series(node_id, 'spill')
     
     def _get_default_plots(self) -> List[Dict]:
         """Get default plot configuration if none provided."""
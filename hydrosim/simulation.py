@@ -38,7 +38,7 @@ The simulation enforces a strict execution order each timestep:
 5. State update: Move water and update storage
 """
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 import logging
 
@@ -119,6 +119,10 @@ class SimulationEngine:
                 - climate: Climate state
                 - node_states: State of all nodes
                 - flows: Flow allocations for all links
+                - duals: Node, link and storage duals ('nodes', 'links' and
+                  'storage' dicts), only present if the solver records them
+                - fallback: Cheaper problem solved because the solver ran out
+                  of time (see LookaheadSolver), only present if one was used
                 
         Raises:
             ClimateDataError: If climate data is not available for the current timestep
@@ -147,6 +151,9 @@ class SimulationEngine:
             # Step 4: Solver step - perform network optimization
             logger.debug(f"Timestep {self.current_timestep}: Solving network flow")
             flow_allocations = self.solver.solve(nodes, links, constraints)
+            if isinstance(self.solver, LookaheadSolver):
+                # Next step's horizon starts one day later
+                self.solver.advance_future_data()
             
             # Step 5: State update - move mass and update storage
             logger.debug(f"Timestep {self.current_timestep}: Updating state")
@@ -160,6 +167,12 @@ class SimulationEngine:
                 'node_states': {node.node_id: node.get_state() for node in nodes},
                 'flows': flow_allocations
             }
+            duals = getattr(self.solver, 'last_duals', None)
+            if duals is not None:
+                results['duals'] = duals
+            fallback = getattr(self.solver, 'last_fallback', None)
+            if fallback is not None:
+                results['fallback'] = fallback
             
             # Increment timestep counter
             self.current_timestep += 1
@@ -223,12 +236,22 @@ class SimulationEngine:
             elif isinstance(node, DemandNode):
                 node.update_delivery(total_inflow)
     
-    def run(self, num_timesteps: int) -> List[Dict[str, any]]:
+    def run(self, num_timesteps: int, sinks: Optional[List[Any]] = None,
+            keep_results: bool = True) -> List[Dict[str, any]]:
         """
         Run simulation for multiple timesteps.
         
+        Each timestep's results are passed to every sink as soon as they are
+        produced. A sink is any object with an ``add_timestep(result)`` method,
+        such as ResultsWriter, ColumnarResultsWriter or JSONLinesResultsWriter.
+        Sinks are not closed by the engine. The solver is closed when the run
+        ends (releasing worker threads; it can still be used afterwards).
+        
         Args:
             num_timesteps: Number of timesteps to simulate
+            sinks: Optional result sinks fed during the run
+            keep_results: If False, results are only passed to sinks and an
+                          empty list is returned (bounded memory for long runs)
         
         Returns:
             List of results dictionaries, one per timestep
@@ -244,19 +267,32 @@ class SimulationEngine:
         # Prepare future data for look-ahead optimization
         self._prepare_future_data(num_timesteps)
         
+        sinks = sinks or []
         results = []
+        completed = 0
         try:
             for i in range(num_timesteps):
                 timestep_results = self.step()
-                results.append(timestep_results)
+                for sink in sinks:
+                    sink.add_timestep(timestep_results)
+                if keep_results:
+                    results.append(timestep_results)
+                completed += 1
         except Exception as e:
             logger.error(
                 f"Simulation halted at timestep {self.current_timestep} "
-                f"after completing {len(results)} timesteps"
+                f"after completing {completed} timesteps"
             )
             raise
+        finally:
+            close_solver = getattr(self.solver, 'close', None)
+            if close_solver is not None:
+                close_solver()
         
         logger.info(f"Simulation completed successfully: {num_timesteps} timesteps")
+        solver_stats = self.get_solver_stats()
+        if solver_stats:
+            logger.info(f"Solver statistics: {solver_stats}")
         return results
     
     def _create_solver_from_config(self) -> NetworkSolver:
@@ -270,17 +306,27 @@ class SimulationEngine:
         opt_config = getattr(self.network, 'opt_config', {})
         lookahead_days = opt_config.get('lookahead_days', 1)
         carryover_cost = opt_config.get('carryover_cost', -1.0)
+        shadow_prices = opt_config.get('shadow_prices', False)
+        time_limit = opt_config.get('time_limit')
+        horizon_schedule = opt_config.get('horizon_schedule')
+        reoptimize_every = opt_config.get('reoptimize_every', 1)
+        reoptimize_tolerance = opt_config.get('reoptimize_tolerance', 1e-6)
         
-        if lookahead_days == 1:
+        if lookahead_days == 1 and time_limit is None and horizon_schedule is None:
             # Use standard myopic solver
             logger.info("Using LinearProgrammingSolver (myopic optimization)")
-            return LinearProgrammingSolver()
+            return LinearProgrammingSolver(compute_duals=shadow_prices)
         else:
             # Use look-ahead solver
             logger.info(f"Using LookaheadSolver with {lookahead_days}-day horizon")
             return LookaheadSolver(
                 lookahead_days=lookahead_days,
-                carryover_cost=carryover_cost
+                carryover_cost=carryover_cost,
+                compute_duals=shadow_prices,
+                time_limit=time_limit,
+                horizon_schedule=horizon_schedule,
+                reoptimize_every=reoptimize_every,
+                reoptimize_tolerance=reoptimize_tolerance
             )
     
     def _prepare_future_data(self, num_timesteps: int) -> None:
@@ -288,7 +334,11 @@ class SimulationEngine:
         Prepare future data for look-ahead optimization.
         
         This method extracts future inflows and demands from the network's
-        source and demand nodes for perfect foresight optimization.
+        source and demand nodes for perfect foresight optimization. The
+        series start at the next timestep to simulate and extend a full
+        look-ahead horizon past the end of the run. The solver keeps them
+        in RollingFutureData arrays whose cursor is advanced after every
+        step, so each horizon window starts at the current timestep.
         
         Args:
             num_timesteps: Total number of timesteps to simulate
@@ -297,6 +347,7 @@ class SimulationEngine:
             return
         
         logger.info("Preparing future data for look-ahead optimization...")
+        num_timesteps += self.solver.lookahead_days
         
         future_inflows = {}
         future_demands = {}
@@ -305,14 +356,13 @@ class SimulationEngine:
         # Extract future inflows from source nodes
         for node in self.network.nodes.values():
             if node.node_type == "source":
-                # Get future inflows from the node's strategy
-                if hasattr(node.strategy, 'get_future_values'):
+                # Get future inflows from the node's generator strategy
+                if hasattr(node.generator, 'get_future_values'):
                     # For time series strategies, get future values
-                    future_values = node.strategy.get_future_values(num_timesteps)
+                    future_values = node.generator.get_future_values(num_timesteps)
                     future_inflows[node.node_id] = future_values
-                else:
-                    # For other strategies, assume constant current inflow
-                    future_inflows[node.node_id] = [node.inflow] * num_timesteps
+                # Other strategies have no forecast; the solver assumes the
+                # current inflow persists over the horizon
         
         # Extract future demands from demand nodes
         for node in self.network.nodes.values():
@@ -322,9 +372,8 @@ class SimulationEngine:
                     # For time-varying demand models, get future values
                     future_values = node.demand_model.get_future_demands(num_timesteps)
                     future_demands[node.node_id] = future_values
-                else:
-                    # For static demand models, assume constant current request
-                    future_demands[node.node_id] = [node.request] * num_timesteps
+                # Demand models without a forecast: the solver assumes the
+                # current request persists over the horizon
         
         # Extract future climate data
         if hasattr(self.climate_engine, 'get_future_climate'):
@@ -345,6 +394,18 @@ class SimulationEngine:
         """
         return self.current_timestep
     
+    def get_solver_stats(self) -> Dict[str, int]:
+        """
+        Get solver instrumentation counters.
+        
+        For the built-in solvers these are the number of LP solves and the
+        number of solution cache hits and misses since the solver was created.
+        
+        Returns:
+            Copy of the solver's counters (empty if the solver has none)
+        """
+        return dict(getattr(self.solver, 'stats', {}))
+    
     def get_network_state(self) -> Dict[str, Dict[str, float]]:
         """
         Get current state of all nodes in the network.
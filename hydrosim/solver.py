@@ -33,14 +33,22 @@ and only spilled when storage is full.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple, TYPE_CHECKING
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+import hashlib
 import logging
+import math
+import threading
+import time
 
 if TYPE_CHECKING:
     from hydrosim.nodes import Node
     from hydrosim.links import Link
 
-from hydrosim.exceptions import InfeasibleNetworkError
+from hydrosim.exceptions import InfeasibleNetworkError, SolverTimeLimitError
+from hydrosim.future_data import RollingFutureData
+from hydrosim.presolve import SeriesReduction
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -116,6 +124,15 @@ class NetworkSolver(ABC):
             Dict mapping link_id to allocated flow
         """
         pass
+    
+    def close(self) -> None:
+        """Release resources held by the solver (worker threads). Safe to call twice."""
+    
+    def __enter__(self) -> 'NetworkSolver':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
 
 class LookaheadSolver(NetworkSolver):
@@ -133,41 +150,202 @@ class LookaheadSolver(NetworkSolver):
     - Perfect foresight assumption for future inflows/demands
     - Rolling horizon optimization
     - Hedging capability (saving water for future high-priority needs)
+    
+    Future inflows and demands are held in RollingFutureData providers whose
+    cursor marks the current timestep; advance_future_data() moves it forward
+    one day (SimulationEngine calls it after every step), so each horizon
+    starts at today's values.
+    
+    A horizon_schedule replaces the daily copies with blocks of coarser
+    periods, e.g. [(1, 14), (7, 11), (30, 9)] is daily for 14 days, weekly
+    out to about 3 months and monthly out to about a year: 34 copies of the
+    network instead of 365. A block of n days has the summed inflows and
+    demands of its days, link bounds scaled by n and carryover links to the
+    next block. The first period must be one day long, as its flows are the
+    decisions applied to the current timestep.
+    
+    With compute_duals enabled, last_duals holds the duals of the current
+    timestep's nodes and links taken from the expanded problem, so water
+    values include the worth of water for the rest of the horizon.
+    
+    With a time_limit, every timestep must be solved within that many
+    seconds. The limit is passed to HiGHS, and when a solve runs out of time
+    the remaining budget is spent on progressively cheaper problems:
+        1. the full look-ahead horizon
+        2. a shorter horizon (the first half of the periods)
+        3. the myopic single-day LP
+        4. the previous timestep's flows scaled to feasibility
+    The fallback used for the last timestep is kept in last_fallback
+    (None if the first choice succeeded) and counted in stats.
+    
+    With reoptimize_every = k > 1, a horizon solve also keeps the flows it
+    plans for the following days (the leading one-day periods). Those planned
+    flows are applied on the next k - 1 timesteps without solving, unless the
+    realised inflows, demand requests or storage differ from the plan by more
+    than reoptimize_tolerance (relative), or a planned flow falls outside the
+    day's link bounds. Planned storage only accounts for link flows, so it is
+    compared with realised storage plus the evaporation since the plan was
+    made (the evap_loss of each day it has been followed). The number of
+    re-solves and of reused plan days is counted in stats ('reoptimizations',
+    'plan_reuses').
+    
+    Attributes:
+        lookahead_days: Number of days in the look-ahead horizon
+        periods: Length in days of each period (block) of the horizon
+        carryover_cost: Cost for storing water between timesteps
+        time_limit: Time budget per timestep in seconds (None for no limit)
+        reoptimize_every: Maximum number of timesteps a horizon plan is used for
+        reoptimize_tolerance: Relative deviation from the plan that triggers a
+                              re-solve
+        base_solver: LP solver used for the expanded graph
+        last_duals: Duals of the current timestep (None unless compute_duals)
+        last_fallback: Fallback used for the last timestep ('shorter_horizon',
+                       'myopic', 'previous_solution'), or None
     """
     
-    def __init__(self, lookahead_days: int = 1, carryover_cost: float = -1.0):
+    # Fallbacks in the order they are tried after the full horizon
+    FALLBACKS = ('shorter_horizon', 'myopic', 'previous_solution')
+    
+    def __init__(self, lookahead_days: int = 1, carryover_cost: float = -1.0,
+                 compute_duals: bool = False, time_limit: Optional[float] = None,
+                 horizon_schedule: Optional[List[Tuple[int, int]]] = None,
+                 reoptimize_every: int = 1, reoptimize_tolerance: float = 1e-6):
         """
         Initialize look-ahead solver.
         
         Args:
             lookahead_days: Number of days to look ahead (1 = myopic behavior)
             carryover_cost: Cost for storing water between timesteps (hedging penalty)
+            compute_duals: Record node and link duals of the current timestep
+                           in last_duals
+            time_limit: Time budget per timestep in seconds; solves that
+                        exceed it fall back to cheaper problems
+            horizon_schedule: List of (period_days, num_periods) blocks making
+                              up the horizon; overrides lookahead_days
+            reoptimize_every: Solve the horizon at most every this many
+                              timesteps, following the plan in between
+            reoptimize_tolerance: Relative deviation of inflows, demands or
+                                  storage from the plan that forces a re-solve
+        
+        Raises:
+            ValueError: If time_limit is not positive, horizon_schedule is
+                        invalid, reoptimize_every is below 1 or
+                        reoptimize_tolerance is negative
         """
         validate_cost_hierarchy()
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError(f"time_limit must be positive, got {time_limit}")
+        if reoptimize_every < 1:
+            raise ValueError(f"reoptimize_every must be at least 1, got {reoptimize_every}")
+        if reoptimize_tolerance < 0:
+            raise ValueError(f"reoptimize_tolerance must be non-negative, got {reoptimize_tolerance}")
+        if horizon_schedule is not None:
+            self.periods = self._expand_schedule(horizon_schedule)
+            lookahead_days = sum(self.periods)
+        else:
+            self.periods = [1] * lookahead_days
         self.lookahead_days = lookahead_days
         self.carryover_cost = carryover_cost
-        self.base_solver = LinearProgrammingSolver()  # Use LP solver for expanded graph
-        
-        # Cache for future data (perfect foresight)
-        self.future_inflows = {}  # {node_id: [inflow_t0, inflow_t1, ...]}
-        self.future_demands = {}  # {node_id: [demand_t0, demand_t1, ...]}
+        self.time_limit = time_limit
+        self.reoptimize_every = reoptimize_every
+        self.reoptimize_tolerance = reoptimize_tolerance
+        if reoptimize_every > 1 and self.periods[:2] != [1, 1]:
+            logger.warning(
+                f"reoptimize_every={reoptimize_every} has no effect: plans are only kept for "
+                f"one-day periods after the first, and this horizon has none"
+            )
+        # Use LP solver for expanded graph
+        self.base_solver = LinearProgrammingSolver(compute_duals=compute_duals)
+        self.last_duals: Optional[Dict[str, Dict[str, float]]] = None
+        
+        # Time budget fallbacks
+        self.last_fallback: Optional[str] = None
+        self.fallback_counts = {name: 0 for name in self.FALLBACKS}
+        self._previous_flows: Dict[str, float] = {}
+        
+        # Plan of the last horizon solve, one entry per day
+        self._plan: List[Dict[str, dict]] = []
+        self._plan_day = 0
+        self._plan_evaporation: Dict[str, float] = {}  # storage node_id -> evaporated since the plan
+        self.reoptimization_count = 0
+        self.plan_reuse_count = 0
+        
+        # Future data (perfect foresight), windowed from the current timestep
+        self.future_inflows = RollingFutureData()  # {node_id: [inflow_t0, inflow_t1, ...]}
+        self.future_demands = RollingFutureData()  # {node_id: [demand_t0, demand_t1, ...]}
         self.future_climate = []  # [climate_t0, climate_t1, ...]
     
+    @staticmethod
+    def _expand_schedule(horizon_schedule: List[Tuple[int, int]]) -> List[int]:
+        """
+        Expand (period_days, num_periods) blocks into a list of period lengths.
+        
+        Raises:
+            ValueError: If the schedule is empty, has non-positive entries or
+                        does not start with a one-day period
+        """
+        periods = []
+        for entry in horizon_schedule:
+            if not isinstance(entry, (tuple, list)) or len(entry) != 2 or any(
+                    isinstance(value, bool) or not isinstance(value, (int, float))
+                    or not math.isfinite(value) or value != int(value) or value < 1
+                    for value in entry):
+                raise ValueError(
+                    f"horizon_schedule entries must be (period_days, num_periods) "
+                    f"with positive integers, got {entry}"
+                )
+            period_days, num_periods = entry
+            periods.extend([int(period_days)] * int(num_periods))
+        if not periods:
+            raise ValueError("horizon_schedule must contain at least one period")
+        if periods[0] != 1:
+            raise ValueError(
+                f"horizon_schedule must start with a one-day period, got {periods[0]} days"
+            )
+        return periods
+    
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Solve counters of the LP solver, fallbacks, re-solves and plan reuses."""
+        return {
+            **self.base_solver.stats,
+            **{f"fallback_{name}": count for name, count in self.fallback_counts.items()},
+            'reoptimizations': self.reoptimization_count,
+            'plan_reuses': self.plan_reuse_count,
+        }
+    
+    def close(self) -> None:
+        """Release the worker threads of the LP solver."""
+        self.base_solver.close()
+    
     def set_future_data(self, future_inflows: Dict[str, List[float]], 
                        future_demands: Dict[str, List[float]],
                        future_climate: List[any] = None):
         """
         Set future data for perfect foresight optimization.
         
+        The series are copied into NumPy arrays once, with the cursor at the
+        first value (the current timestep).
+        
         Args:
             future_inflows: Dict mapping source node_id to list of future inflows
             future_demands: Dict mapping demand node_id to list of future demands  
             future_climate: List of future climate states (optional)
         """
-        self.future_inflows = future_inflows
-        self.future_demands = future_demands
+        self.future_inflows = RollingFutureData(future_inflows)
+        self.future_demands = RollingFutureData(future_demands)
         self.future_climate = future_climate or []
     
+    def advance_future_data(self, steps: int = 1) -> None:
+        """
+        Move the future data window forward by steps timesteps.
+        
+        Args:
+            steps: Number of timesteps that have been simulated
+        """
+        self.future_inflows.advance(steps)
+        self.future_demands.advance(steps)
+    
     def solve(self, nodes: List['Node'], links: List['Link'], 
               constraints: Dict[str, Tuple[float, float, float]]) -> Dict[str, float]:
         """
@@ -181,13 +359,178 @@ class LookaheadSolver(NetworkSolver):
         Returns:
             Dict mapping link_id to allocated flow (only for current timestep)
         """
-        if self.lookahead_days == 1:
+        self.last_fallback = None
+        flows = self._follow_plan(nodes, links, constraints)
+        if flows is not None:
+            self.plan_reuse_count += 1
+        else:
+            self._plan = []
+            self._plan_day = 0
+            self.reoptimization_count += 1
+            if self.time_limit is None:
+                flows = self._solve_horizon(nodes, links, constraints, len(self.periods))
+            else:
+                flows = self._solve_within_time_limit(nodes, links, constraints)
+        self._previous_flows = dict(flows)
+        return flows
+    
+    def _follow_plan(self, nodes: List['Node'], links: List['Link'],
+                     constraints: Dict[str, Tuple[float, float, float]]) -> Optional[Dict[str, float]]:
+        """
+        Take the current timestep's flows from the last horizon plan.
+        
+        Returns:
+            Dict mapping link_id to planned flow, or None if the horizon must
+            be re-solved (plan used up, k days passed or conditions deviate)
+        """
+        if self._plan_day >= min(len(self._plan), self.reoptimize_every):
+            return None
+        
+        entry = self._plan[self._plan_day]
+        
+        def deviates(realised: float, planned: float) -> bool:
+            return abs(realised - planned) > self.reoptimize_tolerance * max(1.0, abs(planned))
+        
+        for node in nodes:
+            if node.node_type == "source":
+                realised, planned = node.inflow, entry['inflows'][node.node_id]
+            elif node.node_type == "demand":
+                realised, planned = node.request, entry['requests'][node.node_id]
+            elif node.node_type == "storage":
+                # Storage before the evaporation the plan does not model
+                realised = node.storage + self._plan_evaporation[node.node_id]
+                planned = entry['storage'][node.node_id]
+            else:
+                continue
+            if deviates(realised, planned):
+                logger.debug(
+                    f"Re-optimizing: {node.node_type} '{node.node_id}' is {realised:.4f}, "
+                    f"planned {planned:.4f}"
+                )
+                return None
+        
+        flows = entry['flows']
+        for link in links:
+            q_min, q_max, _ = constraints[link.link_id]
+            flow = flows[link.link_id]
+            if deviates(min(max(flow, q_min), q_max), flow):
+                logger.debug(f"Re-optimizing: planned flow on '{link.link_id}' is outside its bounds")
+                return None
+        
+        self._plan_day += 1
+        self._record_plan_evaporation(nodes)
+        self.last_duals = entry['duals']
+        return dict(flows)
+    
+    def _solve_within_time_limit(self, nodes: List['Node'], links: List['Link'],
+                                 constraints: Dict[str, Tuple[float, float, float]]) -> Dict[str, float]:
+        """
+        Solve the timestep within time_limit, falling back to cheaper problems.
+        
+        Returns:
+            Dict mapping link_id to allocated flow (only for current timestep)
+        """
+        deadline = time.perf_counter() + self.time_limit
+        
+        n_periods = len(self.periods)
+        attempts = [(None, n_periods)]
+        if 1 < n_periods // 2:
+            attempts.append(('shorter_horizon', n_periods // 2))
+        if n_periods > 1:
+            attempts.append(('myopic', 1))
+        
+        for fallback, horizon in attempts:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            self.base_solver.time_limit = remaining
+            try:
+                flows = self._solve_horizon(nodes, links, constraints, horizon)
+            except SolverTimeLimitError:
+                logger.warning(
+                    f"{horizon}-period solve exceeded the {self.time_limit:.3f} s time budget; "
+                    f"falling back to a cheaper problem"
+                )
+                continue
+            finally:
+                self.base_solver.time_limit = None
+            if fallback is not None:
+                self._record_fallback(fallback)
+            return flows
+        
+        logger.warning("Time budget exhausted; reusing the previous timestep's flows")
+        self._record_fallback('previous_solution')
+        self.last_duals = None
+        return self._scale_previous_flows(nodes, links, constraints)
+    
+    def _record_fallback(self, fallback: str) -> None:
+        """Record the fallback used for the current timestep."""
+        self.last_fallback = fallback
+        self.fallback_counts[fallback] += 1
+    
+    def _scale_previous_flows(self, nodes: List['Node'], links: List['Link'],
+                              constraints: Dict[str, Tuple[float, float, float]]) -> Dict[str, float]:
+        """
+        Reuse the previous timestep's flows, scaled down to today's water.
+        
+        The previous flows are clipped to the current link bounds and then
+        scaled by the largest factor in [0, 1] for which no source or storage
+        node releases more water than it has and no demand receives more than
+        its request. Storage nodes are updated with the resulting balance
+        (water above max_storage is spilled). Minimum flows may be violated
+        by the scaling.
+        
+        Returns:
+            Dict mapping link_id to flow
+        """
+        flows = {}
+        net_outflow = {node.node_id: 0.0 for node in nodes}
+        for link in links:
+            q_min, q_max, _ = constraints[link.link_id]
+            flow = min(max(self._previous_flows.get(link.link_id, 0.0), q_min), q_max)
+            flows[link.link_id] = flow
+            net_outflow[link.source.node_id] += flow
+            net_outflow[link.target.node_id] -= flow
+        
+        scale = 1.0
+        for node in nodes:
+            outflow = net_outflow[node.node_id]
+            if node.node_type == "source":
+                limit = node.inflow
+            elif node.node_type == "storage":
+                limit = max(node.get_available_mass() - node.min_storage, 0.0)
+            elif node.node_type == "demand":
+                outflow, limit = -outflow, node.request
+            else:
+                limit = 0.0
+            if outflow > limit + 1e-9:
+                scale = min(scale, max(limit, 0.0) / outflow)
+        
+        for node in nodes:
+            if node.node_type == "storage":
+                final = node.get_available_mass() - scale * net_outflow[node.node_id]
+                node.update_storage_from_carryover(min(max(final, 0.0), node.max_storage))
+        
+        return {link_id: scale * flow for link_id, flow in flows.items()}
+    
+    def _solve_horizon(self, nodes: List['Node'], links: List['Link'],
+                       constraints: Dict[str, Tuple[float, float, float]],
+                       horizon: int) -> Dict[str, float]:
+        """
+        Solve the current timestep with the first horizon periods.
+        
+        Returns:
+            Dict mapping link_id to allocated flow (only for current timestep)
+        """
+        if horizon == 1:
             # Fallback to myopic behavior for single timestep
-            return self.base_solver.solve(nodes, links, constraints)
+            flows = self.base_solver.solve(nodes, links, constraints)
+            self.last_duals = self.base_solver.last_duals
+            return flows
         
         # Build time-expanded graph
         expanded_nodes, expanded_links, expanded_constraints = self._build_time_expanded_graph(
-            nodes, links, constraints
+            nodes, links, constraints, horizon
         )
         
         # Solve the expanded problem
@@ -200,10 +543,83 @@ class LookaheadSolver(NetworkSolver):
                 original_link_id = link_id[:-3]  # Remove '_t0' suffix
                 current_flows[original_link_id] = flow
         
+        expanded_duals = self.base_solver.last_duals
+        self.last_duals = self._period_duals(expanded_duals, nodes, links, 0)
+        
+        if self.reoptimize_every > 1:
+            self._build_plan(nodes, links, expanded_nodes, expanded_flows, expanded_duals, horizon)
+        
         return current_flows
     
+    @staticmethod
+    def _period_duals(expanded_duals: Optional[Dict[str, Dict[str, float]]],
+                      nodes: List['Node'], links: List['Link'],
+                      t: int) -> Optional[Dict[str, Dict[str, float]]]:
+        """Duals of period t of the expanded problem, keyed by original IDs."""
+        if expanded_duals is None:
+            return None
+        return {
+            'nodes': {node.node_id: expanded_duals['nodes'][f"{node.node_id}_t{t}"] for node in nodes},
+            'links': {link.link_id: expanded_duals['links'][f"{link.link_id}_t{t}"] for link in links},
+            'storage': {
+                node.node_id: expanded_duals['storage'][f"{node.node_id}_t{t}"]
+                for node in nodes if node.node_type == "storage"
+            },
+        }
+    
+    def _build_plan(self, nodes: List['Node'], links: List['Link'],
+                    expanded_nodes: List['Node'], expanded_flows: Dict[str, float],
+                    expanded_duals: Optional[Dict[str, Dict[str, float]]],
+                    horizon: int) -> None:
+        """
+        Keep the planned flows and expected conditions of the leading daily periods.
+        
+        Planned storage at the start of each day follows from the planned
+        flows by mass balance, starting from today's storage. Evaporation is
+        not included; it is tracked as it happens (see _follow_plan).
+        """
+        by_id = {node.node_id: node for node in expanded_nodes}
+        days = 0
+        while days < min(horizon, self.reoptimize_every) and self.periods[days] == 1:
+            days += 1
+        
+        storage = {node.node_id: node.storage for node in nodes if node.node_type == "storage"}
+        plan = []
+        for t in range(days):
+            flows = {link.link_id: expanded_flows.get(f"{link.link_id}_t{t}", 0.0) for link in links}
+            plan.append({
+                'flows': flows,
+                'inflows': {
+                    node.node_id: by_id[f"{node.node_id}_t{t}"].inflow
+                    for node in nodes if node.node_type == "source"
+                },
+                'requests': {
+                    node.node_id: by_id[f"{node.node_id}_t{t}"].request
+                    for node in nodes if node.node_type == "demand"
+                },
+                'storage': dict(storage),
+                'duals': self._period_duals(expanded_duals, nodes, links, t),
+            })
+            for link in links:
+                if link.source.node_id in storage:
+                    storage[link.source.node_id] -= flows[link.link_id]
+                if link.target.node_id in storage:
+                    storage[link.target.node_id] += flows[link.link_id]
+        
+        self._plan = plan
+        self._plan_day = 1
+        self._plan_evaporation = {node_id: 0.0 for node_id in storage}
+        self._record_plan_evaporation(nodes)
+    
+    def _record_plan_evaporation(self, nodes: List['Node']) -> None:
+        """Add today's evaporation, removed from storage after the step, to the plan's total."""
+        for node in nodes:
+            if node.node_type == "storage":
+                self._plan_evaporation[node.node_id] += node.evap_loss
+    
     def _build_time_expanded_graph(self, nodes: List['Node'], links: List['Link'],
-                                  constraints: Dict[str, Tuple[float, float, float]]) \
+                                  constraints: Dict[str, Tuple[float, float, float]],
+                                  horizon: Optional[int] = None) \
                                   -> Tuple[List['Node'], List['Link'], Dict[str, Tuple[float, float, float]]]:
         """
         Build time-expanded graph for multi-timestep optimization.
@@ -215,6 +631,8 @@ class LookaheadSolver(NetworkSolver):
             nodes: Original network nodes
             links: Original network links
             constraints: Original link constraints
+            horizon: Number of periods from the start of the schedule
+                     (default: all periods)
             
         Returns:
             Tuple of (expanded_nodes, expanded_links, expanded_constraints)
@@ -222,6 +640,20 @@ class LookaheadSolver(NetworkSolver):
         from hydrosim.nodes import StorageNode, SourceNode, DemandNode, JunctionNode
         from hydrosim.links import Link
         
+        periods = self.periods if horizon is None else self.periods[:horizon]
+        horizon = len(periods)
+        # First day of each period, counted from the current timestep
+        starts = [sum(periods[:t]) for t in range(horizon)]
+        horizon_days = sum(periods)
+        
+        def aggregate(future: RollingFutureData, node_id: str, t: int, current: float) -> float:
+            """Sum a future series over period t (current value where it ends)."""
+            window = future.window(node_id, horizon_days)
+            if window is None:
+                return current * periods[t]
+            days = window[starts[t]:starts[t] + periods[t]]
+            return float(days.sum()) + current * (periods[t] - len(days))
+        
         expanded_nodes = []
         expanded_links = []
         expanded_constraints = {}
@@ -229,7 +661,7 @@ class LookaheadSolver(NetworkSolver):
         # Create nodes for each timestep
         timestep_nodes = {}  # {timestep: {node_id: node}}
         
-        for t in range(self.lookahead_days):
+        for t in range(horizon):
             timestep_nodes[t] = {}
             
             for node in nodes:
@@ -254,22 +686,17 @@ class LookaheadSolver(NetworkSolver):
                     )
                 
                 elif isinstance(node, SourceNode):
-                    # Source nodes: use future inflow data if available
-                    if node.node_id in self.future_inflows and t < len(self.future_inflows[node.node_id]):
-                        future_inflow = self.future_inflows[node.node_id][t]
-                    else:
-                        future_inflow = node.inflow  # Fallback to current inflow
+                    # Source nodes: future inflow summed over the period
+                    # (current inflow where no future data is available)
+                    future_inflow = aggregate(self.future_inflows, node.node_id, t, node.inflow)
                     
                     # Create a simple source with fixed inflow
                     time_node = SourceNode(time_node_id, None)
                     time_node.inflow = future_inflow
                 
                 elif isinstance(node, DemandNode):
-                    # Demand nodes: use future demand data if available
-                    if node.node_id in self.future_demands and t < len(self.future_demands[node.node_id]):
-                        future_demand = self.future_demands[node.node_id][t]
-                    else:
-                        future_demand = node.request  # Fallback to current demand
+                    # Demand nodes: future demand summed over the period
+                    future_demand = aggregate(self.future_demands, node.node_id, t, node.request)
                     
                     time_node = DemandNode(time_node_id, node.demand_model)
                     time_node.request = future_demand
@@ -285,7 +712,7 @@ class LookaheadSolver(NetworkSolver):
                 expanded_nodes.append(time_node)
         
         # Create links for each timestep
-        for t in range(self.lookahead_days):
+        for t in range(horizon):
             for link in links:
                 # Create time-indexed link
                 time_link_id = f"{link.link_id}_t{t}"
@@ -306,15 +733,16 @@ class LookaheadSolver(NetworkSolver):
                 
                 expanded_links.append(time_link)
                 
-                # Add to constraints
+                # Add to constraints, with daily bounds scaled to the period length
                 if link.link_id in constraints:
-                    expanded_constraints[time_link_id] = constraints[link.link_id]
+                    q_min, q_max, cost = constraints[link.link_id]
                 else:
                     # Default constraints
-                    expanded_constraints[time_link_id] = (0.0, link.physical_capacity, link.cost)
+                    q_min, q_max, cost = 0.0, link.physical_capacity, link.cost
+                expanded_constraints[time_link_id] = (q_min * periods[t], q_max * periods[t], cost)
         
         # Create carryover links between timesteps for storage nodes
-        for t in range(self.lookahead_days - 1):
+        for t in range(horizon - 1):
             for node in nodes:
                 if isinstance(node, StorageNode):
                     # Create carryover link from t to t+1
@@ -342,27 +770,315 @@ class LookaheadSolver(NetworkSolver):
         return expanded_nodes, expanded_links, expanded_constraints
 
 
+class OptimalBasis:
+    """
+    Optimal basis of a network flow LP, re-usable for new bounds and RHS.
+    
+    At an optimum every variable with a non-zero reduced cost sits at a bound
+    (lower if positive, upper if negative). The remaining basic variables are
+    chosen so that their incidence columns form a forest, which makes the
+    basis matrix triangular after reordering. For new bounds and RHS the
+    nonbasic variables are moved to their new bounds and the basic variables
+    are recomputed with a single sparse triangular solve. Costs are unchanged,
+    so the reduced costs are too; if the new basic solution satisfies the
+    mass balance and bounds it is therefore optimal.
+    
+    The dual solution of the LP the basis was taken from stays optimal for
+    every solution recomputed from it, so it is kept alongside the basis.
+    
+    Attributes:
+        c: Cost vector the basis was computed for
+        reduced_costs: Reduced costs at the optimum (None if not given)
+        node_duals: Mass-balance duals at the optimum (None if not given)
+    """
+    
+    TOLERANCE = 1e-7
+    
+    def __init__(self, c, basic, at_upper, rows, matrix, reduced_costs=None, node_duals=None):
+        """
+        Initialize from a computed basis (use from_solution()).
+        
+        Args:
+            c: Cost vector
+            basic: Basic column indices, in elimination order
+            at_upper: Boolean mask of nonbasic columns held at their upper bound
+            rows: Row eliminated for each basic column
+            matrix: Lower-triangular CSR matrix A_eq[rows][:, basic]
+            reduced_costs: Reduced costs of the variables at the optimum
+            node_duals: Duals of the mass-balance rows at the optimum
+        """
+        import numpy as np
+        
+        self.c = np.array(c, dtype=np.float64)
+        self.reduced_costs = reduced_costs
+        self.node_duals = node_duals
+        self.basic = basic
+        self.at_upper = at_upper
+        self.rows = rows
+        self.matrix = matrix
+        self.nonbasic = np.setdiff1d(np.arange(len(c)), basic)
+    
+    @classmethod
+    def from_solution(cls, A_eq, c, lower, upper, x, reduced_costs,
+                      node_duals=None) -> Optional['OptimalBasis']:
+        """
+        Extract a triangular basis from an optimal solution.
+        
+        Args:
+            A_eq: Equality constraint matrix (nodes x variables)
+            c: Cost vector
+            lower: Lower bounds
+            upper: Upper bounds
+            x: Optimal solution
+            reduced_costs: Reduced costs of the variables at the optimum
+            node_duals: Duals of the mass-balance rows at the optimum
+        
+        Returns:
+            OptimalBasis, or None if the zero-reduced-cost variables strictly
+            inside their bounds contain a cycle (the optimal flows are not
+            unique and the basis cannot be recovered from the solution)
+        """
+        import numpy as np
+        from scipy.sparse import csr_matrix
+        
+        n_rows, n_cols = A_eq.shape
+        tol = cls.TOLERANCE
+        zero_cost = np.abs(reduced_costs) <= tol
+        interior = (x > lower + tol) & (x < upper - tol)
+        at_upper = np.where(zero_cost, np.abs(x - upper) <= tol, reduced_costs < 0)
+        
+        # Choose basic columns forming a forest over the rows, with a virtual
+        # ground row (index n_rows) for columns with a single entry. Interior
+        # columns must be basic; degenerate ones are added where they fit.
+        parent = list(range(n_rows + 1))
+        
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        column_rows = [np.flatnonzero(A_eq[:, j]) for j in range(n_cols)]
+        candidates = [j for j in np.flatnonzero(zero_cost & interior)] + \
+                     [j for j in np.flatnonzero(zero_cost & ~interior)]
+        n_interior = int(np.sum(zero_cost & interior))
+        basic = []
+        for k, j in enumerate(candidates):
+            ends = list(column_rows[j]) + [n_rows] * (2 - len(column_rows[j]))
+            a, b = find(ends[0]), find(ends[1])
+            if a == b:
+                if k < n_interior:
+                    return None
+                continue
+            parent[b] = a
+            basic.append(j)
+        
+        # Eliminate leaves: each step resolves the only unresolved basic
+        # column of a row, which orders the basis lower-triangularly
+        row_columns = [[] for _ in range(n_rows)]
+        for j in basic:
+            for r in column_rows[j]:
+                row_columns[r].append(j)
+        remaining = [len(cols) for cols in row_columns]
+        resolved = set()
+        order_columns, order_rows = [], []
+        stack = [r for r in range(n_rows) if remaining[r] == 1]
+        while stack:
+            r = stack.pop()
+            if remaining[r] != 1:
+                continue
+            j = next(col for col in row_columns[r] if col not in resolved)
+            resolved.add(j)
+            order_columns.append(j)
+            order_rows.append(r)
+            for other in column_rows[j]:
+                remaining[other] -= 1
+                if remaining[other] == 1:
+                    stack.append(other)
+        
+        if len(order_columns) != len(basic):
+            return None
+        
+        basic = np.array(order_columns, dtype=np.int64)
+        rows = np.array(order_rows, dtype=np.int64)
+        matrix = csr_matrix(A_eq[np.ix_(rows, basic)])
+        return cls(c, basic, at_upper, rows, matrix, reduced_costs, node_duals)
+    
+    def solve(self, A_eq, b_eq, lower, upper):
+        """
+        Recompute the basic solution for new bounds and RHS.
+        
+        Args:
+            A_eq: Equality constraint matrix (same structure as the basis)
+            b_eq: New right-hand side
+            lower: New lower bounds
+            upper: New upper bounds
+        
+        Returns:
+            Optimal solution vector, or None if the basis is no longer
+            feasible and the LP has to be solved
+        """
+        import numpy as np
+        from scipy.sparse.linalg import spsolve_triangular
+        
+        x = np.where(self.at_upper, upper, lower)
+        x[self.basic] = 0.0
+        if not np.all(np.isfinite(x[self.nonbasic])):
+            return None
+        
+        if len(self.basic):
+            rhs = b_eq[self.rows] - A_eq[self.rows] @ x
+            x[self.basic] = spsolve_triangular(self.matrix, rhs, lower=True)
+        
+        tol = self.TOLERANCE * max(1.0, float(np.max(np.abs(b_eq), initial=0.0)))
+        if np.max(np.abs(A_eq @ x - b_eq), initial=0.0) > tol:
+            return None
+        if np.any(x < lower - tol) or np.any(x > upper + tol):
+            return None
+        return np.clip(x, lower, upper)
+
+
 class LinearProgrammingSolver(NetworkSolver):
     """
     Network flow solver using linear programming.
     
     This solver formulates the minimum cost network flow problem as a linear
     program and solves it using SciPy's linprog optimizer.
+    
+    Networks with storage are often made of several hydraulically independent
+    basins that are only joined by the Universal Sink. With decomposition
+    enabled, the weakly connected components of the physical network are
+    found once (and cached for as long as the topology is unchanged), each
+    component gets its own Universal Sink, and the components are solved as
+    separate LPs. Because every component is balanced on its own, this gives
+    the same optimum as the single combined LP. Components without links are
+    resolved in closed form, and the remaining LPs can be solved on a thread
+    pool (HiGHS releases the GIL while solving). The pool is started on first
+    use and shut down by close() (the solver is also a context manager);
+    SimulationEngine.run() closes its solver when the run ends.
+    
+    Before solving, chains of series links through junctions with a single
+    inflow and outflow are merged into single arcs (see SeriesReduction), so
+    reporting-only junctions do not enlarge the LP.
+    
+    Consecutive days frequently produce exactly the same LP (constant demands,
+    dry spells). Solutions are kept in a small LRU cache keyed by a hash of
+    the compiled problem and reused when the same problem comes up again.
+    
+    With reuse_basis enabled, the optimal basis of each solve is kept as
+    well. Costs rarely change from day to day, so when only bounds and RHS
+    move the old basis stays dual feasible; if the basic solution recomputed
+    for the new data is also primal feasible it is optimal, and HiGHS is
+    skipped (see OptimalBasis).
+    
+    With compute_duals enabled, the shadow prices of every solve are kept in
+    last_duals. Node duals are the marginal value of water at each node: the
+    decrease of the objective per additional unit of water at the node,
+    measured against water leaving through the Universal Sink. Link duals are
+    the reduced costs of the flows, which are non-zero only for links held at
+    a bound: negative at the upper bound (the objective decrease per unit of
+    extra capacity) and positive at the lower bound. Storage duals are the
+    reduced costs of the carryover links, i.e. the marginal value of
+    max_storage (negative) or min_storage (positive).
+    
+    Attributes:
+        decompose: Whether to solve connected components separately
+        max_workers: Number of threads used to solve components (1 = serial)
+        presolve: Whether to merge series links before solving
+        cache_size: Maximum number of cached LP solutions (0 = no caching)
+        reuse_basis: Whether to re-use the previous optimal basis
+        compute_duals: Whether to keep node and link duals of each solve
+        time_limit: Wall-clock limit in seconds for each solve(), shared by
+                    all of its LPs (None for no limit)
+        last_duals: Dict with 'nodes', 'links' and 'storage' mapping node,
+                    link and storage node IDs to their duals in the last
+                    solve (None unless compute_duals is enabled)
+        stats: Counters of LP solves, solution cache hits/misses and basis
+               reuses
     """
     
-    def __init__(self):
+    # Number of LP structures (e.g. network components) whose basis is kept
+    MAX_STORED_BASES = 256
+    
+    def __init__(self, decompose: bool = True, max_workers: int = 1,
+                 presolve: bool = True, cache_size: int = 64,
+                 reuse_basis: bool = False, compute_duals: bool = False,
+                 time_limit: Optional[float] = None):
         """
         Initialize the linear programming solver.
         
         Validates that cost constants maintain the correct hierarchy.
         
+        Args:
+            decompose: Solve weakly connected components of the network as
+                       independent LPs (only applies to networks with storage)
+            max_workers: Number of threads used to solve components
+            presolve: Merge series links through pass-through junctions
+                      before solving (see hydrosim.presolve)
+            cache_size: Number of solved LPs kept for reuse (0 disables)
+            reuse_basis: Keep the last optimal basis and only call HiGHS when
+                         it is no longer feasible for the new bounds and RHS
+            compute_duals: Record node and link duals of each solve in
+                           last_duals
+            time_limit: Time limit in seconds for each solve(); the time
+                        left is passed to HiGHS for every LP, and running
+                        out of time raises SolverTimeLimitError
+        
         Raises:
             ConfigurationError: If cost hierarchy is violated
+            ValueError: If max_workers is less than 1, cache_size is negative
+                        or time_limit is not positive
         """
         validate_cost_hierarchy()
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be non-negative, got {cache_size}")
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError(f"time_limit must be positive, got {time_limit}")
+        self.decompose = decompose
+        self.max_workers = max_workers
+        self.presolve = presolve
+        self.cache_size = cache_size
+        self.time_limit = time_limit
+        self._deadline: Optional[float] = None
+        self._executor = None
+        
+        # LRU cache of solution vectors keyed by a hash of the compiled LP
+        self._solution_cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'lp_solves': 0, 'cache_hits': 0, 'cache_misses': 0, 'basis_reuses': 0}
+        
+        # Last optimal basis per LP structure
+        self.reuse_basis = reuse_basis
+        self._bases: OrderedDict = OrderedDict()
+        
+        # Shadow prices of the last solve
+        self.compute_duals = compute_duals
+        self.last_duals: Optional[Dict[str, Dict[str, float]]] = None
+        
+        # Series-link reduction, rebuilt only when the topology changes
+        self._reduction_key = None
+        self._reduction = None
+        
+        # Component cache: topology key -> list of (node indices, link indices)
+        self._component_key = None
+        self._component_cache = None
+    
+    def close(self) -> None:
+        """
+        Shut down the component thread pool.
+        
+        The solver stays usable; a new pool is started by the next solve
+        that needs one.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
     
     def _create_virtual_network(self, nodes: List['Node'], links: List['Link'],
-                                constraints: Dict[str, Tuple[float, float, float]]) \
+                                constraints: Dict[str, Tuple[float, float, float]],
+                                always_sink: bool = False) \
                                 -> Tuple[List['Node'], List['Link'], Dict[str, Tuple[float, float, float]]]:
         """
         Create virtual network using Universal Sink pattern for storage drawdown.
@@ -383,6 +1099,9 @@ class LinearProgrammingSolver(NetworkSolver):
             nodes: List of all nodes in the network
             links: List of all links in the network
             constraints: Dict mapping link_id to (q_min, q_max, cost)
+            always_sink: Create the Universal Sink even if these nodes contain
+                         no storage (used for components of a network that
+                         has storage elsewhere)
         
         Returns:
             Tuple of (augmented_nodes, augmented_links, augmented_constraints)
@@ -410,7 +1129,7 @@ class LinearProgrammingSolver(NetworkSolver):
                 storage_nodes.append(node)
         
         # Only create virtual network if there are storage nodes
-        if not storage_nodes:
+        if not storage_nodes and not always_sink:
             return augmented_nodes, augmented_links, augmented_constraints
         
         # Create the Universal Sink
@@ -496,7 +1215,8 @@ class LinearProgrammingSolver(NetworkSolver):
         return augmented_nodes, augmented_links, augmented_constraints
     
     def _solve_lp(self, nodes: List['Node'], links: List['Link'], 
-                  constraints: Dict[str, Tuple[float, float, float]]) -> Dict[str, float]:
+                  constraints: Dict[str, Tuple[float, float, float]],
+                  duals: Optional[Dict[str, Dict[str, float]]] = None) -> Dict[str, float]:
         """
         Solve minimum cost network flow problem using linear programming.
         
@@ -514,12 +1234,16 @@ class LinearProgrammingSolver(NetworkSolver):
             nodes: List of all nodes (including virtual sinks)
             links: List of all links (including carryover links)
             constraints: Dict mapping link_id to (q_min, q_max, cost)
+            duals: Optional dict with 'nodes' and 'links' dicts that receive
+                   the node and link duals of the solve (node duals are
+                   shifted so that the Universal Sink has dual 0)
         
         Returns:
             Dict mapping link_id to allocated flow (includes carryover links)
         
         Raises:
             RuntimeError: If the optimization problem is infeasible or unbounded
+            SolverTimeLimitError: If HiGHS stops at the time limit
         """
         # Lazy imports to avoid compatibility issues
         import numpy as np
@@ -552,6 +1276,8 @@ class LinearProgrammingSolver(NetworkSolver):
         # Standard min-cost flow: inflow - outflow = b
         A_eq = np.zeros((n_nodes, n_links))
         b_eq = np.zeros(n_nodes)
+        source_rows = np.empty(n_links, dtype=np.int64)
+        target_rows = np.empty(n_links, dtype=np.int64)
         
         # Build constraint matrix by iterating through links
         # This approach works for both physical links (which are in node.inflows/outflows)
@@ -567,6 +1293,8 @@ class LinearProgrammingSolver(NetworkSolver):
             
             source_idx = node_indices[source_node_id]
             target_idx = node_indices[target_node_id]
+            source_rows[link_idx] = source_idx
+            target_rows[link_idx] = target_idx
             
             # Flow leaves source node (negative contribution)
             A_eq[source_idx, link_idx] = -1.0
@@ -671,37 +1399,182 @@ class LinearProgrammingSolver(NetworkSolver):
         A_ub = None
         b_ub = None
         
-        # Solve the linear program
-        result = linprog(
-            c=c,
-            A_eq=A_eq,
-            b_eq=b_eq,
-            A_ub=A_ub,
-            b_ub=b_ub,
-            bounds=bounds,
-            method='highs'
-        )
-        
-        # Check if solution was found
-        if not result.success:
-            # Diagnose potential issues
-            conflicting_constraints = self._diagnose_infeasibility(
-                nodes, links, constraints, A_eq, b_eq, bounds
+        # Identical problems (same structure, costs, bounds and RHS) have the
+        # same solution, so reuse it instead of calling HiGHS again
+        structure_key = None
+        cache_key = None
+        solution = None
+        if self.cache_size or self.reuse_basis:
+            structure_key = self._structure_key(source_rows, target_rows, A_eq[:, n_links:])
+        if self.cache_size:
+            cache_key = self._problem_key(structure_key, c, bounds, b_eq)
+            solution = self._cache_lookup(cache_key)
+        
+        if solution is None and self.reuse_basis:
+            lower, upper = self._bound_arrays(bounds)
+            basis = self._bases.get(structure_key)
+            if basis is not None and np.array_equal(basis.c, c):
+                x = basis.solve(A_eq, b_eq, lower, upper)
+                if x is not None:
+                    # The stored duals remain optimal for the new solution
+                    solution = (x, basis.node_duals, basis.reduced_costs)
+                    with self._lock:
+                        self.stats['basis_reuses'] += 1
+                    if cache_key is not None:
+                        self._cache_store(cache_key, solution)
+        
+        if solution is None:
+            # Solve the linear program
+            options = {}
+            if self._deadline is not None:
+                remaining = self._deadline - time.perf_counter()
+                if remaining <= 0:
+                    raise SolverTimeLimitError(self.time_limit, "no time left for this LP")
+                options['time_limit'] = remaining
+            result = linprog(
+                c=c,
+                A_eq=A_eq,
+                b_eq=b_eq,
+                A_ub=A_ub,
+                b_ub=b_ub,
+                bounds=bounds,
+                method='highs',
+                options=options
             )
+            with self._lock:
+                self.stats['lp_solves'] += 1
             
-            raise InfeasibleNetworkError(
-                result.message,
-                conflicting_constraints
-            )
+            # Status 1: iteration or time limit reached
+            if result.status == 1 and self._deadline is not None:
+                raise SolverTimeLimitError(self.time_limit, result.message)
+            
+            # Check if solution was found
+            if not result.success:
+                # Diagnose potential issues
+                conflicting_constraints = self._diagnose_infeasibility(
+                    nodes, links, constraints, A_eq, b_eq, bounds
+                )
+                
+                raise InfeasibleNetworkError(
+                    result.message,
+                    conflicting_constraints
+                )
+            
+            x = result.x
+            reduced_costs = result.lower.marginals + result.upper.marginals
+            solution = (x, result.eqlin.marginals, reduced_costs)
+            if cache_key is not None:
+                self._cache_store(cache_key, solution)
+            if self.reuse_basis:
+                basis = OptimalBasis.from_solution(
+                    A_eq, c, lower, upper, x, reduced_costs, result.eqlin.marginals
+                )
+                with self._lock:
+                    if basis is None:
+                        self._bases.pop(structure_key, None)
+                    else:
+                        self._bases[structure_key] = basis
+                        self._bases.move_to_end(structure_key)
+                        if len(self._bases) > self.MAX_STORED_BASES:
+                            self._bases.popitem(last=False)
+        
+        x, node_duals, reduced_costs = solution
         
         # Extract flow allocations (includes carryover links)
         flow_allocations = {}
         for link in links:
             link_idx = link_indices[link.link_id]
-            flow_allocations[link.link_id] = result.x[link_idx]
+            flow_allocations[link.link_id] = x[link_idx]
+        
+        if duals is not None:
+            # Duals are unique up to a constant per balanced network;
+            # measure them against the Universal Sink
+            for node in nodes:
+                if node.node_type == "virtual_sink":
+                    node_duals = node_duals - node_duals[node_indices[node.node_id]]
+                    break
+            for node in nodes:
+                duals['nodes'][node.node_id] = float(node_duals[node_indices[node.node_id]])
+            for link in links:
+                duals['links'][link.link_id] = float(reduced_costs[link_indices[link.link_id]])
         
         return flow_allocations
     
+    @staticmethod
+    def _structure_key(source_rows, target_rows, slack) -> bytes:
+        """
+        Hash the structure of a compiled LP.
+        
+        The incidence structure is fully described by the source and target
+        row of each link plus the optional slack column, so the constraint
+        matrix itself does not need to be hashed.
+        
+        Returns:
+            16-byte BLAKE2b digest
+        """
+        import numpy as np
+        
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.int64(len(slack)).tobytes())
+        for array in (source_rows, target_rows):
+            digest.update(array.tobytes())
+        digest.update(np.ascontiguousarray(slack).tobytes())
+        return digest.digest()
+    
+    @staticmethod
+    def _problem_key(structure_key: bytes, c, bounds, b_eq) -> bytes:
+        """
+        Hash a compiled LP (structure, costs, bounds and RHS).
+        
+        Returns:
+            16-byte BLAKE2b digest
+        """
+        import numpy as np
+        
+        digest = hashlib.blake2b(structure_key, digest_size=16)
+        digest.update(np.asarray(c, dtype=np.float64).tobytes())
+        digest.update(np.array(bounds, dtype=np.float64).tobytes())
+        digest.update(np.asarray(b_eq, dtype=np.float64).tobytes())
+        return digest.digest()
+    
+    @staticmethod
+    def _bound_arrays(bounds):
+        """Convert linprog bounds to lower and upper arrays (None -> ∓inf)."""
+        import numpy as np
+        
+        lower = np.array([-np.inf if lo is None else lo for lo, _ in bounds], dtype=np.float64)
+        upper = np.array([np.inf if hi is None else hi for _, hi in bounds], dtype=np.float64)
+        return lower, upper
+    
+    def _cache_lookup(self, key: bytes):
+        """Return a cached (x, node duals, reduced costs) tuple and update the hit/miss counters."""
+        with self._lock:
+            solution = self._solution_cache.get(key)
+            if solution is None:
+                self.stats['cache_misses'] += 1
+            else:
+                self._solution_cache.move_to_end(key)
+                self.stats['cache_hits'] += 1
+            return solution
+    
+    def _cache_store(self, key: bytes, solution) -> None:
+        """Store a solution tuple, evicting the least recently used entry."""
+        arrays = []
+        for array in solution:
+            array = array.copy()
+            array.flags.writeable = False
+            arrays.append(array)
+        with self._lock:
+            self._solution_cache[key] = tuple(arrays)
+            if len(self._solution_cache) > self.cache_size:
+                self._solution_cache.popitem(last=False)
+    
+    def clear_cache(self) -> None:
+        """Discard all cached solutions and stored bases."""
+        with self._lock:
+            self._solution_cache.clear()
+            self._bases.clear()
+    
     def _update_storage_from_carryover(self, nodes: List['Node'],
                                        flow_allocations: Dict[str, float]) -> None:
         """
@@ -752,16 +1625,48 @@ class LinearProgrammingSolver(NetworkSolver):
         
         Raises:
             RuntimeError: If the optimization problem is infeasible or unbounded
+            SolverTimeLimitError: If the LPs do not finish within time_limit
         """
-        # Call _create_virtual_network() to get augmented components
-        augmented_nodes, augmented_links, augmented_constraints = \
-            self._create_virtual_network(nodes, links, constraints)
-        
-        # Call _solve_lp() with augmented components
-        flow_allocations = self._solve_lp(
-            augmented_nodes, augmented_links, augmented_constraints
+        key = self._topology_key(nodes, links) if (self.presolve or self.decompose) else None
+        duals = {'nodes': {}, 'links': {}} if self.compute_duals else None
+        self.last_duals = None
+        self._deadline = (
+            time.perf_counter() + self.time_limit if self.time_limit is not None else None
         )
         
+        # Merge series links through pass-through junctions
+        reduction = self._get_reduction(nodes, links, key) if self.presolve else None
+        if reduction is not None and reduction.chains:
+            solve_nodes, solve_links, solve_constraints = \
+                reduction.reduce(nodes, links, constraints)
+        else:
+            reduction = None
+            solve_nodes, solve_links, solve_constraints = nodes, links, constraints
+        
+        components = self._find_components(solve_nodes, solve_links, key) if self.decompose else None
+        
+        if components is not None and len(components) > 1:
+            flow_allocations = self._solve_components(
+                solve_nodes, solve_links, solve_constraints, components, duals
+            )
+        else:
+            # Call _create_virtual_network() to get augmented components
+            augmented_nodes, augmented_links, augmented_constraints = \
+                self._create_virtual_network(solve_nodes, solve_links, solve_constraints)
+            
+            # Call _solve_lp() with augmented components
+            flow_allocations = self._solve_lp(
+                augmented_nodes, augmented_links, augmented_constraints, duals
+            )
+        
+        if reduction is not None:
+            flow_allocations = reduction.expand_flows(flow_allocations, links)
+            if duals is not None:
+                reduction.expand_duals(duals, links, constraints)
+            ordered = {link.link_id: flow_allocations[link.link_id] for link in links}
+            ordered.update(flow_allocations)
+            flow_allocations = ordered
+        
         # Extract physical flows (exclude virtual links)
         # Virtual links include:
         # - Carryover links (ending with "_carryover")
@@ -776,9 +1681,223 @@ class LinearProgrammingSolver(NetworkSolver):
         # Call _update_storage_from_carryover() to update storage nodes
         self._update_storage_from_carryover(nodes, flow_allocations)
         
+        if duals is not None:
+            self.last_duals = {
+                'nodes': {node.node_id: duals['nodes'].get(node.node_id, 0.0) for node in nodes},
+                'links': {link.link_id: duals['links'].get(link.link_id, 0.0) for link in links},
+                'storage': {
+                    node.node_id: duals['links'].get(f"{node.node_id}_carryover", 0.0)
+                    for node in nodes if node.node_type == "storage"
+                },
+            }
+        
         # Return physical flows only
         return physical_flows
     
+    @staticmethod
+    def _topology_key(nodes: List['Node'], links: List['Link']) -> tuple:
+        """Key identifying a network topology (node IDs and link endpoints)."""
+        return (
+            tuple(node.node_id for node in nodes),
+            tuple((link.link_id, link.source.node_id, link.target.node_id) for link in links),
+        )
+    
+    def _get_reduction(self, nodes: List['Node'], links: List['Link'],
+                       key: tuple) -> SeriesReduction:
+        """
+        Return the series-link reduction for a topology, building it once.
+        
+        Args:
+            nodes: List of all nodes in the network
+            links: List of all links in the network
+            key: Topology key from _topology_key()
+        
+        Returns:
+            SeriesReduction for the network
+        """
+        if key != self._reduction_key:
+            self._reduction = SeriesReduction(nodes, links)
+            self._reduction_key = key
+        return self._reduction
+    
+    def _find_components(self, nodes: List['Node'], links: List['Link'],
+                         key: tuple) -> Optional[List[Tuple[List[int], List[int]]]]:
+        """
+        Find the weakly connected components of the physical network.
+        
+        Components are only independent when every one of them drains into
+        its own Universal Sink, i.e. when the network has storage. Networks
+        without storage are balanced with a single slack variable and are
+        always solved as one LP.
+        
+        The result is cached and reused while the node and link IDs (and link
+        endpoints) are unchanged, so the search runs once per network.
+        
+        Args:
+            nodes: List of all nodes in the network
+            links: List of all links in the network
+            key: Topology key of the network the nodes and links come from
+        
+        Returns:
+            List of (node indices, link indices) per component, or None if
+            the network has no storage nodes
+        """
+        if not any(node.node_type == "storage" for node in nodes):
+            return None
+        
+        if key == self._component_key:
+            return self._component_cache
+        
+        # Union-find over node indices
+        node_indices = {node.node_id: i for i, node in enumerate(nodes)}
+        parent = list(range(len(nodes)))
+        
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        for link in links:
+            a = find(node_indices[link.source.node_id])
+            b = find(node_indices[link.target.node_id])
+            if a != b:
+                parent[b] = a
+        
+        groups: Dict[int, Tuple[List[int], List[int]]] = {}
+        for i in range(len(nodes)):
+            groups.setdefault(find(i), ([], []))[0].append(i)
+        for j, link in enumerate(links):
+            groups[find(node_indices[link.source.node_id])][1].append(j)
+        
+        components = list(groups.values())
+        self._component_key = key
+        self._component_cache = components
+        logger.debug(f"Network decomposed into {len(components)} connected component(s)")
+        return components
+    
+    def _solve_components(self, nodes: List['Node'], links: List['Link'],
+                          constraints: Dict[str, Tuple[float, float, float]],
+                          components: List[Tuple[List[int], List[int]]],
+                          duals: Optional[Dict[str, Dict[str, float]]] = None) -> Dict[str, float]:
+        """
+        Solve each connected component with its own Universal Sink.
+        
+        Args:
+            nodes: List of all nodes in the network
+            links: List of all links in the network
+            constraints: Dict mapping link_id to (q_min, q_max, cost)
+            components: Components from _find_components()
+            duals: Optional dict with 'nodes' and 'links' dicts that receive
+                   the duals of every component
+        
+        Returns:
+            Dict mapping link_id to allocated flow (includes virtual links)
+        
+        Raises:
+            InfeasibleNetworkError: If any component is infeasible
+        """
+        flow_allocations: Dict[str, float] = {}
+        problems = []
+        
+        for node_idx, link_idx in components:
+            sub_nodes = [nodes[i] for i in node_idx]
+            if not link_idx:
+                isolated = self._solve_isolated(sub_nodes, duals)
+                if isolated is not None:
+                    flow_allocations.update(isolated)
+                    continue
+                if any(node.node_type == "source" and abs(node.inflow) > 1e-9 for node in sub_nodes):
+                    # Its virtual network has no links, so the LP would return
+                    # early; the combined LP is infeasible for the same reason
+                    raise InfeasibleNetworkError(
+                        "source inflow has no path to a sink",
+                        self._diagnose_infeasibility(sub_nodes, [], {}, None, None, None)
+                    )
+            sub_links = [links[j] for j in link_idx]
+            sub_constraints = {link.link_id: constraints[link.link_id] for link in sub_links}
+            problems.append(self._create_virtual_network(
+                sub_nodes, sub_links, sub_constraints, always_sink=True
+            ))
+        
+        # Each component records its duals separately (its own sink is the
+        # reference), so worker threads never share a dict
+        component_duals = [
+            {'nodes': {}, 'links': {}} if duals is not None else None for _ in problems
+        ]
+        if self.max_workers > 1 and len(problems) > 1:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            solutions = self._executor.map(
+                lambda p, d: self._solve_lp(*p, d), problems, component_duals
+            )
+        else:
+            solutions = (
+                self._solve_lp(*problem, d) for problem, d in zip(problems, component_duals)
+            )
+        
+        for solution in solutions:
+            flow_allocations.update(solution)
+        if duals is not None:
+            for d in component_duals:
+                duals['nodes'].update(d['nodes'])
+                duals['links'].update(d['links'])
+        
+        # Same ordering as the combined solve: physical links first
+        ordered = {link.link_id: flow_allocations[link.link_id] for link in links}
+        ordered.update(flow_allocations)
+        return ordered
+    
+    @staticmethod
+    def _solve_isolated(nodes: List['Node'],
+                        duals: Optional[Dict[str, Dict[str, float]]] = None) \
+            -> Optional[Dict[str, float]]:
+        """
+        Closed-form allocation for a component without physical links.
+        
+        An isolated storage node keeps as much water as it can and spills the
+        rest; isolated demand nodes receive nothing. Components whose LP would
+        be infeasible (a source with inflow, storage below dead pool) return
+        None; the caller raises InfeasibleNetworkError for them (directly for
+        sources, whose virtual network has no links, or through the LP).
+        
+        Args:
+            nodes: Nodes of the component
+            duals: Optional dict with 'nodes' and 'links' dicts that receive
+                   the duals of the component (only written on success)
+        
+        Returns:
+            Dict mapping virtual link_id to flow, or None if an LP is needed
+        """
+        flows = {}
+        node_duals = {}
+        for node in nodes:
+            node_duals[node.node_id] = 0.0
+            if node.node_type == "storage":
+                available = node.get_available_mass()
+                if available < node.min_storage - 1e-9:
+                    return None
+                carryover = min(available, node.max_storage)
+                flows[f"{node.node_id}_carryover"] = carryover
+                flows[f"{node.node_id}_spillway"] = available - carryover
+                # Another unit of water is stored while there is room, else spilled
+                node_duals[node.node_id] = -COST_STORAGE if available < node.max_storage else -COST_SPILL
+            elif node.node_type == "demand":
+                flows[f"{node.node_id}_to_sink"] = 0.0
+            elif node.node_type == "source" and abs(node.inflow) > 1e-9:
+                return None
+        
+        if duals is not None:
+            duals['nodes'].update(node_duals)
+            for node in nodes:
+                value = node_duals[node.node_id]
+                if node.node_type == "storage":
+                    duals['links'][f"{node.node_id}_carryover"] = COST_STORAGE + value
+                    duals['links'][f"{node.node_id}_spillway"] = COST_SPILL + value
+                elif node.node_type == "demand":
+                    duals['links'][f"{node.node_id}_to_sink"] = 0.0
+        return flows
+    
     def _diagnose_infeasibility(self, nodes: List['Node'], links: List['Link'],
                                 constraints: Dict[str, Tuple[float, float, float]],
                                 A_eq, b_eq, bounds) -> List[str]:
@@ -841,8 +1960,12 @@ class LinearProgrammingSolver(NetworkSolver):
                     )
                 else:
                     # Check if inflow capacity is sufficient
+                    # Links merged by presolve or outside this component are
+                    # not in constraints; use their physical capacity instead
                     max_inflow = sum(
-                        constraints[link.link_id][1] for link in node.inflows
+                        constraints[link.link_id][1] if link.link_id in constraints
+                        else link.physical_capacity
+                        for link in node.inflows
                     )
                     if max_inflow < node.request - 1e-6:
                         diagnostics.append(
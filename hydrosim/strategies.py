@@ -52,9 +52,12 @@ during each simulation timestep to calculate inflows and demands.
 """
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Union
 from dataclasses import dataclass
+from pathlib import Path
+import numpy as np
 import pandas as pd
+from hydrosim.timeseries_io import load_npy_table
 
 if TYPE_CHECKING:
     from hydrosim.climate import ClimateState
@@ -119,21 +122,81 @@ class GeneratorStrategy(ABC):
         pass
 
 
+def _map_npy_column(filepath: str, column: str) -> np.ndarray:
+    """Memory-map a binary time series table and return one column view."""
+    values, columns, _ = load_npy_table(filepath)
+    if column not in columns:
+        raise ValueError(f"Column '{column}' not found in {filepath}")
+    return values[:, columns.index(column)]
+
+
 class TimeSeriesStrategy(GeneratorStrategy):
-    """Read inflows from time series data."""
+    """
+    Read inflows from time series data.
+    
+    Values are held as a 1-D float array. When the array comes from a shared
+    source (e.g. a TimeSeriesFileRegistry) it is used as-is without copying,
+    so many strategies can reference columns of the same file.
+    
+    Strategies backed by a memory-mapped binary table record its path in
+    source_path; when pickled (e.g. sent to a worker process) only the path
+    is stored and the column is mapped again on load.
+    """
     
-    def __init__(self, data: pd.DataFrame, column: str):
+    def __init__(self, data: Union[pd.DataFrame, np.ndarray], column: str,
+                 source_path: Optional[str] = None):
         """
         Initialize time series strategy.
         
         Args:
-            data: DataFrame containing time series data
+            data: DataFrame containing time series data, or a 1-D array of
+                  values for the column (used without copying if float64)
             column: Column name containing inflow values
+            source_path: Binary .npy table the values are mapped from, if any
         """
-        self.data = data
+        if isinstance(data, pd.DataFrame):
+            values = data[column].to_numpy(dtype=np.float64)
+        else:
+            values = np.asarray(data, dtype=np.float64)
+        self.values = values
         self.column = column
+        self.source_path = source_path
         self.current_index = 0
     
+    @classmethod
+    def from_npy(cls, filepath: str, column: str) -> 'TimeSeriesStrategy':
+        """
+        Create a strategy backed by one column of a memory-mapped binary table.
+        
+        Args:
+            filepath: Path to .npy table written by convert_csv_to_npy()
+            column: Column name containing inflow values
+        
+        Returns:
+            TimeSeriesStrategy whose values are a read-only view of the mapping
+        
+        Raises:
+            ValueError: If the column is not in the table
+        """
+        path = str(Path(filepath).resolve())
+        return cls(_map_npy_column(path, column), column, source_path=path)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        if self.source_path is not None:
+            state['values'] = None
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if self.values is None:
+            self.values = _map_npy_column(self.source_path, self.column)
+    
+    @property
+    def data(self) -> pd.DataFrame:
+        """Time series as a single-column DataFrame."""
+        return pd.DataFrame({self.column: self.values})
+    
     def generate(self, climate: 'ClimateState') -> float:
         """
         Generate inflow by reading from time series.
@@ -144,14 +207,14 @@ class TimeSeriesStrategy(GeneratorStrategy):
         Returns:
             Inflow volume from time series
         """
-        if self.current_index >= len(self.data):
+        if self.current_index >= len(self.values):
             raise IndexError(f"Time series data exhausted at index {self.current_index}")
         
-        value = self.data.iloc[self.current_index][self.column]
+        value = self.values[self.current_index]
         self.current_index += 1
         return float(value)
     
-    def get_future_values(self, num_timesteps: int) -> List[float]:
+    def get_future_values(self, num_timesteps: int) -> np.ndarray:
         """
         Get future values for look-ahead optimization.
         
@@ -159,25 +222,18 @@ class TimeSeriesStrategy(GeneratorStrategy):
             num_timesteps: Number of future timesteps to extract
             
         Returns:
-            List of future inflow values
-        """
-        future_values = []
-        start_index = self.current_index
-        
-        for i in range(num_timesteps):
-            index = start_index + i
-            if index < len(self.data):
-                value = self.data.iloc[index][self.column]
-                future_values.append(float(value))
-            else:
-                # If we run out of data, repeat the last available value
-                if len(self.data) > 0:
-                    last_value = self.data.iloc[-1][self.column]
-                    future_values.append(float(last_value))
-                else:
-                    future_values.append(0.0)
-        
-        return future_values
+            Read-only NumPy array (not a list) of future inflow values; a
+            view of the series unless it ends within the window
+        """
+        window = self.values[self.current_index:self.current_index + num_timesteps]
+        
+        # If we run out of data, repeat the last available value
+        if len(window) < num_timesteps:
+            pad = float(self.values[-1]) if len(self.values) > 0 else 0.0
+            window = np.concatenate([window, np.full(num_timesteps - len(window), pad)])
+        
+        window.flags.writeable = False
+        return window
 
 
 class HydrologyStrategy(GeneratorStrategy):
@@ -866,7 +922,7 @@ class MunicipalDemand(DemandModel):
         """
         return self.population * self.per_capita_demand
     
-    def get_future_demands(self, num_timesteps: int) -> List[float]:
+    def get_future_demands(self, num_timesteps: int) -> np.ndarray:
         """
         Get future demands for look-ahead optimization.
         
@@ -876,10 +932,10 @@ class MunicipalDemand(DemandModel):
             num_timesteps: Number of future timesteps
             
         Returns:
-            List of future demand values
+            Array of future demand values
         """
         demand_value = self.population * self.per_capita_demand
-        return [demand_value] * num_timesteps
+        return np.full(num_timesteps, demand_value, dtype=np.float64)
 
 
 class AgricultureDemand(DemandModel):
@@ -913,7 +969,7 @@ class AgricultureDemand(DemandModel):
         # Convert from mm to m³: et_crop (mm) * area (m²) / 1000
         return et_crop * self.area / 1000.0
     
-    def get_future_demands(self, num_timesteps: int, future_climate: List = None) -> List[float]:
+    def get_future_demands(self, num_timesteps: int, future_climate: List = None) -> np.ndarray:
         """
         Get future demands for look-ahead optimization.
         
@@ -924,21 +980,17 @@ class AgricultureDemand(DemandModel):
             future_climate: List of future climate states (optional)
             
         Returns:
-            List of future demand values
+            Array of future demand values
         """
         if future_climate and len(future_climate) >= num_timesteps:
             # Use future ET0 values if available
-            future_demands = []
-            for i in range(num_timesteps):
-                climate_state = future_climate[i]
-                et_crop = self.kc * climate_state.et0
-                demand = et_crop * self.area / 1000.0
-                future_demands.append(demand)
-            return future_demands
+            et0 = np.fromiter((future_climate[i].et0 for i in range(num_timesteps)),
+                              dtype=np.float64, count=num_timesteps)
+            return self.kc * et0 * self.area / 1000.0
         else:
             # Fallback to average ET0 if future climate not available
             # Use a reasonable default ET0 value (5 mm/day)
             default_et0 = 5.0
             et_crop = self.kc * default_et0
             demand_value = et_crop * self.area / 1000.0
-            return [demand_value] * num_timesteps
+            return np.full(num_timesteps, demand_value, dtype=np.float64)
@@ -0,0 +1,225 @@
+"""
+Shared loading of time series input files.
+
+Configurations often point many source nodes at different columns of the
+same CSV file. The TimeSeriesFileRegistry reads each file once per parse,
+keeps only the columns that were requested, and hands out read-only NumPy
+views of those columns so that strategies share a single copy of the data.
+
+Very long inputs can instead be stored as memory-mapped binary tables,
+created from CSV files with convert_csv_to_npy(). A table consists of:
+    <name>.npy:          2-D float64 array (timesteps x columns), stored in
+                         column-major order so each column is contiguous
+    <name>.columns.json: Column names (and the date column, if any)
+    <name>.dates.npy:    Dates as datetime64[D] (only if the CSV had dates)
+
+Tables are opened read-only with np.load(mmap_mode='r'), so the data lives in
+the OS page cache and is shared by every process that maps the same file.
+
+Example:
+    >>> registry = TimeSeriesFileRegistry()
+    >>> registry.request('inflows.csv', 'gauge_a')
+    >>> registry.request('inflows.csv', 'gauge_b')
+    >>> a = registry.get_column('inflows.csv', 'gauge_a')  # file read here, once
+    >>> b = registry.get_column('inflows.csv', 'gauge_b')  # served from memory
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+def _sidecar_paths(npy_path: Path) -> Tuple[Path, Path]:
+    """Return the column-list and dates file paths for a binary table."""
+    stem = npy_path.with_suffix('')
+    return Path(f"{stem}.columns.json"), Path(f"{stem}.dates.npy")
+
+
+def npy_table_files(npy_path: Union[str, Path]) -> List[Path]:
+    """
+    List the files that make up a binary time series table.
+    
+    Args:
+        npy_path: Path to the .npy file
+    
+    Returns:
+        Existing files of the table (values, column list and dates)
+    """
+    npy_path = Path(npy_path)
+    return [path for path in (npy_path, *_sidecar_paths(npy_path)) if path.exists()]
+
+
+def convert_csv_to_npy(csv_path: Union[str, Path], output_path: Optional[Union[str, Path]] = None,
+                       date_col: Optional[str] = 'date',
+                       columns: Optional[List[str]] = None) -> Path:
+    """
+    Convert a CSV time series file into a memory-mappable binary table.
+    
+    Args:
+        csv_path: Source CSV file
+        output_path: Destination .npy path (default: CSV path with .npy suffix)
+        date_col: Name of the date column, stored separately as datetime64[D].
+                  Ignored if the CSV has no such column.
+        columns: Numeric columns to convert (default: all columns except the
+                 date column)
+    
+    Returns:
+        Path to the written .npy file
+    
+    Raises:
+        ValueError: If a selected column is missing or not numeric
+    """
+    csv_path = Path(csv_path)
+    output_path = Path(output_path) if output_path else csv_path.with_suffix('.npy')
+    
+    frame = pd.read_csv(csv_path)
+    has_dates = date_col is not None and date_col in frame.columns
+    if columns is None:
+        columns = [name for name in frame.columns if not (has_dates and name == date_col)]
+    missing = [name for name in columns if name not in frame.columns]
+    if missing:
+        raise ValueError(f"Columns {missing} not found in {csv_path}")
+    
+    try:
+        values = np.asfortranarray(frame[columns].to_numpy(dtype=np.float64))
+    except (TypeError, ValueError):
+        raise ValueError(f"Columns {columns} in {csv_path} must all be numeric")
+    
+    columns_path, dates_path = _sidecar_paths(output_path)
+    np.save(output_path, values)
+    if has_dates:
+        np.save(dates_path, pd.to_datetime(frame[date_col]).to_numpy().astype('datetime64[D]'))
+    with open(columns_path, 'w') as f:
+        json.dump({'columns': list(columns), 'date_col': date_col if has_dates else None}, f, indent=2)
+    
+    logger.info(f"Converted {csv_path} to {output_path} ({values.shape[0]} rows, {len(columns)} columns)")
+    return output_path
+
+
+def load_npy_table(npy_path: Union[str, Path],
+                   mmap: bool = True) -> Tuple[np.ndarray, List[str], Optional[np.ndarray]]:
+    """
+    Open a binary time series table written by convert_csv_to_npy().
+    
+    Args:
+        npy_path: Path to the .npy file
+        mmap: Memory-map the arrays read-only instead of loading them
+    
+    Returns:
+        Tuple of (values, column names, dates). values has shape
+        (timesteps, columns); dates is None if the table has no dates.
+    
+    Raises:
+        FileNotFoundError: If the table or its column list is missing
+        ValueError: If the column list does not match the array shape
+    """
+    npy_path = Path(npy_path)
+    columns_path, dates_path = _sidecar_paths(npy_path)
+    if not columns_path.exists():
+        raise FileNotFoundError(f"Column list not found for {npy_path}: {columns_path}")
+    
+    mmap_mode = 'r' if mmap else None
+    values = np.load(npy_path, mmap_mode=mmap_mode)
+    with open(columns_path, 'r') as f:
+        columns = json.load(f)['columns']
+    if values.ndim != 2 or values.shape[1] != len(columns):
+        raise ValueError(
+            f"{npy_path} has shape {values.shape} but {len(columns)} columns are listed"
+        )
+    
+    dates = np.load(dates_path, mmap_mode=mmap_mode) if dates_path.exists() else None
+    return values, columns, dates
+
+
+class TimeSeriesFileRegistry:
+    """
+    Per-parse registry of time series files and their requested columns.
+
+    Columns are announced with request() before loading so that every file
+    can be read in a single pass restricted to the columns actually used.
+    Columns requested only after a file was loaded are read in an additional
+    pass limited to those columns. Binary tables (.npy) are memory-mapped
+    instead of read, and columns are returned as views of the mapping.
+
+    Attributes:
+        reads: Number of file reads performed (for diagnostics)
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._requested: Dict[Path, Set[str]] = {}
+        self._columns: Dict[Path, Dict[str, np.ndarray]] = {}
+        self.reads = 0
+
+    @staticmethod
+    def _key(filepath: Union[str, Path]) -> Path:
+        return Path(filepath).resolve()
+
+    def request(self, filepath: Union[str, Path], column: str) -> None:
+        """
+        Announce that a column of a file will be needed.
+
+        Args:
+            filepath: Path to CSV file
+            column: Column name
+        """
+        self._requested.setdefault(self._key(filepath), set()).add(column)
+
+    def get_column(self, filepath: Union[str, Path], column: str) -> np.ndarray:
+        """
+        Return a read-only view of one column of a file.
+
+        Args:
+            filepath: Path to CSV file or binary .npy table
+            column: Column name
+
+        Returns:
+            1-D float64 array view shared with other callers
+
+        Raises:
+            ValueError: If the column is not present in the file or not numeric
+        """
+        key = self._key(filepath)
+        self.request(key, column)
+        loaded = self._columns.setdefault(key, {})
+
+        if column not in loaded:
+            missing = self._requested[key] - set(loaded)
+            self._read(key, missing, loaded)
+            if column not in loaded:
+                raise ValueError(f"Column '{column}' not found in {filepath}")
+
+        view = loaded[column].view()
+        view.flags.writeable = False
+        return view
+
+    def _read(self, key: Path, columns: Set[str], loaded: Dict[str, np.ndarray]) -> None:
+        """Read the given columns of a file into the loaded-column store."""
+        if key.suffix == '.npy':
+            values, names, _ = load_npy_table(key)
+            self.reads += 1
+            for i, name in enumerate(names):
+                if name in columns:
+                    loaded[name] = values[:, i]
+            return
+        
+        frame = pd.read_csv(key, usecols=lambda name: name in columns)
+        self.reads += 1
+        for name in frame.columns:
+            try:
+                loaded[name] = frame[name].to_numpy(dtype=np.float64)
+            except (TypeError, ValueError):
+                raise ValueError(f"Column '{name}' in {key} is not numeric")
+        logger.debug(f"Loaded {len(frame.columns)} column(s) from {key}")
+
+    def clear(self) -> None:
+        """Release all loaded data."""
+        self._requested.clear()
+        self._columns.clear()
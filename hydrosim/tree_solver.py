@@ -0,0 +1,394 @@
+"""
+Direct allocation for tree-shaped networks.
+
+Many networks are trees: water flows from sources through storages and
+junctions to demands without any loops. On a tree the allocation problem
+solved by LinearProgrammingSolver can be solved exactly without an LP by
+dynamic programming over the tree.
+
+For every subtree the minimum cost is a convex piecewise-linear function of
+the net flow the subtree exports across the link to its parent. These
+functions are built bottom-up (leaves first):
+    - a source exports its inflow
+    - a demand can absorb between 0 and its request at no cost
+    - a storage node exports its available mass and must keep at least its
+      dead pool; water it keeps earns COST_STORAGE up to max_storage and
+      anything beyond that is spilled at COST_SPILL
+    - a link adds its cost per unit of flow and restricts the export to its
+      flow bounds
+    - at a node, the functions of its children are added by merging their
+      slope-sorted segments (infimal convolution)
+Each tree as a whole must export nothing, so the optimum is the root's
+function at zero. The flows are then recovered top-down by splitting each
+node's export among its children in order of increasing marginal cost.
+
+The cost of a solve is linear in the size of the network times the number
+of distinct marginal costs (which is small under the cost hierarchy).
+
+Networks that are not trees, have no storage or cannot be solved this way
+(e.g. infeasible days) are passed to LinearProgrammingSolver, which also
+reports infeasibility. The direct solve does not produce duals, so when the
+fallback solver has compute_duals enabled every timestep goes to the LP.
+
+Example:
+    >>> solver = hs.TreeAllocationSolver()
+    >>> engine = hs.SimulationEngine(network, climate_engine, solver)
+"""
+
+import heapq
+import logging
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from hydrosim.solver import (
+    COST_SPILL,
+    COST_STORAGE,
+    LinearProgrammingSolver,
+    NetworkSolver,
+    validate_cost_hierarchy,
+)
+
+if TYPE_CHECKING:
+    from hydrosim.nodes import Node
+    from hydrosim.links import Link
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Convex piecewise-linear function over [left, left + sum(lengths)]:
+# (left, value at left, [(slope, length), ...] sorted by increasing slope)
+_Function = Tuple[float, float, List[Tuple[float, float]]]
+
+_TOLERANCE = 1e-9
+
+
+def _merge(functions: List[_Function]) -> _Function:
+    """Infimal convolution of convex piecewise-linear functions."""
+    left = sum(f[0] for f in functions)
+    value = sum(f[1] for f in functions)
+    segments: List[Tuple[float, float]] = []
+    for slope, length in heapq.merge(*(f[2] for f in functions)):
+        if segments and segments[-1][0] == slope:
+            segments[-1] = (slope, segments[-1][1] + length)
+        else:
+            segments.append((slope, length))
+    return left, value, segments
+
+
+def _restrict(function: _Function, slope: float, low: float,
+              high: float) -> Optional[_Function]:
+    """Add slope * x to a function and restrict it to [low, high].
+
+    Returns:
+        The new function, or None if the domains do not overlap
+    """
+    left, value, segments = function
+    value += slope * left
+    segments = [(s + slope, length) for s, length in segments]
+
+    right = left + sum(length for _, length in segments)
+    new_left = max(left, low)
+    new_right = min(right, high)
+    if new_right < new_left - _TOLERANCE * max(1.0, abs(new_left)):
+        return None
+    new_right = max(new_right, new_left)
+
+    # Walk from the left end to the new left end
+    skip = new_left - left
+    trimmed = []
+    for s, length in segments:
+        if skip >= length:
+            value += s * length
+            skip -= length
+            continue
+        if skip > 0:
+            value += s * skip
+            length -= skip
+            skip = 0.0
+        trimmed.append((s, length))
+
+    # Cut the total length to the new domain
+    remaining = new_right - new_left
+    kept = []
+    for s, length in trimmed:
+        if remaining <= 0:
+            break
+        kept.append((s, min(length, remaining)))
+        remaining -= length
+    return new_left, value, kept
+
+
+def _split(target: float, merged: _Function,
+           functions: List[_Function]) -> List[float]:
+    """Split a point of a merged function into points of its parts.
+
+    Segments are taken in order of increasing slope, so the parts add up to
+    target at the lowest total cost.
+    """
+    left, _, segments = merged
+    amount = min(max(target - left, 0.0), sum(length for _, length in segments))
+
+    # Slope of the last (possibly partially) used segment; if rounding
+    # leaves a remainder after the last segment, every segment is used
+    threshold = float('inf')
+    remaining_tie = 0.0
+    for slope, length in segments:
+        if amount <= length:
+            threshold = slope
+            remaining_tie = amount
+            break
+        amount -= length
+
+    points = []
+    for f_left, _, f_segments in functions:
+        point = f_left
+        for slope, length in f_segments:
+            if slope > threshold:
+                break
+            if slope < threshold:
+                point += length
+            else:
+                used = min(length, remaining_tie)
+                point += used
+                remaining_tie -= used
+        points.append(point)
+    return points
+
+
+class TreeAllocationSolver(NetworkSolver):
+    """
+    Allocation solver for tree-shaped networks with a linear programming fallback.
+
+    The topology is checked on the first solve (and whenever it changes).
+    If the network is a forest (no cycles when link directions are ignored)
+    and contains storage, each timestep is solved directly by dynamic
+    programming over the trees. Otherwise, and on days the direct solve
+    cannot handle, the fallback LinearProgrammingSolver is used.
+
+    Attributes:
+        fallback: Solver used for non-tree networks and infeasible days
+        is_tree: Whether the last solved network was handled directly
+        stats: Counters of direct solves plus the fallback solver's counters
+        last_duals: Duals of the last solve (from the fallback solver)
+    """
+
+    def __init__(self, fallback: Optional[LinearProgrammingSolver] = None):
+        """
+        Initialize the tree allocation solver.
+
+        Args:
+            fallback: Solver for networks that are not trees
+                      (default: LinearProgrammingSolver())
+
+        Raises:
+            ConfigurationError: If cost hierarchy is violated
+        """
+        validate_cost_hierarchy()
+        self.fallback = fallback if fallback is not None else LinearProgrammingSolver()
+        self.is_tree = False
+        self.tree_solves = 0
+        self._plan_key = None
+        self._plan = None
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Direct solve counter combined with the fallback solver's counters."""
+        return {'tree_solves': self.tree_solves, **getattr(self.fallback, 'stats', {})}
+    
+    def close(self) -> None:
+        """Release the worker threads of the fallback solver."""
+        self.fallback.close()
+    
+    @property
+    def last_duals(self) -> Optional[Dict[str, Dict[str, float]]]:
+        """Duals of the last solve, available when the fallback computes them."""
+        return getattr(self.fallback, 'last_duals', None)
+
+    def solve(self, nodes: List['Node'], links: List['Link'],
+              constraints: Dict[str, Tuple[float, float, float]]) -> Dict[str, float]:
+        """
+        Solve the allocation, directly if the network is a tree.
+
+        Args:
+            nodes: List of all nodes in the network
+            links: List of all links in the network
+            constraints: Dict mapping link_id to (q_min, q_max, cost)
+
+        Returns:
+            Dict mapping link_id to allocated flow (physical links only)
+
+        Raises:
+            InfeasibleNetworkError: If the problem is infeasible (raised by
+                                    the fallback solver)
+        """
+        plan = self._get_plan(nodes, links)
+        self.is_tree = plan is not None
+        if plan is not None and not getattr(self.fallback, 'compute_duals', False):
+            flows = self._solve_tree(plan, nodes, links, constraints)
+            if flows is not None:
+                self.tree_solves += 1
+                return flows
+            logger.debug("Tree allocation not possible for this timestep; solving LP")
+        return self.fallback.solve(nodes, links, constraints)
+
+    def _get_plan(self, nodes: List['Node'], links: List['Link']):
+        """
+        Return the traversal plan for a tree network, building it once.
+
+        Returns:
+            Tuple of (order, parent_link, children) where order lists node
+            positions with every node before its parent, parent_link maps a
+            node position to the position of the link to its parent (None for
+            roots) and children maps a node position to its children; None
+            if the network is not a forest with storage
+        """
+        key = LinearProgrammingSolver._topology_key(nodes, links)
+        if key == self._plan_key:
+            return self._plan
+
+        self._plan_key = key
+        self._plan = None
+
+        if not any(node.node_type == "storage" for node in nodes):
+            return None
+        if any(node.node_type not in ("source", "storage", "demand", "junction")
+               for node in nodes):
+            return None
+
+        index = {node.node_id: i for i, node in enumerate(nodes)}
+        adjacency: List[List[Tuple[int, int]]] = [[] for _ in nodes]
+        parent = list(range(len(nodes)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for j, link in enumerate(links):
+            a = index[link.source.node_id]
+            b = index[link.target.node_id]
+            root_a, root_b = find(a), find(b)
+            if root_a == root_b:
+                logger.info("Network contains a loop; TreeAllocationSolver will use the LP solver")
+                return None
+            parent[root_b] = root_a
+            adjacency[a].append((b, j))
+            adjacency[b].append((a, j))
+
+        # Depth-first traversal from each tree's first node
+        order: List[int] = []
+        parent_link: List[Optional[int]] = [None] * len(nodes)
+        children: List[List[int]] = [[] for _ in nodes]
+        visited = [False] * len(nodes)
+        for root in range(len(nodes)):
+            if visited[root]:
+                continue
+            visited[root] = True
+            stack = [root]
+            while stack:
+                i = stack.pop()
+                order.append(i)
+                for neighbour, j in adjacency[i]:
+                    if not visited[neighbour]:
+                        visited[neighbour] = True
+                        parent_link[neighbour] = j
+                        children[i].append(neighbour)
+                        stack.append(neighbour)
+        order.reverse()
+
+        self._plan = (order, parent_link, children)
+        logger.info("Tree-shaped network detected; allocating without LP")
+        return self._plan
+
+    def _solve_tree(self, plan, nodes: List['Node'], links: List['Link'],
+                    constraints: Dict[str, Tuple[float, float, float]]) -> Optional[Dict[str, float]]:
+        """
+        Solve the allocation on a forest.
+
+        Returns:
+            Dict mapping link_id to flow (physical links only), or None if the
+            problem cannot be solved directly (e.g. it is infeasible)
+        """
+        order, parent_link, children = plan
+
+        supply = {}
+        for i, node in enumerate(nodes):
+            if node.node_type == "source":
+                supply[i] = node.inflow
+            elif node.node_type == "storage":
+                supply[i] = node.get_available_mass()
+        if any(value < 0 for value in supply.values()):
+            return None
+
+        # No subtree can export or absorb more than all water in the system
+        total = sum(supply.values())
+        bound = total * (1.0 + 1e-9) + 1e-9
+
+        local: Dict[int, _Function] = {}
+        merged: Dict[int, _Function] = {}
+        exported: Dict[int, _Function] = {}
+
+        # Bottom-up: cost of each subtree as a function of its export
+        for i in order:
+            node = nodes[i]
+            if node.node_type == "source":
+                local[i] = (supply[i], 0.0, [])
+            elif node.node_type == "demand":
+                local[i] = (-node.request, 0.0, [(0.0, node.request)])
+            elif node.node_type == "storage":
+                if node.min_storage > bound:
+                    return None
+                keep_max = bound
+                carried = max(min(keep_max, node.max_storage) - node.min_storage, 0.0)
+                spilled = max(keep_max - max(node.max_storage, node.min_storage), 0.0)
+                value = (COST_STORAGE * (node.min_storage + carried) + COST_SPILL * spilled)
+                segments = [(-COST_SPILL, spilled), (-COST_STORAGE, carried)]
+                local[i] = (supply[i] - keep_max, value, [s for s in segments if s[1] > 0])
+            else:
+                local[i] = (0.0, 0.0, [])
+
+            merged[i] = _merge([local[i]] + [exported[c] for c in children[i]])
+
+            j = parent_link[i]
+            if j is not None:
+                link = links[j]
+                q_min, q_max, cost = constraints[link.link_id]
+                if link.source is node:
+                    low, high, slope = q_min, q_max, cost
+                else:
+                    low, high, slope = -q_max, -q_min, -cost
+                restricted = _restrict(merged[i], slope, max(low, -bound), min(high, bound))
+                if restricted is None:
+                    return None
+                exported[i] = restricted
+
+        # Top-down: split each node's export among itself and its children
+        export = {}
+        flows: Dict[str, float] = {}
+        carryover: Dict[int, float] = {}
+        for i in reversed(order):
+            j = parent_link[i]
+            if j is None:
+                left, _, segments = merged[i]
+                right = left + sum(length for _, length in segments)
+                tolerance = _TOLERANCE * max(1.0, total)
+                if left > tolerance or right < -tolerance:
+                    return None
+                export[i] = 0.0
+
+            parts = _split(export[i], merged[i], [local[i]] + [exported[c] for c in children[i]])
+            own = parts[0]
+            for child, point in zip(children[i], parts[1:]):
+                export[child] = point
+                link = links[parent_link[child]]
+                flows[link.link_id] = point if link.source is nodes[child] else -point
+
+            node = nodes[i]
+            if node.node_type == "storage":
+                kept = supply[i] - own
+                carryover[i] = min(max(kept, node.min_storage), node.max_storage)
+
+        for i, value in carryover.items():
+            nodes[i].update_storage_from_carryover(value)
+
+        return {link.link_id: flows[link.link_id] for link in links}
@@ -30,7 +30,8 @@ Example:
 
 Features:
     - Interactive HTML plots with zoom, pan, and hover information
-    - Multiple layout algorithms (circular, hierarchical)
+    - Multiple layout algorithms (circular, hierarchical, layered, force)
+    - Links drawn as a single trace (WebGL for large basin models, so they render quickly)
     - Color-coded nodes by type (storage=blue, demand=red, etc.)
     - Flow direction indicators on links
     - Customizable styling and export options
@@ -39,9 +40,9 @@ The visualization opens automatically in your default browser and can be
 embedded in reports or shared as standalone HTML files.
 """
 
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, List, Tuple
+import numpy as np
 import plotly.graph_objects as go
-import math
 from hydrosim.config import NetworkGraph
 
 
@@ -53,6 +54,167 @@ NODE_COLORS = {
     'source': '#2ecc71'        # Green
 }
 
+EDGE_COLOR = '#7f8c8d'
+
+# Networks with more links than this draw flow direction with arrow markers
+# in one trace instead of one annotation per link
+ARROW_ANNOTATION_LIMIT = 100
+
+# Networks with more nodes than this render nodes with WebGL and without labels
+LARGE_NETWORK_NODES = 500
+
+LAYOUTS = ('circular', 'hierarchical', 'layered', 'force')
+
+
+def _graph_arrays(network: NetworkGraph) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Return node ids and link endpoints as index arrays into the node list."""
+    node_ids = list(network.nodes.keys())
+    index = {node_id: i for i, node_id in enumerate(node_ids)}
+    sources = np.array([index[link.source.node_id] for link in network.links.values()], dtype=np.int64)
+    targets = np.array([index[link.target.node_id] for link in network.links.values()], dtype=np.int64)
+    return node_ids, sources, targets
+
+
+def _longest_path_layers(n: int, sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    Assign each node to a layer by longest path from the network's sources.
+    
+    Nodes without incoming links are on layer 0 and every link points to a
+    lower layer where possible. Cycles (e.g. spill links back upstream) are
+    broken by releasing the remaining node with the fewest unprocessed
+    incoming links, so their back-edges are ignored for layering.
+    """
+    layers = np.zeros(n, dtype=np.int64)
+    if n == 0:
+        return layers
+    
+    order = np.argsort(sources, kind='stable')
+    out_start = np.searchsorted(sources[order], np.arange(n + 1))
+    out_targets = targets[order]
+    in_degree = np.bincount(targets, minlength=n)
+    done = np.zeros(n, dtype=bool)
+    
+    ready = list(np.flatnonzero(in_degree == 0)[::-1])
+    processed = 0
+    while processed < n:
+        if not ready:
+            remaining = np.flatnonzero(~done)
+            ready.append(remaining[np.argmin(in_degree[remaining])])
+        node = ready.pop()
+        if done[node]:
+            continue
+        done[node] = True
+        processed += 1
+        for target in out_targets[out_start[node]:out_start[node + 1]]:
+            if done[target]:
+                continue
+            layers[target] = max(layers[target], layers[node] + 1)
+            in_degree[target] -= 1
+            if in_degree[target] == 0:
+                ready.append(target)
+    return layers
+
+
+def _layered_positions(n: int, sources: np.ndarray, targets: np.ndarray,
+                       sweeps: int = 4) -> np.ndarray:
+    """
+    Layered (Sugiyama-style) layout: longest-path layering from sources
+    towards demands, then barycenter ordering within each layer to reduce
+    link crossings.
+    
+    Returns:
+        Array of shape (n, 2) with x, y coordinates
+    """
+    layers = _longest_path_layers(n, sources, targets)
+    n_layers = int(layers.max()) + 1 if n else 0
+    
+    # Initial order: insertion order within each layer
+    rank = np.zeros(n)
+    members = [np.flatnonzero(layers == layer) for layer in range(n_layers)]
+    for nodes in members:
+        rank[nodes] = np.arange(len(nodes))
+    
+    # Barycenter sweeps: order each layer by the mean rank (normalised by
+    # layer size) of its neighbours in the layers already placed
+    width = np.array([len(nodes) for nodes in members], dtype=float)
+    for sweep in range(sweeps):
+        downward = sweep % 2 == 0
+        if downward:
+            node_side, neighbour_side = targets, sources
+        else:
+            node_side, neighbour_side = sources, targets
+        layer_sequence = range(1, n_layers) if downward else range(n_layers - 2, -1, -1)
+        for layer in layer_sequence:
+            nodes = members[layer]
+            if len(nodes) < 2:
+                continue
+            if downward:
+                mask = (layers[node_side] == layer) & (layers[neighbour_side] < layer)
+            else:
+                mask = (layers[node_side] == layer) & (layers[neighbour_side] > layer)
+            neighbour_pos = (rank[neighbour_side[mask]] + 0.5) / width[layers[neighbour_side[mask]]]
+            totals = np.bincount(node_side[mask], weights=neighbour_pos, minlength=n)[nodes]
+            counts = np.bincount(node_side[mask], minlength=n)[nodes]
+            # Nodes without placed neighbours keep their relative position
+            current = (rank[nodes] + 0.5) / len(nodes)
+            barycenter = np.where(counts > 0, totals / np.maximum(counts, 1), current)
+            order = np.lexsort((rank[nodes], barycenter))
+            rank[nodes[order]] = np.arange(len(nodes))
+    
+    pos = np.zeros((n, 2))
+    if n:
+        pos[:, 0] = (rank - (width[layers] - 1) / 2) * 0.5  # Center horizontally
+        pos[:, 1] = 1.0 - layers * 0.5  # Top to bottom
+    return pos
+
+
+def _force_positions(n: int, sources: np.ndarray, targets: np.ndarray,
+                     iterations: int = 50, seed: int = 0,
+                     initial: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Force-directed (Fruchterman-Reingold) layout with vectorised forces.
+    
+    Repulsion between all node pairs is computed in blocks of rows so that
+    memory stays bounded for large networks; attraction acts along links.
+    
+    Returns:
+        Array of shape (n, 2) with x, y coordinates in [-1, 1]
+    """
+    if n <= 1:
+        return np.zeros((n, 2))
+    
+    rng = np.random.default_rng(seed)
+    pos = initial.astype(float).copy() if initial is not None else rng.uniform(-1, 1, (n, 2))
+    pos += rng.normal(scale=1e-3, size=pos.shape)  # Separate coincident nodes
+    k = np.sqrt(4.0 / n)  # Ideal distance for an area of 2 x 2
+    temperature = 0.1
+    block = max(1, 2 ** 21 // n)
+    
+    for _ in range(iterations):
+        # Repulsion k^2 / d along (p_i - p_j), via matrix products:
+        # sum_j w_ij (p_i - p_j) = p_i * sum_j w_ij - (W @ p)_i
+        disp = np.zeros_like(pos)
+        sq = (pos ** 2).sum(axis=1)
+        for start in range(0, n, block):
+            rows = slice(start, start + block)
+            dist2 = sq[rows, None] + sq[None, :] - 2.0 * (pos[rows] @ pos.T)
+            weights = k * k / np.maximum(dist2, 1e-9)
+            weights[np.arange(weights.shape[0]), np.arange(start, start + weights.shape[0])] = 0.0
+            disp[rows] = pos[rows] * weights.sum(axis=1)[:, None] - weights @ pos
+        
+        delta = pos[sources] - pos[targets]
+        dist = np.sqrt(np.maximum((delta ** 2).sum(axis=1), 1e-9))
+        pull = delta * (dist / k)[:, None]
+        np.add.at(disp, sources, -pull)
+        np.add.at(disp, targets, pull)
+        
+        length = np.sqrt(np.maximum((disp ** 2).sum(axis=1), 1e-9))
+        pos += disp / length[:, None] * np.minimum(length, temperature)[:, None]
+        temperature *= 0.95
+    
+    pos -= pos.mean(axis=0)
+    return pos / max(np.abs(pos).max(), 1e-9)
+
 
 def _calculate_layout(network: NetworkGraph, layout: str) -> Dict[str, Tuple[float, float]]:
     """
@@ -60,7 +222,12 @@ def _calculate_layout(network: NetworkGraph, layout: str) -> Dict[str, Tuple[flo
     
     Args:
         network: NetworkGraph to layout
-        layout: Layout algorithm ('circular', 'hierarchical')
+        layout: Layout algorithm:
+            - 'circular': Nodes evenly spaced on a circle
+            - 'hierarchical': Rows by node type (sources, storage/junctions, demands)
+            - 'layered': Rows by longest flow path from sources, ordered to
+              reduce link crossings (suited to large basin models)
+            - 'force': Force-directed placement
     
     Returns:
         Dictionary mapping node_id to (x, y) coordinates
@@ -69,13 +236,7 @@ def _calculate_layout(network: NetworkGraph, layout: str) -> Dict[str, Tuple[flo
     n = len(nodes)
     pos = {}
     
-    if layout == 'circular':
-        # Arrange nodes in a circle
-        for i, node_id in enumerate(nodes):
-            angle = 2 * math.pi * i / n
-            pos[node_id] = (math.cos(angle), math.sin(angle))
-    
-    elif layout == 'hierarchical':
+    if layout == 'hierarchical':
         # Simple hierarchical layout based on node type
         # Sources at top, junctions/storage in middle, demands at bottom
         type_levels = {'source': 0, 'storage': 1, 'junction': 1, 'demand': 2}
@@ -95,14 +256,21 @@ def _calculate_layout(network: NetworkGraph, layout: str) -> Dict[str, Tuple[flo
             for i, node_id in enumerate(level_nodes):
                 x = (i - (n_level - 1) / 2) * 0.5  # Center horizontally
                 pos[node_id] = (x, y)
+        return pos
     
+    if layout in ('layered', 'force'):
+        node_ids, sources, targets = _graph_arrays(network)
+        coords = _layered_positions(n, sources, targets)
+        if layout == 'force':
+            # Start from the layered layout so flow direction stays readable
+            scale = max(np.abs(coords).max(), 1e-9) if n else 1.0
+            coords = _force_positions(n, sources, targets, initial=coords / scale)
     else:
-        # Default to circular
-        for i, node_id in enumerate(nodes):
-            angle = 2 * math.pi * i / n
-            pos[node_id] = (math.cos(angle), math.sin(angle))
+        # Arrange nodes in a circle ('circular' and unknown layouts)
+        angles = 2 * np.pi * np.arange(n) / max(n, 1)
+        coords = np.column_stack([np.cos(angles), np.sin(angles)])
     
-    return pos
+    return {node_id: (float(x), float(y)) for node_id, (x, y) in zip(nodes, coords)}
 
 
 def visualize_network(
@@ -118,7 +286,8 @@ def visualize_network(
         network: NetworkGraph to visualize
         width: Figure width in pixels (default: from YAML or 600)
         height: Figure height in pixels (default: from YAML or 1200)
-        layout: Layout algorithm ('circular', 'hierarchical') (default: from YAML or 'hierarchical')
+        layout: Layout algorithm ('circular', 'hierarchical', 'layered', 'force')
+                (default: from YAML or 'hierarchical')
     
     Returns:
         Plotly Figure object
@@ -170,53 +339,91 @@ def visualize_network(
 
 
 def _create_edge_traces(network: NetworkGraph, pos: Dict[str, Tuple[float, float]]) -> tuple:
-    """Create edge traces with arrows. Returns (traces, annotations)."""
-    traces = []
-    annotations = []
+    """
+    Create edge traces with flow direction. Returns (traces, annotations).
     
-    for link_id, link in network.links.items():
-        source_id = link.source.node_id
-        target_id = link.target.node_id
-        
-        x0, y0 = pos[source_id]
-        x1, y1 = pos[target_id]
-        
-        # Create line trace
-        trace = go.Scatter(
-            x=[x0, x1, None],
-            y=[y0, y1, None],
-            mode='lines',
-            line=dict(width=3, color='#7f8c8d'),
+    All links are drawn as one line trace with None separators between
+    segments. Flow direction is shown with arrow annotations for small
+    networks and with a single arrow-marker trace for large ones. Like the
+    node traces, edges use WebGL only for large networks, so in small ones
+    they stay in the SVG layer below the node markers and labels.
+    """
+    links = list(network.links.items())
+    trace_type = go.Scattergl if len(network.nodes) > LARGE_NETWORK_NODES else go.Scatter
+    if not links:
+        return [], []
+    
+    start = np.array([pos[link.source.node_id] for _, link in links])
+    end = np.array([pos[link.target.node_id] for _, link in links])
+    hover = [
+        f"Link: {link_id}<br>From: {link.source.node_id}<br>To: {link.target.node_id}"
+        for link_id, link in links
+    ]
+    
+    n_links = len(links)
+    x = np.full(3 * n_links, None, dtype=object)
+    y = np.full(3 * n_links, None, dtype=object)
+    x[0::3], x[1::3] = start[:, 0], end[:, 0]
+    y[0::3], y[1::3] = start[:, 1], end[:, 1]
+    hovertext = np.full(3 * n_links, None, dtype=object)
+    hovertext[0::3] = hovertext[1::3] = hover
+    
+    traces = [trace_type(
+        x=x,
+        y=y,
+        mode='lines',
+        line=dict(width=3 if n_links <= ARROW_ANNOTATION_LIMIT else 1, color=EDGE_COLOR),
+        hoverinfo='text',
+        hovertext=hovertext,
+        showlegend=False
+    )]
+    
+    annotations = []
+    if n_links <= ARROW_ANNOTATION_LIMIT:
+        # Arrow annotations pointing to center of target node
+        for (x0, y0), (x1, y1) in zip(start, end):
+            annotations.append(dict(
+                x=x1,
+                y=y1,
+                ax=x0,
+                ay=y0,
+                xref='x',
+                yref='y',
+                axref='x',
+                ayref='y',
+                showarrow=True,
+                arrowhead=2,
+                arrowsize=1.5,
+                arrowwidth=2,
+                arrowcolor=EDGE_COLOR
+            ))
+    else:
+        # Arrow markers three quarters along each link, rotated to the flow
+        # direction (marker angles are clockwise from north)
+        tip = start + 0.75 * (end - start)
+        direction = end - start
+        traces.append(trace_type(
+            x=tip[:, 0],
+            y=tip[:, 1],
+            mode='markers',
+            marker=dict(
+                symbol='arrow',
+                size=8,
+                color=EDGE_COLOR,
+                angle=np.degrees(np.arctan2(direction[:, 0], direction[:, 1]))
+            ),
             hoverinfo='text',
-            hovertext=f"Link: {link_id}<br>From: {source_id}<br>To: {target_id}",
+            hovertext=hover,
             showlegend=False
-        )
-        traces.append(trace)
-        
-        # Create arrow annotation pointing to center of target node
-        annotation = dict(
-            x=x1,
-            y=y1,
-            ax=x0,
-            ay=y0,
-            xref='x',
-            yref='y',
-            axref='x',
-            ayref='y',
-            showarrow=True,
-            arrowhead=2,
-            arrowsize=1.5,
-            arrowwidth=2,
-            arrowcolor='#7f8c8d'
-        )
-        annotations.append(annotation)
-        
+        ))
+    
     return traces, annotations
 
 
 def _create_node_traces(network: NetworkGraph, pos: Dict[str, Tuple[float, float]]) -> list:
     """Create node traces grouped by type."""
     traces = []
+    large = len(network.nodes) > LARGE_NETWORK_NODES
     
     # Group nodes by type
     nodes_by_type = {}
@@ -247,14 +454,15 @@ def _create_node_traces(network: NetworkGraph, pos: Dict[str, Tuple[float, float
                 hover_parts.append(f"Max Storage: {node.max_storage:.0f} m³")
             hover_texts.append("<br>".join(hover_parts))
         
-        trace = go.Scatter(
+        trace_type = go.Scattergl if large else go.Scatter
+        trace = trace_type(
             x=x_coords,
             y=y_coords,
-            mode='markers+text',
+            mode='markers' if large else 'markers+text',
             marker=dict(
-                size=30,
+                size=10 if large else 30,
                 color=NODE_COLORS.get(node_type, '#95a5a6'),
-                line=dict(width=3, color='white')
+                line=dict(width=1 if large else 3, color='white')
             ),
             text=labels,
             textposition='top center',
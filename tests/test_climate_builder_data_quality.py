@@ -322,6 +322,53 @@ class TestDataQualityValidator:
         assert len(report.unrealistic_values) == 1
         assert len(report.unrealistic_values[0]['issues']) == 2
     
+    def test_issue_messages_and_order(self):
+        """Test the exact issue records produced for each check."""
+        dates = pd.date_range('2010-01-01', '2010-01-04', freq='D')
+        df = pd.DataFrame({
+            'date': dates,
+            'precipitation_mm': [600.0, 5.0, float('nan'), 5.0],
+            'tmax_c': [70.0, 5.0, 20.0, 20.0],
+            'tmin_c': [10.0, 8.0, -120.0, 10.0],
+            'solar_mjm2': [10.0, 10.0, 10.0, 55.0],
+        })
+        
+        report = DataQualityValidator(df).validate()
+        
+        assert report.unrealistic_values == [
+            {'date': '2010-01-01',
+             'issues': ['very high precipitation (600.00 mm)', 'extreme tmax (70.0°C)']},
+            {'date': '2010-01-02', 'issues': ['tmax (5.0°C) < tmin (8.0°C)']},
+            {'date': '2010-01-03', 'issues': ['extreme tmin (-120.0°C)']},
+            {'date': '2010-01-04', 'issues': ['very high solar (55.00 MJ/m²/day)']},
+        ]
+    
+    def test_max_reported_issues(self):
+        """Test that reported days can be capped while totals are kept."""
+        dates = pd.date_range('2010-01-01', '2010-12-31', freq='D')
+        df = pd.DataFrame({
+            'date': dates,
+            'precipitation_mm': [-1.0] * len(dates),
+            'tmax_c': [5.0] * len(dates),
+            'tmin_c': [10.0] * len(dates),
+        })
+        
+        report = DataQualityValidator(df, max_reported_issues=3).validate()
+        
+        assert len(report.unrealistic_values) == 3
+        assert report.unrealistic_day_count == 365
+        assert report.unrealistic_summary == {
+            'negative_precipitation': 365, 'tmax_below_tmin': 365
+        }
+        assert any("Found 365 days" in w for w in report.warnings)
+        text = report.to_text_report()
+        assert "Unrealistic Values (365 days)" in text
+        assert "... and 362 more" in text
+        assert "tmax_below_tmin: 365" in text
+        
+        with pytest.raises(ValueError, match="max_reported_issues"):
+            DataQualityValidator(df, max_reported_issues=-1)
+    
     def test_report_text_format(self):
         """Test that text report is properly formatted."""
         dates = pd.date_range('2010-01-01', '2020-12-31', freq='D')
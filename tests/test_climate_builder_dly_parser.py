@@ -293,6 +293,70 @@ class TestDLYParser:
             assert row['tmax_c'] == -10.0
             assert row['tmin_c'] == -25.0
 
+    
+    def test_vectorised_parse_matches_line_by_line(self):
+        """Test that the array-based parser reproduces the line-by-line parser."""
+        parser = DLYParser()
+        
+        def record(year, month, element, fields):
+            days = "".join(f"{field:>5}   " for field in fields)
+            return f"TEST0000001{year}{month}{element}{days}"
+        
+        lines = [
+            record("2000", "02", "PRCP", [10, -9999, " ", "+5", "1 2", "-", "00012"] + [3] * 24),
+            record("2000", "02", "TMAX", [150] * 31),
+            record("2001", "02", "TMIN", [-50] * 31),  # Feb 29-31 invalid
+            record("2001", "04", "SNOW", [999] * 31),
+            record("20x1", "01", "PRCP", [1] * 31),     # Bad year: warning
+            record("2001", "13", "TMAX", [1] * 31),     # Invalid month
+            record("2000", "02", "PRCP", [77] * 5),     # Short line, overrides
+            "   ",
+            record("2002", "01", "TMAX", [200] * 31)[:60],
+        ]
+        raw = ("\r\n".join(lines) + "\r\n").encode()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dly_path = Path(tmpdir) / "test.dly"
+            dly_path.write_bytes(raw)
+            
+            expected = parser._parse_line_by_line(dly_path)
+            result = parser._parse_records(raw)
+        
+        pd.testing.assert_frame_equal(result, expected)
+        assert datetime.date(2000, 2, 29) not in set(result['date'])
+        row = result[result['date'] == datetime.date(2000, 2, 1)].iloc[0]
+        assert row['precipitation_mm'] == 7.7
+    
+    def test_missing_element_column_is_empty(self):
+        """Test that an element absent from the file yields an all-missing column."""
+        parser = DLYParser()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dly_path = Path(tmpdir) / "test.dly"
+            dly_path.write_text("TEST0000001201001PRCP  100   " + " " * 240 + "\n")
+            
+            expected = parser._parse_line_by_line(dly_path)
+            df = parser.parse(dly_path)
+        
+        pd.testing.assert_frame_equal(df, expected)
+        assert df['tmax_c'].isna().all()
+    
+    def test_non_ascii_file_uses_line_parser(self):
+        """Test that files with non-ASCII characters are still parsed."""
+        parser = DLYParser()
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dly_path = Path(tmpdir) / "test.dly"
+            dly_path.write_bytes(
+                b"TEST0000001201001PRCP  100 " + b" " * 240 + b"\n"
+                + b"\xe9\xe9\n"
+            )
+            
+            df = parser.parse(dly_path)
+        
+        assert len(df) == 1
+        assert df['precipitation_mm'].iloc[0] == 10.0
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,80 @@
+"""
+Tests for closed-form Fourier series fitting.
+
+This module checks that the linear least-squares fit agrees with the
+nonlinear curve fit of the same model, for single and batched series.
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+from scipy.optimize import curve_fit
+
+from hydrosim.climate_builder.fourier import fit_fourier_series
+
+
+def nonlinear_fit(values):
+    """Reference fit of mean + amplitude*cos(2π(p - peak)/N) with curve_fit."""
+    n = len(values)
+    periods = np.arange(1, n + 1)
+
+    def model(p, mean, amplitude, peak):
+        return mean + amplitude * np.cos(2 * np.pi * (p - peak) / n)
+
+    popt, _ = curve_fit(
+        model, periods, values,
+        p0=[values.mean(), (values.max() - values.min()) / 2, values.argmax() + 1],
+        maxfev=10000
+    )
+    return popt[0], abs(popt[1])
+
+
+class TestFitFourierSeries:
+    """Test suite for fit_fourier_series."""
+
+    def test_recovers_exact_series(self):
+        """Test that parameters of a noise-free series are recovered exactly."""
+        periods = np.arange(1, 14)
+        values = 12.0 + 8.0 * np.cos(2 * np.pi * (periods - 7.0) / 13)
+
+        mean, amplitude, peak = fit_fourier_series(values)
+
+        assert mean == pytest.approx(12.0)
+        assert amplitude == pytest.approx(8.0)
+        assert peak == pytest.approx(7.0)
+
+    def test_matches_nonlinear_fit(self):
+        """Test agreement with curve_fit on noisy series, fitted as one batch."""
+        rng = np.random.default_rng(3)
+        periods = np.arange(1, 14)
+        series = np.array([
+            rng.normal(10, 5) + rng.uniform(1, 15)
+            * np.cos(2 * np.pi * (periods - rng.uniform(1, 13)) / 13)
+            + rng.normal(0, 1.5, 13)
+            for _ in range(20)
+        ])
+
+        means, amplitudes, peaks = fit_fourier_series(series)
+
+        assert means.shape == amplitudes.shape == peaks.shape == (20,)
+        for values, mean, amplitude in zip(series, means, amplitudes):
+            ref_mean, ref_amplitude = nonlinear_fit(values)
+            assert mean == pytest.approx(ref_mean, abs=1e-5)
+            assert amplitude == pytest.approx(ref_amplitude, abs=1e-5)
+        assert np.all((peaks > 0) & (peaks <= 13))
+
+    def test_missing_values_fallback(self):
+        """Test that series with NaN use the simple estimates."""
+        good = 5.0 + 2.0 * np.cos(2 * np.pi * np.arange(1, 14) / 13)
+        bad = good.copy()
+        bad[4] = np.nan
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            means, amplitudes, _ = fit_fourier_series(np.vstack([good, bad]))
+
+        assert "Fourier series fitting failed" in str(w[0].message)
+        assert means[0] == pytest.approx(5.0)
+        assert amplitudes[0] == pytest.approx(2.0)
+        assert np.isnan(means[1])
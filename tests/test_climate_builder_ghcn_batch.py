@@ -0,0 +1,164 @@
+"""
+Tests for the batch GHCN fetcher.
+
+These tests run against a local mirror directory (file:// base URL), which
+emulates the conditional and range request behaviour of the GHCN server.
+"""
+
+import json
+import os
+
+import pytest
+
+from hydrosim.climate_builder.ghcn_batch import GHCNBatchFetcher
+
+
+STATIONS = ["USW00024233", "USW00024229", "USC00451234"]
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    """Create a mirror directory holding a .dly file per station."""
+    mirror_dir = tmp_path / "mirror"
+    mirror_dir.mkdir()
+    for i, station_id in enumerate(STATIONS):
+        (mirror_dir / f"{station_id}.dly").write_bytes(
+            (f"{station_id}202001PRCP" + " " * 100 + "\n").encode() * (100 + i)
+        )
+    return mirror_dir
+
+
+@pytest.fixture
+def fetcher(tmp_path, mirror):
+    """Create a batch fetcher pointing at the mirror."""
+    return GHCNBatchFetcher(tmp_path / "cache", base_url=mirror.as_uri(), max_workers=4)
+
+
+def test_fetch_downloads_all_stations(fetcher, mirror, tmp_path):
+    """Test that all stations are downloaded and placed in the destination."""
+    dest = tmp_path / "raw"
+    results = fetcher.fetch(STATIONS, dest_dir=dest)
+
+    assert list(results) == STATIONS
+    for station_id, result in results.items():
+        assert result.status == 'downloaded'
+        assert result.path == dest / f"{station_id}.dly"
+        assert result.path.read_bytes() == (mirror / f"{station_id}.dly").read_bytes()
+        assert fetcher.cached_path(station_id) is not None
+
+
+def test_cached_files_are_revalidated(fetcher, mirror):
+    """Test that unchanged files are not downloaded again."""
+    fetcher.fetch(STATIONS)
+
+    results = fetcher.fetch(STATIONS)
+    assert all(r.status == 'cached' for r in results.values())
+
+    results = fetcher.fetch(STATIONS, revalidate=False)
+    assert all(r.status == 'offline' for r in results.values())
+
+    # A changed file on the server is downloaded again
+    changed = mirror / f"{STATIONS[0]}.dly"
+    changed.write_bytes(b"updated content\n")
+    stat = changed.stat()
+    os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    result = fetcher.fetch_station(STATIONS[0])
+    assert result.status == 'downloaded'
+    assert result.path.read_bytes() == b"updated content\n"
+
+
+def test_identical_content_shares_cache_object(fetcher, mirror):
+    """Test that the cache is content-addressed."""
+    (mirror / "USW00000001.dly").write_bytes((mirror / f"{STATIONS[0]}.dly").read_bytes())
+
+    results = fetcher.fetch([STATIONS[0], "USW00000001"])
+
+    assert results[STATIONS[0]].sha256 == results["USW00000001"].sha256
+    assert len(list((fetcher.cache_dir / 'objects').rglob('*.dly'))) == 1
+
+
+def test_partial_download_is_resumed(fetcher, mirror):
+    """Test that an interrupted download continues from the partial file."""
+    station_id = STATIONS[1]
+    content = (mirror / f"{station_id}.dly").read_bytes()
+    probe = fetcher._request(fetcher._url(station_id), {})
+
+    part_path, meta_path = fetcher._partial_paths(station_id)
+    part_path.write_bytes(content[:1000])
+    meta_path.write_text(json.dumps({'etag': probe.headers['ETag'], 'last_modified': None}))
+
+    result = fetcher.fetch_station(station_id)
+
+    assert result.status == 'resumed'
+    assert result.path.read_bytes() == content
+    assert not part_path.exists()
+
+
+def test_stale_partial_download_restarts(fetcher, mirror):
+    """Test that a partial file from an older server version is discarded."""
+    station_id = STATIONS[1]
+    content = (mirror / f"{station_id}.dly").read_bytes()
+
+    part_path, meta_path = fetcher._partial_paths(station_id)
+    part_path.write_bytes(b"x" * 500)
+    meta_path.write_text(json.dumps({'etag': '"stale"', 'last_modified': None}))
+
+    result = fetcher.fetch_station(station_id)
+
+    assert result.status == 'downloaded'
+    assert result.path.read_bytes() == content
+
+
+def test_failures_are_isolated(fetcher):
+    """Test that missing or invalid stations do not stop the batch."""
+    results = fetcher.fetch([STATIONS[0], "USW99999999", "BAD"])
+
+    assert results[STATIONS[0]].ok
+    assert results["USW99999999"].status == 'failed'
+    assert "not found" in results["USW99999999"].error
+    assert results["BAD"].status == 'failed'
+    assert "Invalid GHCN station ID format" in results["BAD"].error
+
+
+def test_duplicate_station_ids_fetched_once(fetcher, mirror, monkeypatch):
+    """Test that repeated station IDs are downloaded by a single worker."""
+    requested = []
+    original = fetcher._request
+
+    def recording_request(url, headers):
+        requested.append(url)
+        return original(url, headers)
+
+    monkeypatch.setattr(fetcher, '_request', recording_request)
+    results = fetcher.fetch([STATIONS[0], STATIONS[0].lower(), f" {STATIONS[0]} "])
+
+    assert list(results) == [STATIONS[0]]
+    assert len(requested) == 1
+    assert results[STATIONS[0]].path.read_bytes() == (mirror / f"{STATIONS[0]}.dly").read_bytes()
+
+
+def test_responses_are_closed(fetcher, monkeypatch):
+    """Test that every response is closed, including 304 and 404 replies."""
+    opened = []
+    original = fetcher._request
+
+    def tracking_request(url, headers):
+        response = original(url, headers)
+        closed = []
+        response.on_close = lambda: closed.append(True)
+        opened.append(closed)
+        return response
+
+    monkeypatch.setattr(fetcher, '_request', tracking_request)
+    fetcher.fetch([STATIONS[0], "USW99999999"])
+    fetcher.fetch([STATIONS[0]])
+
+    assert len(opened) == 3
+    assert all(opened)
+
+
+def test_invalid_max_workers(tmp_path):
+    """Test that max_workers must be positive."""
+    with pytest.raises(ValueError, match="max_workers"):
+        GHCNBatchFetcher(tmp_path, max_workers=0)
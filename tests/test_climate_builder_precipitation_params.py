@@ -223,6 +223,74 @@ class TestPrecipitationParameterCalculator:
         with pytest.raises(ValueError, match="must have 'date' column"):
             calc.calculate_parameters(df)
     
+    def test_markov_chain_ignores_gaps(self):
+        """Test that transitions are not counted across missing days or gaps."""
+        calc = PrecipitationParameterCalculator()
+        
+        # W W [missing] D D, then a 5-day gap, then W
+        dates = pd.to_datetime([
+            '2020-01-01', '2020-01-02', '2020-01-03', '2020-01-04',
+            '2020-01-05', '2020-01-11'
+        ])
+        df = pd.DataFrame({
+            'date': dates,
+            'precipitation_mm': [5.0, 5.0, np.nan, 0.0, 0.0, 5.0]
+        })
+        
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            params = calc.calculate_parameters(df)
+        
+        # Only W->W and D->D are real transitions
+        assert params['pww'][0] == 1.0
+        assert params['pwd'][0] == 0.0
+    
+    def test_markov_chain_year_boundary_and_leap_day(self):
+        """Test transitions across Dec 31 -> Jan 1 and the skipped Feb 29."""
+        calc = PrecipitationParameterCalculator()
+        
+        df = pd.DataFrame({
+            'date': pd.to_datetime(['2019-12-31', '2020-01-01', '2020-02-28', '2020-03-01',
+                                    '2020-06-30', '2021-01-01']),
+            'precipitation_mm': [0.0, 5.0, 5.0, 5.0, 0.0, 5.0]
+        })
+        dates, precip = calc._prepare_record(df)
+        counts, _, _, _ = calc._record_statistics(
+            np.zeros(len(dates), dtype=np.int64), dates, precip, n_stations=1
+        )
+        
+        # Dec 31 (dry) -> Jan 1 (wet) is counted in January
+        assert counts[0, 0, 0, 1] == 1
+        # Feb 28 -> Mar 1 in a leap year without Feb 29 is counted in March
+        assert counts[0, 2, 1, 1] == 1
+        # Jun 30 -> Jan 1 of the next year is not a transition
+        assert counts.sum() == 2
+    
+    def test_calculate_parameters_batch_matches_single(self):
+        """Test that the batch API gives the same results as per-station calls."""
+        calc = PrecipitationParameterCalculator()
+        rng = np.random.default_rng(7)
+        
+        station_data = {}
+        for station_id, wet_fraction in [('STA1', 0.3), ('STA2', 0.6), ('STA3', 0.45)]:
+            dates = pd.date_range('2000-01-01', '2004-12-31', freq='D')
+            dates = dates[~((dates.month == 2) & (dates.day == 29))]
+            precip = np.where(rng.random(len(dates)) < wet_fraction,
+                              rng.gamma(1.5, 4.0, len(dates)), 0.0)
+            precip[rng.random(len(dates)) < 0.05] = np.nan
+            # Shuffle rows to check ordering does not matter
+            station_data[station_id] = pd.DataFrame(
+                {'date': dates, 'precipitation_mm': precip}
+            ).sample(frac=1.0, random_state=1)
+        
+        batch = calc.calculate_parameters_batch(station_data)
+        
+        assert list(batch) == ['STA1', 'STA2', 'STA3']
+        for station_id, df in station_data.items():
+            single = calc.calculate_parameters(df)
+            for key in ['pww', 'pwd', 'alpha', 'beta']:
+                np.testing.assert_allclose(batch[station_id][key], single[key], rtol=1e-12)
+    
     def test_wet_day_threshold_property(self):
         """Test that wet day classification respects the threshold."""
         # Test with different thresholds
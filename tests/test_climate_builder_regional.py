@@ -0,0 +1,92 @@
+"""
+Tests for regional WGEN parameter generation.
+
+These tests run the regional pipeline on synthetic .dly files and check
+the consolidated table, per-station outputs and failure isolation.
+"""
+
+import calendar
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hydrosim.climate_builder.regional import RegionalParameterPipeline
+
+
+def write_dly(path, station_id, years=range(2000, 2004), seed=0):
+    """Write a synthetic .dly file with seasonal temperature and random precipitation."""
+    rng = np.random.default_rng(seed)
+    lines = []
+    for year in years:
+        for month in range(1, 13):
+            days_in_month = calendar.monthrange(year, month)[1]
+            season = np.cos(2 * np.pi * (month - 7) / 12)
+            prcp = np.where(rng.random(31) < 0.4, rng.gamma(1.5, 40.0, 31), 0).astype(int)
+            tmax = (150 + 100 * season + rng.normal(0, 20, 31)).astype(int)
+            tmin = tmax - 100
+            for element, values in (('PRCP', prcp), ('TMAX', tmax), ('TMIN', tmin)):
+                fields = [
+                    f"{value if day < days_in_month else -9999:5d}   "
+                    for day, value in enumerate(values)
+                ]
+                lines.append(f"{station_id}{year}{month:02d}{element}" + "".join(fields))
+    path.write_text("\n".join(lines) + "\n")
+
+
+@pytest.fixture
+def dly_dir(tmp_path):
+    """Create a directory with two valid stations and one corrupt file."""
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    write_dly(raw / "USW00000001.dly", "USW00000001", seed=1)
+    write_dly(raw / "USW00000002.dly", "USW00000002", seed=2)
+    (raw / "USW00000003.dly").write_text("not a dly file\n")
+    return raw
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_run_directory(tmp_path, dly_dir, max_workers):
+    """Test parameter generation for a directory of stations."""
+    pipeline = RegionalParameterPipeline(tmp_path / "region", max_workers=max_workers)
+
+    results = pipeline.run_directory(dly_dir, latitudes=47.0)
+
+    assert list(results) == ["USW00000001", "USW00000002", "USW00000003"]
+    assert results["USW00000001"].ok and results["USW00000002"].ok
+    assert results["USW00000003"].status == 'failed'
+    assert "No valid data found" in results["USW00000003"].error
+
+    for station_id in ("USW00000001", "USW00000002"):
+        result = results[station_id]
+        assert result.wgen_params_path.exists()
+        assert result.wgen_params_path.parent.name == "processed"
+        assert (result.wgen_params_path.parent / "data_quality_report.txt").exists()
+        assert len(result.params['pww']) == 12
+
+    table = pd.read_csv(pipeline.table_path)
+    assert list(table['station_id']) == list(results)
+    assert list(table['status']) == ['ok', 'ok', 'failed']
+    assert {'pww_1', 'beta_12', 'txmd', 'ar'} <= set(table.columns)
+    assert table.loc[0, 'pww_1'] == pytest.approx(results["USW00000001"].params['pww'][0])
+    assert pd.isna(table.loc[2, 'pww_1'])
+
+
+def test_missing_file_and_latitude(tmp_path, dly_dir):
+    """Test that stations without a file or latitude are reported as failed."""
+    pipeline = RegionalParameterPipeline(tmp_path / "region", max_workers=1)
+
+    results = pipeline.run(
+        {"USW00000001": 47.0, "USW00000009": 47.0, "USW00000002": None},
+        dly_dir=dly_dir
+    )
+
+    assert results["USW00000001"].ok
+    assert "No .dly file" in results["USW00000009"].error
+    assert "No latitude" in results["USW00000002"].error
+
+
+def test_invalid_max_workers(tmp_path):
+    """Test that max_workers must be positive."""
+    with pytest.raises(ValueError, match="max_workers"):
+        RegionalParameterPipeline(tmp_path, max_workers=0)
@@ -0,0 +1,51 @@
+"""
+Tests for the rolling future data provider.
+"""
+
+import numpy as np
+import pytest
+
+from hydrosim.future_data import RollingFutureData
+
+
+def test_window_is_view_at_cursor():
+    """Test that windows start at the cursor and share the stored array."""
+    future = RollingFutureData({'river': [10.0, 12.0, 8.0, 9.0]})
+    
+    window = future.window('river', 2)
+    np.testing.assert_array_equal(window, [10.0, 12.0])
+    assert window.dtype == np.float64
+    assert not window.flags.writeable
+    
+    future.advance()
+    second = future.window('river', 2)
+    np.testing.assert_array_equal(second, [12.0, 8.0])
+    assert np.shares_memory(window, second)
+    
+    future.advance(2)
+    np.testing.assert_array_equal(future.window('river', 3), [9.0])
+    future.advance()
+    assert len(future.window('river', 3)) == 0
+
+
+def test_unknown_entities_and_validation():
+    """Test lookups of entities without data and invalid advances."""
+    future = RollingFutureData({'river': [1.0], 'city': [2.0]})
+    
+    assert 'river' in future
+    assert 'lake' not in future
+    assert len(future) == 2
+    assert set(future) == {'river', 'city'}
+    assert future.window('lake', 5) is None
+    assert len(RollingFutureData()) == 0
+    
+    with pytest.raises(ValueError, match="steps"):
+        future.advance(-1)
+
+
+def test_float64_arrays_are_not_copied():
+    """Test that float64 array series are stored without copying."""
+    values = np.array([3.0, 4.0, 5.0])
+    future = RollingFutureData({'river': values})
+    
+    assert np.shares_memory(future.window('river', 2), values)
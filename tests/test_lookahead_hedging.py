@@ -13,9 +13,10 @@ from pathlib import Path
 
 from hydrosim.nodes import StorageNode, SourceNode, DemandNode
 from hydrosim.links import Link
+from hydrosim.exceptions import SolverTimeLimitError
 from hydrosim.solver import LinearProgrammingSolver, LookaheadSolver
 from hydrosim.strategies import TimeSeriesStrategy, MunicipalDemand
-from hydrosim.config import ElevationAreaVolume
+from hydrosim.config import ElevationAreaVolume, NetworkGraph
 from hydrosim.simulation import SimulationEngine
 from hydrosim.climate_engine import ClimateEngine
 from hydrosim.climate_sources import TimeSeriesClimateSource
@@ -321,6 +322,328 @@ def test_lookahead_regression_single_day():
     print("✅ Regression test passed: lookahead_days=1 matches myopic solver")
 
 
+def test_lookahead_solver_reports_current_duals(hedging_test_network):
+    """
+    Test that look-ahead duals value water by its use later in the horizon.
+    
+    Water stored on Day 1 will be delivered to the high priority demand on
+    Day 3, so it is worth more than the low priority delivery it replaces.
+    """
+    nodes = hedging_test_network['nodes']
+    links = hedging_test_network['links']
+    
+    solver = LookaheadSolver(lookahead_days=3, carryover_cost=-1.0, compute_duals=True)
+    solver.set_future_data({"source": [60.0, 0.0, 0.0]},
+                           {"low_demand": [50.0, 0.0, 0.0], "high_demand": [0.0, 0.0, 80.0]})
+    nodes[0].inflow = 60.0
+    nodes[2].request = 50.0
+    nodes[3].request = 0.0
+    constraints = {link.link_id: link.calculate_constraints() for link in links}
+    
+    solver.solve(nodes, links, constraints)
+    duals = solver.last_duals
+    
+    assert set(duals['nodes']) == {"source", "storage", "low_demand", "high_demand"}
+    assert set(duals['links']) == {link.link_id for link in links}
+    assert set(duals['storage']) == {"storage"}
+    assert duals['nodes']['storage'] > 500.0
+    
+    assert LookaheadSolver(lookahead_days=3).last_duals is None
+
+
+def test_lookahead_time_limit_fallback_chain(hedging_test_network, monkeypatch):
+    """
+    Test that running out of time falls back to cheaper problems in order.
+    
+    The horizons that "time out" are simulated by raising
+    SolverTimeLimitError, and each fallback is recorded.
+    """
+    nodes = hedging_test_network['nodes']
+    links = hedging_test_network['links']
+    nodes[0].inflow = 60.0
+    nodes[2].request = 50.0
+    nodes[3].request = 0.0
+    constraints = {link.link_id: link.calculate_constraints() for link in links}
+    
+    solver = LookaheadSolver(lookahead_days=6, time_limit=10.0)
+    solve_horizon = solver._solve_horizon
+    slowest = {'horizon': 7}
+    attempted = []
+    
+    def timed_solve(nodes, links, constraints, horizon):
+        attempted.append(horizon)
+        if horizon >= slowest['horizon']:
+            raise SolverTimeLimitError(solver.time_limit)
+        return solve_horizon(nodes, links, constraints, horizon)
+    
+    monkeypatch.setattr(solver, '_solve_horizon', timed_solve)
+    
+    solver.solve(nodes, links, constraints)
+    assert solver.last_fallback is None
+    
+    slowest['horizon'] = 6
+    solver.solve(nodes, links, constraints)
+    assert solver.last_fallback == 'shorter_horizon'
+    
+    slowest['horizon'] = 2
+    attempted.clear()
+    flows = solver.solve(nodes, links, constraints)
+    assert attempted == [6, 3, 1]
+    assert solver.last_fallback == 'myopic'
+    assert flows['storage_to_low'] == pytest.approx(50.0)
+    
+    # No LP finishes: yesterday's flows, scaled to today's smaller inflow
+    slowest['horizon'] = 1
+    nodes[0].inflow = 30.0
+    nodes[1].storage = 0.0
+    constraints = {link.link_id: link.calculate_constraints() for link in links}
+    flows = solver.solve(nodes, links, constraints)
+    assert solver.last_fallback == 'previous_solution'
+    assert flows['source_to_storage'] == pytest.approx(30.0)
+    assert flows['storage_to_low'] == pytest.approx(25.0)
+    assert nodes[1].storage == pytest.approx(5.0)
+    
+    assert solver.stats['fallback_shorter_horizon'] == 1
+    assert solver.stats['fallback_myopic'] == 1
+    assert solver.stats['fallback_previous_solution'] == 1
+
+
+def test_lp_solver_time_limit():
+    """Test that an exhausted time budget raises SolverTimeLimitError."""
+    with pytest.raises(ValueError, match="time_limit"):
+        LinearProgrammingSolver(time_limit=0.0)
+    with pytest.raises(ValueError, match="time_limit"):
+        LookaheadSolver(lookahead_days=2, time_limit=-1.0)
+    
+    source = SourceNode("source", TimeSeriesStrategy(
+        pd.DataFrame({'date': ['2024-01-01'], 'inflow': [10.0]}), 'inflow'))
+    eav_table = ElevationAreaVolume(elevations=[0, 100], areas=[1000, 1000], volumes=[0, 100])
+    storage = StorageNode("storage", 0.0, eav_table, max_storage=100.0)
+    link = Link("source_to_storage", source, storage, 200.0, 0.0)
+    source.outflows = [link]
+    storage.inflows = [link]
+    source.inflow = 10.0
+    constraints = {link.link_id: link.calculate_constraints()}
+    
+    solver = LinearProgrammingSolver(time_limit=1e-12)
+    with pytest.raises(SolverTimeLimitError):
+        solver.solve([source, storage], [link], constraints)
+    
+    solver.time_limit = None
+    flows = solver.solve([source, storage], [link], constraints)
+    assert flows["source_to_storage"] == pytest.approx(10.0)
+
+
+def test_lookahead_horizon_schedule_validation():
+    """Test that horizon schedules expand into period lengths."""
+    solver = LookaheadSolver(horizon_schedule=[(1, 14), (7, 11), (30, 9)])
+    assert len(solver.periods) == 34
+    assert solver.periods[:15] == [1] * 14 + [7]
+    assert solver.lookahead_days == 14 + 77 + 270
+    
+    assert LookaheadSolver(lookahead_days=3).periods == [1, 1, 1]
+    
+    with pytest.raises(ValueError, match="one-day period"):
+        LookaheadSolver(horizon_schedule=[(7, 4)])
+    with pytest.raises(ValueError, match="positive integers"):
+        LookaheadSolver(horizon_schedule=[(1, 0)])
+    with pytest.raises(ValueError, match="positive integers"):
+        LookaheadSolver(horizon_schedule=[(1, 2), (7.5, 2)])
+    with pytest.raises(ValueError, match="positive integers"):
+        LookaheadSolver(horizon_schedule=[(1, float('inf'))])
+    with pytest.raises(ValueError, match="positive integers"):
+        LookaheadSolver(horizon_schedule=[(1, float('nan'))])
+    with pytest.raises(ValueError, match="positive integers"):
+        LookaheadSolver(horizon_schedule=[(1, 2, 3)])
+    with pytest.raises(ValueError, match="at least one period"):
+        LookaheadSolver(horizon_schedule=[])
+
+
+def test_lookahead_horizon_schedule_aggregates_periods(hedging_test_network):
+    """
+    Test that coarse periods sum inflows and demands and scale link bounds.
+    
+    With one daily period followed by a two-day period, Day 3's high priority
+    demand falls in the second block, so the solver still hedges on Day 1.
+    """
+    nodes = hedging_test_network['nodes']
+    links = hedging_test_network['links']
+    
+    solver = LookaheadSolver(horizon_schedule=[(1, 1), (2, 1)], carryover_cost=-1.0)
+    solver.set_future_data({"source": [60.0, 5.0, 7.0]},
+                           {"low_demand": [50.0, 0.0, 0.0], "high_demand": [0.0, 0.0, 80.0]})
+    nodes[0].inflow = 60.0
+    nodes[2].request = 50.0
+    nodes[3].request = 0.0
+    constraints = {link.link_id: link.calculate_constraints() for link in links}
+    
+    expanded_nodes, expanded_links, expanded_constraints = solver._build_time_expanded_graph(
+        nodes, links, constraints)
+    by_id = {node.node_id: node for node in expanded_nodes}
+    assert len(expanded_nodes) == 8
+    assert by_id["source_t1"].inflow == pytest.approx(12.0)
+    assert by_id["high_demand_t1"].request == pytest.approx(80.0)
+    assert expanded_constraints["storage_to_high_t0"][1] == pytest.approx(100.0)
+    assert expanded_constraints["storage_to_high_t1"][1] == pytest.approx(200.0)
+    assert "storage_carryover_t0_to_t1" in expanded_constraints
+    
+    flows = solver.solve(nodes, links, constraints)
+    assert flows["storage_to_low"] < 25.0
+    assert flows["source_to_storage"] == pytest.approx(60.0)
+
+
+def test_lookahead_reoptimize_every_follows_plan(hedging_test_network, caplog):
+    """
+    Test that the horizon plan is reused for k days unless conditions deviate.
+    """
+    nodes = hedging_test_network['nodes']
+    links = hedging_test_network['links']
+    source, storage, low_demand, high_demand = nodes
+    
+    with pytest.raises(ValueError, match="reoptimize_every"):
+        LookaheadSolver(lookahead_days=3, reoptimize_every=0)
+    with pytest.raises(ValueError, match="reoptimize_tolerance"):
+        LookaheadSolver(lookahead_days=3, reoptimize_tolerance=-0.1)
+    with caplog.at_level("WARNING", logger="hydrosim.solver"):
+        LookaheadSolver(lookahead_days=1, reoptimize_every=3)
+    assert "no effect" in caplog.text
+    
+    solver = LookaheadSolver(lookahead_days=3, carryover_cost=-1.0, reoptimize_every=3)
+    solver.set_future_data({"source": [60.0, 0.0, 0.0]},
+                           {"low_demand": [50.0, 0.0, 0.0], "high_demand": [0.0, 0.0, 80.0]})
+    
+    def advance(flows, inflow, low, high):
+        storage.storage += flows["source_to_storage"] - flows["storage_to_low"] - flows["storage_to_high"]
+        source.inflow, low_demand.request, high_demand.request = inflow, low, high
+        return {link.link_id: link.calculate_constraints() for link in links}
+    
+    constraints = advance({"source_to_storage": 0.0, "storage_to_low": 0.0, "storage_to_high": 0.0},
+                          60.0, 50.0, 0.0)
+    flows = solver.solve(nodes, links, constraints)
+    constraints = advance(flows, 0.0, 0.0, 0.0)
+    flows = solver.solve(nodes, links, constraints)
+    constraints = advance(flows, 0.0, 0.0, 80.0)
+    flows = solver.solve(nodes, links, constraints)
+    
+    assert solver.stats['reoptimizations'] == 1
+    assert solver.stats['plan_reuses'] == 2
+    assert solver.stats['lp_solves'] == 1
+    assert flows["storage_to_high"] == pytest.approx(60.0)
+    
+    # k days have passed: the next timestep is solved again
+    constraints = advance(flows, 60.0, 50.0, 0.0)
+    solver.solve(nodes, links, constraints)
+    assert solver.stats['reoptimizations'] == 2
+    
+    # Realised inflow differs from the plan: re-solve
+    constraints = advance({"source_to_storage": 0.0, "storage_to_low": 0.0, "storage_to_high": 0.0},
+                          5.0, 0.0, 0.0)
+    solver.solve(nodes, links, constraints)
+    assert solver.stats['reoptimizations'] == 3
+    assert solver.stats['plan_reuses'] == 2
+
+
+class ScheduledDemand(MunicipalDemand):
+    """Demand following a fixed daily schedule, with a perfect forecast."""
+    
+    def __init__(self, schedule):
+        super().__init__(1, 1.0)
+        self.schedule = schedule
+        self.index = 0
+    
+    def calculate(self, climate):
+        value = self.schedule[min(self.index, len(self.schedule) - 1)]
+        self.index += 1
+        return value
+    
+    def get_future_demands(self, num_timesteps):
+        return [self.schedule[min(i, len(self.schedule) - 1)]
+                for i in range(self.index, self.index + num_timesteps)]
+
+
+def build_hedging_engine(network_data, solver, inflows, low_demands, high_demands,
+                         t_max=25.0, t_min=15.0):
+    """Build an engine for the hedging network with scheduled inflows and demands."""
+    days = len(inflows)
+    network = NetworkGraph()
+    source, storage, low_demand, high_demand = network_data['nodes']
+    source.generator = TimeSeriesStrategy(pd.DataFrame({'inflow': inflows}), 'inflow')
+    low_demand.demand_model = ScheduledDemand(low_demands)
+    high_demand.demand_model = ScheduledDemand(high_demands)
+    for node in network_data['nodes']:
+        node.inflows, node.outflows = [], []  # add_link connects them
+        network.add_node(node)
+    for link in network_data['links']:
+        network.add_link(link)
+    
+    climate_data = pd.DataFrame({
+        'precip': [0.0] * days,
+        't_max': [t_max] * days,
+        't_min': [t_min] * days,
+        'solar': [20.0] * days
+    }, index=pd.date_range('2024-01-01', periods=days, freq='D'))
+    climate_engine = ClimateEngine(TimeSeriesClimateSource(climate_data),
+                                   SiteConfig(latitude=45.0, elevation=1000.0),
+                                   datetime(2024, 1, 1))
+    return SimulationEngine(network, climate_engine, solver)
+
+
+def test_engine_run_advances_future_window(hedging_test_network, monkeypatch):
+    """
+    Test that the engine's look-ahead windows start at the current timestep.
+    
+    The source's time series and the demand schedules are forecast from the
+    run start, and the window moves one day per step, so each horizon sees
+    that day's values first rather than Day 1's.
+    """
+    solver = LookaheadSolver(lookahead_days=3, carryover_cost=-1.0)
+    horizons = []
+    build_graph = solver._build_time_expanded_graph
+    
+    def recording_build(nodes, links, constraints, horizon=None):
+        expanded = build_graph(nodes, links, constraints, horizon)
+        by_id = {node.node_id: node for node in expanded[0]}
+        horizons.append((
+            [by_id[f"source_t{t}"].inflow for t in range(3)],
+            [by_id[f"high_demand_t{t}"].request for t in range(3)],
+        ))
+        return expanded
+    
+    monkeypatch.setattr(solver, '_build_time_expanded_graph', recording_build)
+    
+    engine = build_hedging_engine(hedging_test_network, solver, [60.0, 0.0, 0.0],
+                                  [50.0, 0.0, 0.0], [0.0, 0.0, 80.0])
+    results = engine.run(3)
+    
+    assert horizons == [
+        ([60.0, 0.0, 0.0], [0.0, 0.0, 80.0]),
+        ([0.0, 0.0, 0.0], [0.0, 80.0, 80.0]),
+        ([0.0, 0.0, 0.0], [80.0, 80.0, 80.0]),
+    ]
+    assert solver.future_inflows.cursor == 3
+    assert results[0]['flows']['storage_to_low'] < 25.0
+
+
+def test_engine_reoptimize_every_with_evaporation(hedging_test_network):
+    """
+    Test that plans are followed in an engine run while the reservoir evaporates.
+    
+    Evaporation is not part of the plan, so realised storage falls below the
+    planned storage every day; the plan must still be followed.
+    """
+    solver = LookaheadSolver(lookahead_days=5, carryover_cost=-1.0, reoptimize_every=5)
+    engine = build_hedging_engine(hedging_test_network, solver, [25.0] * 14,
+                                  [10.0] * 14, [5.0] * 14)
+    results = engine.run(14)
+    
+    assert max(result['node_states']['storage']['evap_loss'] for result in results) > 0.0
+    assert solver.stats['reoptimizations'] == 3
+    assert solver.stats['plan_reuses'] == 11
+    for result in results:
+        assert result['flows']['storage_to_low'] == pytest.approx(10.0)
+        assert result['flows']['storage_to_high'] == pytest.approx(5.0)
+
+
 if __name__ == "__main__":
     # Run tests manually for debugging
     import sys
@@ -339,4 +662,4 @@ if __name__ == "__main__":
     print("\n=== Testing Regression (lookahead_days=1) ===")
     test_lookahead_regression_single_day()
     
-    print("\n🎉 All hedging tests completed!")
\ No newline at end of file
+    print("\n🎉 All hedging tests completed!")
@@ -0,0 +1,132 @@
+"""
+Tests for the series-link presolve.
+"""
+
+import pytest
+from datetime import datetime
+
+from hydrosim.climate import ClimateState
+from hydrosim.config import ElevationAreaVolume
+from hydrosim.exceptions import InfeasibleNetworkError
+from hydrosim.links import Link
+from hydrosim.nodes import DemandNode, JunctionNode, SourceNode, StorageNode
+from hydrosim.presolve import SeriesReduction
+from hydrosim.solver import LinearProgrammingSolver
+from hydrosim.strategies import DemandModel, GeneratorStrategy
+
+
+class ConstantGenerator(GeneratorStrategy):
+    def __init__(self, value: float):
+        self.value = value
+
+    def generate(self, climate: ClimateState) -> float:
+        return self.value
+
+
+class ConstantDemand(DemandModel):
+    def __init__(self, value: float):
+        self.value = value
+
+    def calculate(self, climate: ClimateState) -> float:
+        return self.value
+
+
+def connect(link_id, source, target, capacity, cost=0.0):
+    link = Link(link_id, source, target, physical_capacity=capacity, cost=cost)
+    source.outflows.append(link)
+    target.inflows.append(link)
+    return link
+
+
+def build_canal(capacities=(80.0, 60.0, 90.0, 70.0), inflow=100.0, request=75.0):
+    """Reservoir -> chain of gauge junctions -> city, plus a branch at the first gauge."""
+    climate = ClimateState(date=datetime(2024, 1, 1), precip=0.0, t_max=20.0,
+                           t_min=10.0, solar=15.0, et0=0.0)
+    eav = ElevationAreaVolume(elevations=[0.0, 10.0], areas=[1.0, 1.0], volumes=[0.0, 1000.0])
+    source = SourceNode("river", ConstantGenerator(inflow))
+    reservoir = StorageNode("reservoir", initial_storage=200.0, eav_table=eav, max_storage=1000.0)
+    gauges = [JunctionNode(f"gauge{i}") for i in range(len(capacities) - 1)]
+    city = DemandNode("city", ConstantDemand(request))
+    farm = DemandNode("farm", ConstantDemand(20.0))
+
+    links = [connect("intake", source, reservoir, 500.0)]
+    path = [reservoir] + gauges + [city]
+    for i, capacity in enumerate(capacities):
+        links.append(connect(f"reach{i}", path[i], path[i + 1], capacity, cost=1.0))
+    links[-1].cost = -1000.0
+    links.append(connect("farm_turnout", gauges[0], farm, 50.0, cost=-500.0))
+
+    nodes = [source, reservoir, *gauges, city, farm]
+    for node in nodes:
+        node.step(climate)
+    constraints = {link.link_id: link.calculate_constraints() for link in links}
+    return nodes, links, constraints
+
+
+def test_reduction_merges_series_chain():
+    """Junctions with one inflow and one outflow are removed."""
+    nodes, links, constraints = build_canal()
+    reduction = SeriesReduction(nodes, links)
+
+    # gauge0 has a branch, gauge1 and gauge2 are pass-through
+    assert reduction.removed_nodes == {"gauge1", "gauge2"}
+    assert len(reduction.chains) == 1
+
+    reduced_nodes, reduced_links, reduced = reduction.reduce(nodes, links, constraints)
+    arc = reduced_links[-1]
+    assert [link.link_id for link in arc.links] == ["reach1", "reach2", "reach3"]
+    assert arc.source.node_id == "gauge0" and arc.target.node_id == "city"
+    assert len(reduced_nodes) == len(nodes) - 2
+    assert len(reduced_links) == len(links) - 2
+    assert reduced[arc.link_id] == (0.0, 60.0, 1.0 + 1.0 - 1000.0)
+
+
+def test_reduction_applies_to_new_objects_with_same_topology():
+    """A cached reduction is applied to the objects passed in, not the ones it was built from."""
+    nodes, links, constraints = build_canal()
+    solver = LinearProgrammingSolver()
+    solver.solve(nodes, links, constraints)
+
+    nodes, links, constraints = build_canal(request=30.0)
+    flows = solver.solve(nodes, links, constraints)
+
+    assert flows["reach3"] == pytest.approx(30.0)
+    assert nodes[-2].request == 30.0
+
+
+def test_presolve_matches_full_solve():
+    """Flows are identical with and without presolve."""
+    nodes, links, constraints = build_canal()
+    full = LinearProgrammingSolver(presolve=False).solve(nodes, links, constraints)
+    full_storage = nodes[1].storage
+
+    nodes, links, constraints = build_canal()
+    flows = LinearProgrammingSolver().solve(nodes, links, constraints)
+
+    assert list(flows) == list(full)
+    for link_id, flow in full.items():
+        assert flows[link_id] == pytest.approx(flow, abs=1e-6)
+    assert nodes[1].storage == pytest.approx(full_storage, abs=1e-6)
+    # Limited by the smallest reach in the chain
+    assert flows["reach1"] == flows["reach2"] == flows["reach3"] == pytest.approx(60.0)
+
+
+def test_reduction_skips_closed_loops():
+    """A chain that returns to its start node is not merged."""
+    a = JunctionNode("a")
+    b = JunctionNode("b")
+    c = JunctionNode("c")
+    links = [connect("ab", a, b, 10.0), connect("bc", b, c, 10.0), connect("ca", c, a, 10.0)]
+    reduction = SeriesReduction([a, b, c], links)
+
+    assert reduction.chains == []
+    assert reduction.kept_links == [0, 1, 2]
+
+
+def test_presolve_infeasible_chain_raises():
+    """Conflicting bounds along a merged chain remain infeasible."""
+    nodes, links, constraints = build_canal()
+    constraints["reach2"] = (70.0, 90.0, 1.0)
+
+    with pytest.raises(InfeasibleNetworkError):
+        LinearProgrammingSolver().solve(nodes, links, constraints)
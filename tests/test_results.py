@@ -13,7 +13,14 @@ from datetime import datetime
 import tempfile
 import shutil
 
-from hydrosim.results import ResultsWriter
+from hydrosim.results import (
+    ResultsWriter,
+    ColumnarResultsWriter,
+    JSONLinesResultsWriter,
+    read_columnar_results,
+    iter_jsonl_results,
+    rank_binding_constraints,
+)
 from hydrosim.simulation import SimulationEngine
 from hydrosim.climate_engine import ClimateEngine
 from hydrosim.climate import ClimateState, SiteConfig
@@ -21,8 +28,9 @@ from hydrosim.climate_sources import TimeSeriesClimateSource
 from hydrosim.config import NetworkGraph, ElevationAreaVolume
 from hydrosim.nodes import StorageNode, SourceNode, DemandNode
 from hydrosim.links import Link
-from hydrosim.solver import LinearProgrammingSolver
+from hydrosim.solver import LinearProgrammingSolver, LookaheadSolver
 from hydrosim.strategies import TimeSeriesStrategy, MunicipalDemand
+import numpy as np
 import pandas as pd
 
 
@@ -575,3 +583,259 @@ def test_json_format_integration(simple_network, climate_engine, temp_output_dir
         assert 'source1' in timestep_data['node_states']
         assert 'storage1' in timestep_data['node_states']
         assert 'demand1' in timestep_data['node_states']
+
+
+def test_columnar_npz_tables(temp_output_dir, sample_timestep_result):
+    """Test columnar .npz output writes one wide table per result family."""
+    writer = ResultsWriter(output_dir=temp_output_dir, format='npz')
+    for t in range(3):
+        result = dict(sample_timestep_result, timestep=t)
+        writer.add_timestep(result)
+    
+    files = writer.write_all(prefix='run')
+    
+    assert set(files) == {'flows', 'storage', 'demands', 'sources', 'climate'}
+    
+    flows = read_columnar_results(files['flows'])
+    assert list(flows.columns) == ['timestep', 'date', 'link1', 'link2']
+    assert list(flows['timestep']) == [0, 1, 2]
+    assert flows['link1'].dtype == np.float64
+    assert flows['link2'].tolist() == [80.0, 80.0, 80.0]
+    
+    storage = read_columnar_results(files['storage'])
+    assert storage['storage1.storage'].iloc[0] == 15000.0
+    assert storage['storage1.evap_loss'].iloc[0] == 6.75
+    
+    climate = read_columnar_results(files['climate'])
+    assert list(climate.columns) == ['timestep', 'date', 'precip', 't_max', 't_min', 'solar', 'et0']
+    assert climate['et0'].iloc[2] == 4.5
+
+
+def test_columnar_parquet_row_groups(temp_output_dir, sample_timestep_result):
+    """Test Parquet output appends one row group per flush."""
+    pq = pytest.importorskip('pyarrow.parquet')
+    
+    with ColumnarResultsWriter(temp_output_dir, prefix='run', format='parquet',
+                               row_group_size=2, dtype='float32') as writer:
+        for t in range(5):
+            writer.add_timestep(dict(sample_timestep_result, timestep=t))
+    files = writer.close()
+    
+    metadata = pq.ParquetFile(files['flows']).metadata
+    assert metadata.num_rows == 5
+    assert metadata.num_row_groups == 3
+    
+    demands = read_columnar_results(files['demands'])
+    assert demands['demand1.request'].dtype == np.float32
+    assert demands['date'].iloc[0] == pd.Timestamp('2024-01-01')
+
+
+def test_columnar_rejects_new_entities(temp_output_dir, sample_timestep_result):
+    """Test that entities appearing after the first row group are rejected."""
+    writer = ColumnarResultsWriter(temp_output_dir, format='npz', row_group_size=1)
+    writer.add_timestep(sample_timestep_result)
+    
+    later = dict(sample_timestep_result, timestep=1)
+    later['flows'] = dict(sample_timestep_result['flows'], link3=5.0)
+    with pytest.raises(ValueError, match="New flows entities"):
+        writer.add_timestep(later)
+
+
+def test_columnar_invalid_format(temp_output_dir):
+    """Test that unknown columnar formats are rejected."""
+    with pytest.raises(ValueError, match="Columnar format must be"):
+        ColumnarResultsWriter(temp_output_dir, format='feather')
+
+
+def test_jsonl_streaming_roundtrip(temp_output_dir, sample_timestep_result):
+    """Test JSON Lines writer and iterator reader, with gzip compression."""
+    path = Path(temp_output_dir) / 'run.jsonl.gz'
+    with JSONLinesResultsWriter(path) as writer:
+        for t in range(4):
+            writer.add_timestep(dict(sample_timestep_result, timestep=t))
+    
+    assert writer.compress
+    assert writer.timesteps_written == 4
+    
+    records = iter_jsonl_results(path)
+    first = next(records)
+    assert first['timestep'] == 0
+    assert first['date'] == '2024-01-01'
+    assert first['flows'] == {'link1': 100.0, 'link2': 80.0}
+    assert [r['timestep'] for r in records] == [1, 2, 3]
+
+
+def test_jsonl_format_matches_json(temp_output_dir, sample_timestep_result):
+    """Test that 'jsonl' format writes the same records as 'json'."""
+    json_writer = ResultsWriter(output_dir=temp_output_dir, format='json')
+    jsonl_writer = ResultsWriter(output_dir=temp_output_dir, format='jsonl')
+    for t in range(2):
+        json_writer.add_timestep(dict(sample_timestep_result, timestep=t))
+        jsonl_writer.add_timestep(dict(sample_timestep_result, timestep=t))
+    
+    json_file = json_writer.write_all(prefix='sim')['all']
+    jsonl_file = jsonl_writer.write_all(prefix='sim')['all']
+    
+    assert jsonl_file.endswith('sim_all.jsonl')
+    with open(json_file) as f:
+        assert list(iter_jsonl_results(jsonl_file)) == json.load(f)
+
+
+def test_engine_run_streams_to_sink(temp_output_dir, simple_network, climate_engine):
+    """Test that SimulationEngine.run feeds sinks without keeping results."""
+    engine = SimulationEngine(simple_network, climate_engine, LinearProgrammingSolver())
+    path = Path(temp_output_dir) / 'run.jsonl'
+    
+    with JSONLinesResultsWriter(path) as sink:
+        results = engine.run(3, sinks=[sink], keep_results=False)
+    
+    assert results == []
+    records = list(iter_jsonl_results(path))
+    assert [r['timestep'] for r in records] == [0, 1, 2]
+    assert 'storage1' in records[-1]['node_states']
+
+
+def test_wide_csv_layout(temp_output_dir, sample_timestep_result):
+    """Test wide CSV layout writes one row per day and one column per entity."""
+    writer = ResultsWriter(output_dir=temp_output_dir, format='csv', layout='wide')
+    for t in range(3):
+        writer.add_timestep(dict(sample_timestep_result, timestep=t))
+    
+    files = writer.write_all(prefix='wide')
+    assert set(files) == {'flows', 'storage', 'demands', 'sources', 'climate'}
+    
+    with open(files['flows'], 'r') as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 3
+    assert list(rows[0].keys()) == ['timestep', 'date', 'link1', 'link2']
+    assert rows[0]['date'] == '2024-01-01'
+    assert float(rows[2]['link1']) == 100.0
+    
+    with open(files['storage'], 'r') as f:
+        rows = list(csv.DictReader(f))
+    assert float(rows[0]['storage1.storage']) == 15000.0
+    assert float(rows[0]['storage1.evap_loss']) == 6.75
+
+
+def test_wide_csv_matches_long_csv(temp_output_dir, simple_network, climate_engine):
+    """Test that wide and long CSV layouts contain the same flow values."""
+    engine = SimulationEngine(simple_network, climate_engine, LinearProgrammingSolver())
+    long_writer = ResultsWriter(output_dir=temp_output_dir, format='csv')
+    wide_writer = ResultsWriter(output_dir=temp_output_dir, format='csv', layout='wide')
+    engine.run(4, sinks=[long_writer, wide_writer])
+    
+    long_file = long_writer.write_all(prefix='long')['demands']
+    wide_file = wide_writer.write_all(prefix='wide')['demands']
+    
+    long_df = pd.read_csv(long_file)
+    wide_df = pd.read_csv(wide_file)
+    assert len(wide_df) == 4
+    assert np.allclose(long_df['deficit'].values, wide_df['demand1.deficit'].values)
+
+
+def test_invalid_layout(temp_output_dir):
+    """Test that an invalid CSV layout raises an error."""
+    with pytest.raises(ValueError, match="Layout must be 'long' or 'wide'"):
+        ResultsWriter(output_dir=temp_output_dir, layout='tall')
+
+
+def test_results_record_duals(temp_output_dir, simple_network, climate_engine):
+    """Test that solver duals are written as long CSV and wide tables."""
+    engine = SimulationEngine(simple_network, climate_engine,
+                              LinearProgrammingSolver(compute_duals=True))
+    long_writer = ResultsWriter(output_dir=temp_output_dir, format='csv')
+    wide_writer = ResultsWriter(output_dir=temp_output_dir, format='csv', layout='wide')
+    results = engine.run(3, sinks=[long_writer, wide_writer])
+    
+    assert set(results[0]['duals']) == {'nodes', 'links', 'storage'}
+    
+    long_df = pd.read_csv(long_writer.write_all(prefix='long')['duals'])
+    assert len(long_df) == 3 * (3 + 2 + 1)
+    assert set(long_df['element']) == {'node', 'link', 'storage'}
+    
+    wide_files = wide_writer.write_all(prefix='wide')
+    nodes_df = pd.read_csv(wide_files['node_duals'])
+    assert list(nodes_df.columns) == ['timestep', 'date', 'source1', 'storage1', 'demand1']
+    assert nodes_df['storage1'].tolist() == pytest.approx([1.0] * 3)
+
+
+def test_rank_binding_constraints():
+    """Test that binding bounds are ranked by their total dual over the run."""
+    def result(t, capacity_dual, min_flow_dual, storage_dual):
+        return {
+            'timestep': t,
+            'date': datetime(2024, 1, 1 + t),
+            'flows': {'canal': 10.0, 'bypass': 5.0, 'spill': 0.0},
+            'node_states': {},
+            'duals': {
+                'nodes': {'reservoir': 1.0},
+                'links': {'canal': capacity_dual, 'bypass': min_flow_dual, 'spill': 0.0},
+                'storage': {'reservoir': storage_dual},
+            },
+        }
+    
+    results = [
+        result(0, -5.0, 0.0, 0.0),
+        result(1, -3.0, 2.0, -1.0),
+        result(2, 0.0, 2.0, 0.0),
+    ]
+    ranking = rank_binding_constraints(results)
+    
+    assert ranking[['element', 'element_id', 'bound']].values.tolist() == [
+        ['link', 'canal', 'upper'],
+        ['link', 'bypass', 'lower'],
+        ['storage', 'reservoir', 'upper'],
+    ]
+    assert ranking['binding_days'].tolist() == [2, 2, 1]
+    assert ranking['total_dual'].tolist() == pytest.approx([8.0, 4.0, 1.0])
+    assert ranking['mean_dual'].tolist() == pytest.approx([4.0, 2.0, 1.0])
+    assert ranking['max_dual'].tolist() == pytest.approx([5.0, 2.0, 1.0])
+    assert len(rank_binding_constraints(results, top=1)) == 1
+
+
+def test_rank_binding_constraints_requires_duals(sample_timestep_result):
+    """Test that ranking results without duals raises an error."""
+    with pytest.raises(ValueError, match="no duals"):
+        rank_binding_constraints([sample_timestep_result])
+
+
+def test_results_record_time_limit_fallbacks(temp_output_dir, simple_network, climate_engine):
+    """Test that solver fallbacks are recorded in results and written to CSV."""
+    solver = LookaheadSolver(lookahead_days=1, time_limit=1e-12)
+    engine = SimulationEngine(simple_network, climate_engine, solver)
+    writer = ResultsWriter(output_dir=temp_output_dir, format='csv')
+    results = [engine.step() for _ in range(2)]
+    for result in results:
+        writer.add_timestep(result)
+    
+    assert [r['fallback'] for r in results] == ['previous_solution'] * 2
+    assert all(flow == 0.0 for flow in results[0]['flows'].values())
+    
+    files = writer.write_all(prefix='fallback')
+    fallbacks = pd.read_csv(files['fallbacks'])
+    assert fallbacks['fallback'].tolist() == ['previous_solution'] * 2
+
+
+@pytest.mark.parametrize('format', ['npz', 'parquet'])
+def test_columnar_records_fallbacks(temp_output_dir, sample_timestep_result, format):
+    """Test that columnar output writes a fallbacks table for fallback timesteps."""
+    if format == 'parquet':
+        pytest.importorskip('pyarrow')
+    writer = ResultsWriter(output_dir=temp_output_dir, format=format)
+    for t in range(3):
+        result = dict(sample_timestep_result, timestep=t)
+        if t > 0:
+            result['fallback'] = 'myopic'
+        writer.add_timestep(result)
+    
+    files = writer.write_all(prefix='run')
+    
+    fallbacks = read_columnar_results(files['fallbacks'])
+    assert list(fallbacks.columns) == ['timestep', 'date', 'fallback']
+    assert fallbacks['timestep'].tolist() == [1, 2]
+    assert fallbacks['fallback'].tolist() == ['myopic', 'myopic']
+    
+    # No fallbacks, no table
+    writer = ResultsWriter(output_dir=temp_output_dir, format=format)
+    writer.add_timestep(sample_timestep_result)
+    assert 'fallbacks' not in writer.write_all(prefix='clean')
@@ -0,0 +1,204 @@
+"""
+Tests for results visualization.
+
+These tests verify that ResultsVisualizer builds its plotting DataFrames
+and per-node flow aggregates correctly from simulation results.
+"""
+
+import pytest
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from hydrosim.results import ResultsWriter, collect_result_tables
+from hydrosim.results_viz import ResultsVisualizer, lttb_indices, minmax_indices
+from hydrosim.climate import ClimateState
+from hydrosim.config import NetworkGraph, ElevationAreaVolume
+from hydrosim.nodes import StorageNode, SourceNode, DemandNode, JunctionNode
+from hydrosim.links import Link
+from hydrosim.strategies import TimeSeriesStrategy, MunicipalDemand
+
+
+@pytest.fixture
+def network():
+    """Create a network with a storage node fed by two links."""
+    network = NetworkGraph()
+
+    eav = ElevationAreaVolume(
+        elevations=[100.0, 110.0],
+        areas=[1000.0, 2000.0],
+        volumes=[0.0, 50000.0]
+    )
+    inflow_data = pd.DataFrame({'inflow': [100.0] * 3})
+
+    source = SourceNode('source1', TimeSeriesStrategy(inflow_data, 'inflow'))
+    junction = JunctionNode('junction1')
+    storage = StorageNode('storage1', initial_storage=15000.0, eav_table=eav, max_storage=50000.0)
+    demand = DemandNode('demand1', MunicipalDemand(population=100, per_capita_demand=0.5))
+    for node in (source, junction, storage, demand):
+        network.add_node(node)
+
+    network.add_link(Link('src_to_res', source, storage, 200.0, 1.0))
+    network.add_link(Link('src_to_jct', source, junction, 200.0, 1.0))
+    network.add_link(Link('jct_to_res', junction, storage, 200.0, 1.0))
+    network.add_link(Link('res_to_dem', storage, demand, 200.0, 1.0))
+    network.add_link(Link('res_spill', storage, junction, 200.0, 1.0))
+
+    return network
+
+
+def make_result(t):
+    """Create a synthetic timestep result."""
+    date = datetime(2024, 1, 1 + t)
+    return {
+        'timestep': t,
+        'date': date,
+        'climate': ClimateState(date=date, precip=1.0 + t, t_max=20.0, t_min=10.0,
+                                solar=15.0, et0=3.0),
+        'node_states': {
+            'source1': {'inflow': 100.0},
+            'junction1': {},
+            'storage1': {'storage': 15000.0 + t, 'elevation': 103.0,
+                         'surface_area': 1300.0, 'evap_loss': 2.0},
+            'demand1': {'request': 50.0, 'delivered': 40.0 + t, 'deficit': 10.0 - t},
+        },
+        'flows': {
+            'src_to_res': 60.0 + t,
+            'src_to_jct': 40.0,
+            'jct_to_res': 30.0,
+            'res_to_dem': 40.0 + t,
+            'res_spill': 5.0 * t,
+        }
+    }
+
+
+@pytest.fixture
+def writer(tmp_path):
+    """Create a results writer holding three timesteps."""
+    writer = ResultsWriter(output_dir=str(tmp_path))
+    for t in range(3):
+        writer.add_timestep(make_result(t))
+    return writer
+
+
+def test_long_format_frames(writer, network):
+    """Test that long-format frames keep the per-timestep row layout."""
+    viz = ResultsVisualizer(writer, network)
+
+    assert list(viz.df_flows.columns) == ['date', 'link_id', 'flow']
+    assert len(viz.df_flows) == 15
+    assert list(viz.df_flows['link_id'][:5]) == [
+        'src_to_res', 'src_to_jct', 'jct_to_res', 'res_to_dem', 'res_spill'
+    ]
+    assert viz.df_flows['flow'].iloc[5] == 61.0
+
+    assert list(viz.df_storage.columns) == [
+        'date', 'node_id', 'storage', 'elevation', 'surface_area', 'evap_loss'
+    ]
+    assert list(viz.df_storage['storage']) == [15000.0, 15001.0, 15002.0]
+
+    assert list(viz.df_demands['deficit']) == [10.0, 9.0, 8.0]
+    assert list(viz.df_sources['node_id']) == ['source1'] * 3
+
+    assert list(viz.df_climate.columns) == ['date', 'precip', 'tmax', 'tmin', 'solar', 'et0']
+    assert viz.df_climate['date'].iloc[2] == pd.Timestamp('2024-01-03')
+
+
+def test_node_flow_aggregates(writer, network):
+    """Test inflow, outflow and spill aggregation over link incidence."""
+    viz = ResultsVisualizer(writer, network)
+
+    inflows = viz._calculate_node_inflows('storage1')
+    assert list(inflows.columns) == ['date', 'flow']
+    assert list(inflows['flow']) == [90.0, 91.0, 92.0]
+
+    outflows = viz._calculate_node_outflows('storage1')
+    assert list(outflows['flow']) == [40.0, 41.0, 42.0]
+
+    spills = viz._calculate_node_spills('storage1')
+    assert list(spills['flow']) == [0.0, 5.0, 10.0]
+
+    # Junction receives both the source link and the spill link
+    assert list(viz._calculate_node_inflows('junction1')['flow']) == [40.0, 45.0, 50.0]
+    # Demand node has no outflow links
+    assert viz._calculate_node_outflows('demand1').empty
+
+
+def test_visualizer_from_tables(writer, network):
+    """Test that pre-built columnar tables can be used without a writer."""
+    tables = collect_result_tables(writer.get_results())
+    viz = ResultsVisualizer(None, network, tables=tables)
+
+    assert len(viz.df_flows) == 15
+    fig = viz.generate_all_plots()
+    assert len(fig.data) > 0
+
+
+def test_empty_results(tmp_path, network):
+    """Test that empty results produce empty frames."""
+    viz = ResultsVisualizer(ResultsWriter(output_dir=str(tmp_path)), network)
+
+    assert viz.df_flows.empty
+    assert viz.df_climate.empty
+    assert viz._calculate_node_inflows('storage1').empty
+
+
+def test_lttb_keeps_endpoints_and_peak():
+    """Test LTTB decimation keeps the endpoints and an isolated spike."""
+    x = np.arange(10000, dtype=float)
+    y = np.sin(x / 500.0)
+    y[4321] = 50.0
+
+    keep = lttb_indices(x, y, 200)
+
+    assert len(keep) == 200
+    assert keep[0] == 0 and keep[-1] == 9999
+    assert np.all(np.diff(keep) > 0)
+    assert 4321 in keep
+
+
+def test_minmax_keeps_extremes():
+    """Test min/max decimation keeps the global minimum and maximum."""
+    rng = np.random.default_rng(42)
+    y = rng.normal(size=5001)
+    y[1234] = -99.0
+    y[4000] = 99.0
+    y[10] = np.nan
+
+    keep = minmax_indices(y, 100)
+
+    assert len(keep) <= 102
+    assert 1234 in keep and 4000 in keep
+    assert keep[-1] == 5000
+
+
+def test_trace_decimation_and_webgl(writer, network):
+    """Test that traces are decimated and rendered with WebGL when configured."""
+    viz = ResultsVisualizer(writer, network, {'layout': {'max_points': 10, 'webgl': True}})
+    dates = pd.date_range('2000-01-01', periods=3650, freq='D')
+    values = np.arange(3650, dtype=float)
+
+    trace = viz._trace({}, dates, values, name='x')
+    assert isinstance(trace, go.Scattergl)
+    assert len(trace.y) == 10
+
+    trace = viz._trace({'webgl': False, 'decimation': 'none'}, dates, values)
+    assert isinstance(trace, go.Scatter)
+    assert len(trace.y) == 3650
+
+
+def test_trace_aggregation(writer, network):
+    """Test monthly and annual aggregated plot views."""
+    viz = ResultsVisualizer(writer, network)
+    dates = pd.date_range('2000-01-01', '2001-12-31', freq='D')
+    values = np.where(dates.year == 2000, 1.0, 3.0)
+
+    annual = viz._trace({'aggregate': 'annual'}, dates, values)
+    assert list(annual.y) == [1.0, 3.0]
+
+    monthly = viz._trace({'aggregate': 'monthly'}, dates, values)
+    assert len(monthly.y) == 24
+
+    with pytest.raises(ValueError, match="aggregate must be"):
+        viz._trace({'aggregate': 'weekly'}, dates, values)
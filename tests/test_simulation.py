@@ -336,6 +336,28 @@ def test_get_network_state(simple_network, climate_engine):
     assert isinstance(state['demand1'], dict)
 
 
+def test_get_solver_stats(simple_network, climate_engine):
+    """Test that solver counters are exposed by the engine."""
+    engine = SimulationEngine(simple_network, climate_engine, LinearProgrammingSolver())
+    assert engine.get_solver_stats() == {'lp_solves': 0, 'cache_hits': 0, 'cache_misses': 0, 'basis_reuses': 0}
+    
+    engine.run(3)
+    stats = engine.get_solver_stats()
+    assert stats['cache_hits'] + stats['cache_misses'] == 3
+    assert stats['lp_solves'] == stats['cache_misses']
+
+
+def test_run_closes_solver(simple_network, climate_engine):
+    """Test that the engine releases the solver's resources after a run."""
+    solver = LinearProgrammingSolver(max_workers=2)
+    closed = []
+    solver.close = lambda: closed.append(True)
+    engine = SimulationEngine(simple_network, climate_engine, solver)
+    
+    engine.run(2)
+    assert closed == [True]
+
+
 def test_storage_mass_balance_over_multiple_timesteps(simple_network, climate_engine):
     """Test that storage mass balance is maintained over multiple timesteps."""
     solver = LinearProgrammingSolver()
@@ -279,3 +279,288 @@ def test_solver_infeasible_network():
     from hydrosim.exceptions import InfeasibleNetworkError
     with pytest.raises(InfeasibleNetworkError, match="Network flow optimization is infeasible"):
         solver.solve([source, demand], [link], constraints)
+
+
+def create_basins(num_basins: int):
+    """Create independent source -> storage -> demand basins plus an
+    isolated reservoir and a storage-free basin, stepped and ready to solve."""
+    eav = ElevationAreaVolume(
+        elevations=[100.0, 200.0], areas=[0.1, 0.1], volumes=[0.0, 1000.0]
+    )
+    nodes, links = [], []
+    
+    def connect(link_id, source, target, capacity, cost):
+        link = Link(link_id, source, target, physical_capacity=capacity, cost=cost)
+        source.outflows.append(link)
+        target.inflows.append(link)
+        links.append(link)
+    
+    for i in range(num_basins):
+        source = SourceNode(f"source{i}", MockGeneratorStrategy(20.0 * i))
+        storage = StorageNode(f"storage{i}", initial_storage=50.0 * (i + 1),
+                              eav_table=eav, max_storage=500.0)
+        demand = DemandNode(f"demand{i}", MockDemandModel(40.0 + 10.0 * i))
+        nodes.extend([source, storage, demand])
+        connect(f"inflow{i}", source, storage, 1000.0, 0.0)
+        connect(f"release{i}", storage, demand, 60.0, -1000.0)
+    
+    nodes.append(StorageNode("isolated", initial_storage=400.0, eav_table=eav,
+                             max_storage=500.0))
+    
+    source = SourceNode("river_source", MockGeneratorStrategy(30.0))
+    junction = JunctionNode("river_junction")
+    demand = DemandNode("river_demand", MockDemandModel(50.0))
+    nodes.extend([source, junction, demand])
+    connect("river_reach", source, junction, 100.0, 0.0)
+    connect("river_diversion", junction, demand, 100.0, -1000.0)
+    
+    climate = create_test_climate()
+    for node in nodes:
+        node.step(climate)
+    constraints = {link.link_id: link.calculate_constraints() for link in links}
+    return nodes, links, constraints
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_solver_decomposition_matches_combined_solve(max_workers):
+    """Solving connected components separately gives the combined optimum."""
+    nodes, links, constraints = create_basins(6)
+    combined = LinearProgrammingSolver(decompose=False).solve(nodes, links, constraints)
+    combined_storage = {n.node_id: n.storage for n in nodes if n.node_type == "storage"}
+    
+    nodes, links, constraints = create_basins(6)
+    solver = LinearProgrammingSolver(max_workers=max_workers)
+    flows = solver.solve(nodes, links, constraints)
+    
+    assert list(flows) == list(combined)
+    for link_id, flow in combined.items():
+        assert flows[link_id] == pytest.approx(flow, abs=1e-6)
+    for node in nodes:
+        if node.node_type == "storage":
+            assert node.storage == pytest.approx(combined_storage[node.node_id], abs=1e-6)
+    
+    # 6 basins + isolated reservoir + storage-free river
+    assert len(solver._component_cache) == 8
+    assert flows["river_diversion"] == pytest.approx(30.0)
+    assert nodes[18].storage == pytest.approx(400.0 - nodes[18].evap_loss)
+
+
+def test_solver_decomposition_unlinked_source_is_infeasible():
+    """A source with no links is infeasible whether or not the LP is decomposed."""
+    from hydrosim.exceptions import InfeasibleNetworkError
+    for decompose in (False, True):
+        nodes, links, constraints = create_basins(2)
+        source = SourceNode("stranded", MockGeneratorStrategy(25.0))
+        source.step(create_test_climate())
+        storage = [node.storage for node in nodes if node.node_type == "storage"]
+        
+        with pytest.raises(InfeasibleNetworkError, match="stranded"):
+            LinearProgrammingSolver(decompose=decompose).solve(nodes + [source], links, constraints)
+        assert [node.storage for node in nodes if node.node_type == "storage"] == storage
+
+
+def test_solver_close_shuts_down_thread_pool():
+    """close() stops the component workers; the solver can still be used."""
+    nodes, links, constraints = create_basins(3)
+    with LinearProgrammingSolver(max_workers=2, cache_size=0) as solver:
+        solver.solve(nodes, links, constraints)
+        executor = solver._executor
+        assert executor is not None
+    
+    assert solver._executor is None
+    assert executor._shutdown
+    solver.close()
+    
+    nodes, links, constraints = create_basins(3)
+    flows = solver.solve(nodes, links, constraints)
+    assert flows["release0"] == pytest.approx(40.0)
+    solver.close()
+
+
+def test_solver_decomposition_cached_per_topology():
+    """Components are found once and reused while the topology is unchanged."""
+    nodes, links, constraints = create_basins(3)
+    solver = LinearProgrammingSolver()
+    solver.solve(nodes, links, constraints)
+    components = solver._component_cache
+    
+    solver.solve(nodes, links, constraints)
+    assert solver._component_cache is components
+    
+    nodes, links, constraints = create_basins(4)
+    solver.solve(nodes, links, constraints)
+    assert solver._component_cache is not components
+    assert len(solver._component_cache) == 6
+
+
+def test_solver_rejects_invalid_max_workers():
+    """max_workers must be positive."""
+    with pytest.raises(ValueError, match="max_workers"):
+        LinearProgrammingSolver(max_workers=0)
+
+
+def create_source_demand(inflow: float, request: float):
+    """Create a stepped source -> demand network."""
+    source = SourceNode("source1", MockGeneratorStrategy(inflow))
+    demand = DemandNode("demand1", MockDemandModel(request))
+    link = Link("link1", source, demand, physical_capacity=200.0, cost=1.0)
+    source.outflows.append(link)
+    demand.inflows.append(link)
+    climate = create_test_climate()
+    source.step(climate)
+    demand.step(climate)
+    return [source, demand], [link], {"link1": link.calculate_constraints()}
+
+
+def test_solver_reuses_solution_of_identical_problem():
+    """An unchanged problem is answered from the solution cache."""
+    solver = LinearProgrammingSolver()
+    first = solver.solve(*create_source_demand(100.0, 50.0))
+    second = solver.solve(*create_source_demand(100.0, 50.0))
+    
+    assert second == first
+    assert solver.stats == {'lp_solves': 1, 'cache_hits': 1, 'cache_misses': 1, 'basis_reuses': 0}
+    
+    changed = solver.solve(*create_source_demand(100.0, 60.0))
+    assert changed["link1"] == pytest.approx(60.0)
+    assert solver.stats == {'lp_solves': 2, 'cache_hits': 1, 'cache_misses': 2, 'basis_reuses': 0}
+
+
+def test_solver_cache_evicts_least_recently_used():
+    """The cache keeps at most cache_size solutions."""
+    solver = LinearProgrammingSolver(cache_size=2)
+    for request in (10.0, 20.0, 10.0, 30.0, 20.0):
+        solver.solve(*create_source_demand(100.0, request))
+    
+    # 10 is reused; 20 was evicted by 30
+    assert solver.stats['cache_hits'] == 1
+    assert solver.stats['lp_solves'] == 4
+    assert len(solver._solution_cache) == 2
+
+
+def test_solver_cache_disabled():
+    """cache_size=0 always calls the LP solver."""
+    solver = LinearProgrammingSolver(cache_size=0)
+    for _ in range(3):
+        solver.solve(*create_source_demand(100.0, 50.0))
+    
+    assert solver.stats == {'lp_solves': 3, 'cache_hits': 0, 'cache_misses': 0, 'basis_reuses': 0}
+    
+    with pytest.raises(ValueError, match="cache_size"):
+        LinearProgrammingSolver(cache_size=-1)
+
+
+def test_solver_basis_reuse_matches_lp():
+    """Re-using the optimal basis gives the LP solution for small daily changes."""
+    def run(reuse_basis):
+        nodes, links, _ = create_basins(4)
+        solver = LinearProgrammingSolver(cache_size=0, reuse_basis=reuse_basis)
+        climate = create_test_climate()
+        history = []
+        for day in range(20):
+            for node in nodes:
+                if node.node_id.startswith("demand"):
+                    node.demand_model.value = 15.0 + (day % 5)
+                elif node.node_id.startswith("source"):
+                    node.generator.value = 20.0 + (day % 3)
+                node.step(climate)
+            constraints = {link.link_id: link.calculate_constraints() for link in links}
+            flows = solver.solve(nodes, links, constraints)
+            storage = {n.node_id: n.storage for n in nodes if n.node_type == "storage"}
+            history.append((flows, storage))
+        return history, solver.stats
+    
+    expected, lp_stats = run(False)
+    actual, stats = run(True)
+    
+    for (flows, storage), (expected_flows, expected_storage) in zip(actual, expected):
+        assert flows == pytest.approx(expected_flows, abs=1e-6)
+        assert storage == pytest.approx(expected_storage, abs=1e-6)
+    assert lp_stats['basis_reuses'] == 0
+    assert stats['basis_reuses'] > stats['lp_solves']
+    assert stats['basis_reuses'] + stats['lp_solves'] == lp_stats['lp_solves']
+
+
+def test_solver_basis_reuse_falls_back_when_infeasible():
+    """HiGHS is called again once the stored basis is no longer feasible."""
+    solver = LinearProgrammingSolver(cache_size=0, reuse_basis=True)
+    nodes, links, constraints = create_basins(1)
+    solver.solve(nodes, links, constraints)
+    solves = solver.stats['lp_solves']
+    
+    # A request larger than the reservoir empties it, which moves the
+    # carryover link to its lower bound and changes the optimal basis
+    nodes, links, constraints = create_basins(1)
+    nodes[2].demand_model.value = 200.0
+    nodes[2].step(create_test_climate())
+    flows = solver.solve(nodes, links, constraints)
+    
+    assert flows["release0"] == pytest.approx(50.0, abs=0.01)
+    assert solver.stats['lp_solves'] > solves
+
+
+def test_solver_duals_value_water():
+    """Node duals are marginal water values measured against the Universal Sink."""
+    nodes, links, constraints = create_basins(3)
+    solver = LinearProgrammingSolver(compute_duals=True)
+    solver.solve(nodes, links, constraints)
+    duals = solver.last_duals
+    
+    # Extra water in a reservoir with room is stored (COST_STORAGE)
+    assert duals['nodes']['storage0'] == pytest.approx(1.0)
+    assert duals['nodes']['isolated'] == pytest.approx(1.0)
+    assert duals['storage']['storage0'] == pytest.approx(0.0)
+    # A met demand displaces a release that would otherwise have been stored
+    assert duals['nodes']['demand0'] == pytest.approx(-999.0)
+    # Water on the short river goes straight to its unmet demand; the
+    # junction was removed by presolve and its dual recovered
+    assert duals['nodes']['river_source'] == pytest.approx(1000.0)
+    assert duals['nodes']['river_junction'] == pytest.approx(1000.0)
+    
+    for link in links:
+        q_min, q_max, cost = constraints[link.link_id]
+        reduced_cost = cost + duals['nodes'][link.source.node_id] - duals['nodes'][link.target.node_id]
+        assert duals['links'][link.link_id] == pytest.approx(reduced_cost, abs=1e-9)
+    
+    nodes, links, constraints = create_basins(3)
+    plain = LinearProgrammingSolver(decompose=False, presolve=False, compute_duals=True)
+    plain.solve(nodes, links, constraints)
+    assert plain.last_duals['nodes'] == pytest.approx(duals['nodes'])
+    assert plain.last_duals['links'] == pytest.approx(duals['links'])
+    
+    assert LinearProgrammingSolver().last_duals is None
+
+
+def test_solver_duals_binding_capacity():
+    """A link at capacity has a negative dual: the value of extra capacity."""
+    nodes, links, _ = create_basins(1)
+    nodes[1].storage = 400.0
+    nodes[2].demand_model.value = 200.0
+    climate = create_test_climate()
+    for node in nodes:
+        node.step(climate)
+    constraints = {link.link_id: link.calculate_constraints() for link in links}
+    
+    solver = LinearProgrammingSolver(compute_duals=True)
+    flows = solver.solve(nodes, links, constraints)
+    
+    assert flows["release0"] == pytest.approx(60.0)
+    assert solver.last_duals['links']['release0'] == pytest.approx(-999.0)
+    assert solver.last_duals['links']['inflow0'] == pytest.approx(0.0)
+
+
+def test_solver_duals_from_cache_and_basis():
+    """Cached solutions and re-used bases report the duals of the LP solve."""
+    solver = LinearProgrammingSolver(compute_duals=True, reuse_basis=True)
+    solver.solve(*create_basins(2))
+    expected = solver.last_duals
+    
+    solver.solve(*create_basins(2))
+    assert solver.stats['cache_hits'] > 0
+    assert solver.last_duals == expected
+    
+    solver = LinearProgrammingSolver(compute_duals=True, reuse_basis=True, cache_size=0)
+    solver.solve(*create_basins(2))
+    solver.solve(*create_basins(2))
+    assert solver.stats['basis_reuses'] > 0
+    assert solver.last_duals == expected
@@ -6,6 +6,7 @@ TimeSeriesStrategy, HydrologyStrategy, Snow17Model, and AWBMModel.
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from hydrosim.climate import ClimateState
@@ -67,6 +68,24 @@ def test_timeseries_strategy_exhausted():
         strategy.generate(climate)
 
 
+def test_timeseries_strategy_array_input():
+    """Test TimeSeriesStrategy uses float64 arrays without copying."""
+    values = np.array([10.0, 20.0, 30.0])
+    strategy = TimeSeriesStrategy(values, 'inflow')
+    
+    assert np.shares_memory(strategy.values, values)
+    assert strategy.get_future_values(5).tolist() == [10.0, 20.0, 30.0, 30.0, 30.0]
+    assert np.shares_memory(strategy.get_future_values(2), values)
+    
+    # Windows cannot be used to modify the series
+    window = strategy.get_future_values(2)
+    with pytest.raises(ValueError):
+        window[0] = -1.0
+    assert values[0] == 10.0
+    assert values.flags.writeable
+    assert list(strategy.data['inflow']) == [10.0, 20.0, 30.0]
+
+
 # Snow17Model Tests
 
 def test_snow17_creation():
@@ -0,0 +1,191 @@
+"""
+Tests for shared time series input loading.
+
+These tests verify that the TimeSeriesFileRegistry reads each file once,
+keeps only requested columns, and hands out shared read-only views, and
+that memory-mapped binary tables can back sources and climate.
+"""
+
+import pickle
+from datetime import datetime
+
+import pytest
+import numpy as np
+import pandas as pd
+import yaml
+
+from hydrosim.config import YAMLParser
+from hydrosim.climate_sources import TimeSeriesClimateSource
+from hydrosim.exceptions import ClimateDataError
+from hydrosim.strategies import TimeSeriesStrategy
+from hydrosim.timeseries_io import TimeSeriesFileRegistry, convert_csv_to_npy, load_npy_table
+
+
+@pytest.fixture
+def gauges_csv(tmp_path):
+    """Create a CSV file with several gauge columns."""
+    csv_path = tmp_path / "gauges.csv"
+    pd.DataFrame({
+        'date': pd.date_range('2024-01-01', periods=5, freq='D'),
+        'gauge_a': [1.0, 2.0, 3.0, 4.0, 5.0],
+        'gauge_b': [10.0, 20.0, 30.0, 40.0, 50.0],
+        'gauge_c': [7.0] * 5,
+    }).to_csv(csv_path, index=False)
+    return csv_path
+
+
+def test_registry_reads_file_once(gauges_csv):
+    """Test that requested columns are loaded in a single read."""
+    registry = TimeSeriesFileRegistry()
+    registry.request(gauges_csv, 'gauge_a')
+    registry.request(gauges_csv, 'gauge_b')
+    
+    a = registry.get_column(gauges_csv, 'gauge_a')
+    b = registry.get_column(gauges_csv, 'gauge_b')
+    
+    assert registry.reads == 1
+    assert a.tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert b.dtype == np.float64
+    assert not a.flags.writeable
+
+
+def test_registry_views_share_memory(gauges_csv):
+    """Test that repeated requests for a column share one buffer."""
+    registry = TimeSeriesFileRegistry()
+    
+    first = registry.get_column(gauges_csv, 'gauge_a')
+    second = registry.get_column(gauges_csv, 'gauge_a')
+    
+    assert np.shares_memory(first, second)
+    assert registry.reads == 1
+
+
+def test_registry_late_column_and_missing_column(gauges_csv):
+    """Test unannounced columns trigger one extra read and missing columns raise."""
+    registry = TimeSeriesFileRegistry()
+    registry.get_column(gauges_csv, 'gauge_a')
+    
+    assert registry.get_column(gauges_csv, 'gauge_c').tolist() == [7.0] * 5
+    assert registry.reads == 2
+    
+    with pytest.raises(ValueError, match="Column 'gauge_x' not found"):
+        registry.get_column(gauges_csv, 'gauge_x')
+
+
+def test_parser_shares_time_series_file(tmp_path, gauges_csv):
+    """Test that source nodes referencing one file get views of a single load."""
+    pd.DataFrame({
+        'date': pd.date_range('2024-01-01', periods=5, freq='D'),
+        'precip': [0.0] * 5, 't_max': [20.0] * 5, 't_min': [10.0] * 5, 'solar': [15.0] * 5,
+    }).to_csv(tmp_path / "climate.csv", index=False)
+    
+    nodes = {
+        f'source_{g}': {'type': 'source', 'strategy': 'timeseries',
+                        'filepath': 'gauges.csv', 'column': f'gauge_{g}'}
+        for g in ('a', 'b')
+    }
+    nodes['junction'] = {'type': 'junction'}
+    config = {
+        'climate': {'source_type': 'timeseries', 'filepath': 'climate.csv',
+                    'site': {'latitude': 45.0, 'elevation': 100.0}},
+        'nodes': nodes,
+        'links': {
+            'la': {'source': 'source_a', 'target': 'junction'},
+            'lb': {'source': 'source_b', 'target': 'junction'},
+        }
+    }
+    config_path = tmp_path / "shared.yaml"
+    with open(config_path, 'w') as f:
+        yaml.dump(config, f)
+    
+    network, _, _ = YAMLParser(str(config_path)).parse()
+    
+    strategy_a = network.nodes['source_a'].generator
+    strategy_b = network.nodes['source_b'].generator
+    assert strategy_a.get_future_values(2).tolist() == [1.0, 2.0]
+    assert strategy_b.get_future_values(2).tolist() == [10.0, 20.0]
+    assert strategy_a.values.base is not None
+
+
+def test_convert_csv_to_npy_roundtrip(gauges_csv):
+    """Test CSV conversion to a column-major memory-mapped table."""
+    npy_path = convert_csv_to_npy(gauges_csv)
+    
+    values, columns, dates = load_npy_table(npy_path)
+    
+    assert npy_path.suffix == '.npy'
+    assert columns == ['gauge_a', 'gauge_b', 'gauge_c']
+    assert isinstance(values, np.memmap)
+    assert values[:, 1].flags.c_contiguous
+    assert values[:, 1].tolist() == [10.0, 20.0, 30.0, 40.0, 50.0]
+    assert dates[0] == np.datetime64('2024-01-01')
+
+
+def test_npy_backed_strategy_pickles_by_path(gauges_csv):
+    """Test that a memory-mapped strategy is pickled by reference to its file."""
+    npy_path = convert_csv_to_npy(gauges_csv)
+    strategy = TimeSeriesStrategy.from_npy(str(npy_path), 'gauge_b')
+    strategy.current_index = 2
+    
+    payload = pickle.dumps(strategy)
+    restored = pickle.loads(payload)
+    
+    assert len(payload) < 400
+    assert restored.source_path == strategy.source_path
+    assert restored.get_future_values(2).tolist() == [30.0, 40.0]
+
+
+def test_npy_climate_source(tmp_path):
+    """Test a climate source backed by a binary table matches the CSV source."""
+    csv_path = tmp_path / "climate.csv"
+    pd.DataFrame({
+        'date': pd.date_range('2024-01-01', periods=4, freq='D'),
+        'precip': [0.0, 5.0, 1.0, 0.0],
+        't_max': [20.0, 21.0, 22.0, 23.0],
+        't_min': [10.0, 11.0, 12.0, 13.0],
+        'solar': [15.0, 16.0, 17.0, 18.0],
+    }).to_csv(csv_path, index=False)
+    
+    csv_source = TimeSeriesClimateSource.from_csv(str(csv_path))
+    npy_source = TimeSeriesClimateSource.from_npy(str(convert_csv_to_npy(csv_path)))
+    
+    date = datetime(2024, 1, 3)
+    assert npy_source.get_climate_data(date) == csv_source.get_climate_data(date)
+    assert npy_source.end_date == csv_source.end_date
+    
+    restored = pickle.loads(pickle.dumps(npy_source))
+    assert restored.get_climate_data(date) == (1.0, 22.0, 12.0, 17.0)
+    
+    with pytest.raises(ClimateDataError):
+        npy_source.get_climate_data(datetime(2025, 1, 1))
+
+
+def test_parser_accepts_npy_inputs(tmp_path, gauges_csv):
+    """Test that YAML configurations can reference binary tables."""
+    pd.DataFrame({
+        'date': pd.date_range('2024-01-01', periods=5, freq='D'),
+        'precip': [0.0] * 5, 't_max': [20.0] * 5, 't_min': [10.0] * 5, 'solar': [15.0] * 5,
+    }).to_csv(tmp_path / "climate.csv", index=False)
+    convert_csv_to_npy(tmp_path / "climate.csv")
+    convert_csv_to_npy(gauges_csv)
+    
+    config = {
+        'climate': {'source_type': 'timeseries', 'filepath': 'climate.npy',
+                    'site': {'latitude': 45.0, 'elevation': 100.0}},
+        'nodes': {
+            'source': {'type': 'source', 'strategy': 'timeseries',
+                       'filepath': 'gauges.npy', 'column': 'gauge_c'},
+            'junction': {'type': 'junction'},
+        },
+        'links': {'l1': {'source': 'source', 'target': 'junction'}},
+    }
+    config_path = tmp_path / "binary.yaml"
+    with open(config_path, 'w') as f:
+        yaml.dump(config, f)
+    
+    network, climate_source, _ = YAMLParser(str(config_path)).parse()
+    
+    strategy = network.nodes['source'].generator
+    assert strategy.source_path.endswith('gauges.npy')
+    assert strategy.get_future_values(1).tolist() == [7.0]
+    assert climate_source.get_climate_data(datetime(2024, 1, 2))[1] == 20.0
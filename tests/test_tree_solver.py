@@ -0,0 +1,186 @@
+"""
+Tests for the tree allocation solver.
+
+The direct solve is validated against LinearProgrammingSolver on randomly
+generated tree networks.
+"""
+
+import random
+from datetime import datetime
+
+import pytest
+
+from hydrosim.climate import ClimateState
+from hydrosim.config import ElevationAreaVolume
+from hydrosim.exceptions import InfeasibleNetworkError
+from hydrosim.links import Link
+from hydrosim.nodes import DemandNode, JunctionNode, SourceNode, StorageNode
+from hydrosim.solver import COST_DEMAND, LinearProgrammingSolver
+from hydrosim.strategies import DemandModel, GeneratorStrategy
+from hydrosim.tree_solver import TreeAllocationSolver
+
+
+class ConstantGenerator(GeneratorStrategy):
+    def __init__(self, value: float):
+        self.value = value
+
+    def generate(self, climate: ClimateState) -> float:
+        return self.value
+
+
+class ConstantDemand(DemandModel):
+    def __init__(self, value: float):
+        self.value = value
+
+    def calculate(self, climate: ClimateState) -> float:
+        return self.value
+
+
+CLIMATE = ClimateState(date=datetime(2024, 1, 1), precip=0.0, t_max=20.0,
+                       t_min=10.0, solar=15.0, et0=2.0)
+EAV = ElevationAreaVolume(elevations=[0.0, 10.0], areas=[1.0, 1.0], volumes=[0.0, 1000.0])
+
+
+def connect(link_id, source, target, capacity, cost):
+    link = Link(link_id, source, target, physical_capacity=capacity, cost=cost)
+    source.outflows.append(link)
+    target.inflows.append(link)
+    return link
+
+
+def random_tree(seed: int):
+    """Random tree with a storage root and arbitrarily oriented links."""
+    rng = random.Random(seed)
+    nodes = [StorageNode("n0", initial_storage=rng.uniform(0, 1000), eav_table=EAV,
+                         max_storage=1000.0)]
+    for i in range(1, rng.randint(2, 30)):
+        kind = rng.choice(["source", "storage", "junction", "demand"])
+        if kind == "source":
+            nodes.append(SourceNode(f"n{i}", ConstantGenerator(rng.uniform(0, 50))))
+        elif kind == "storage":
+            capacity = rng.choice([100.0, 500.0, 1000.0])
+            nodes.append(StorageNode(f"n{i}", initial_storage=rng.uniform(10, capacity),
+                                     eav_table=EAV, max_storage=capacity,
+                                     min_storage=rng.choice([0.0, 10.0])))
+        elif kind == "junction":
+            nodes.append(JunctionNode(f"n{i}"))
+        else:
+            nodes.append(DemandNode(f"n{i}", ConstantDemand(rng.uniform(0, 80))))
+
+    links = []
+    for i in range(1, len(nodes)):
+        parent = nodes[rng.randrange(i)]
+        source, target = (parent, nodes[i]) if rng.random() < 0.7 else (nodes[i], parent)
+        links.append(connect(f"l{i}", source, target,
+                             rng.choice([10.0, 30.0, 100.0, 1000.0]),
+                             rng.choice([0.0, 1.0, -2.5, -5.0, COST_DEMAND])))
+
+    for node in nodes:
+        node.step(CLIMATE)
+    constraints = {link.link_id: link.calculate_constraints() for link in links}
+    return nodes, links, constraints
+
+
+def objective(nodes, constraints, flows):
+    """Total cost of an allocation: link costs plus the storage reward."""
+    storage = sum(node.storage for node in nodes if node.node_type == "storage")
+    return sum(constraints[link_id][2] * flow for link_id, flow in flows.items()) - storage
+
+
+def test_tree_solver_matches_lp_on_random_trees():
+    """The direct solve reaches the LP optimum with feasible flows."""
+    solved = 0
+    for seed in range(300):
+        nodes, links, constraints = random_tree(seed)
+        try:
+            expected_flows = LinearProgrammingSolver().solve(nodes, links, constraints)
+        except InfeasibleNetworkError:
+            continue
+        expected = objective(nodes, constraints, expected_flows)
+
+        nodes, links, constraints = random_tree(seed)
+        solver = TreeAllocationSolver()
+        flows = solver.solve(nodes, links, constraints)
+        assert solver.stats['tree_solves'] == 1
+        assert solver.stats['lp_solves'] == 0
+        assert objective(nodes, constraints, flows) == pytest.approx(expected, rel=1e-9, abs=1e-6)
+
+        for link in links:
+            q_min, q_max, _ = constraints[link.link_id]
+            assert q_min - 1e-6 <= flows[link.link_id] <= q_max + 1e-6
+        for node in nodes:
+            inflow = sum(flows[link.link_id] for link in node.inflows)
+            outflow = sum(flows[link.link_id] for link in node.outflows)
+            if node.node_type == "junction":
+                assert inflow == pytest.approx(outflow, abs=1e-6)
+            elif node.node_type == "source":
+                assert outflow - inflow == pytest.approx(node.inflow, abs=1e-6)
+            elif node.node_type == "demand":
+                assert -1e-6 <= inflow - outflow <= node.request + 1e-6
+        solved += 1
+
+    assert solved > 50
+
+
+def test_tree_solver_priorities():
+    """Demands are served first, then storage is filled, then water spills."""
+    river = SourceNode("river", ConstantGenerator(300.0))
+    reservoir = StorageNode("reservoir", initial_storage=900.0, eav_table=EAV, max_storage=1000.0)
+    city = DemandNode("city", ConstantDemand(120.0))
+    links = [
+        connect("inflow", river, reservoir, 1000.0, 0.0),
+        connect("supply", reservoir, city, 1000.0, COST_DEMAND),
+    ]
+    nodes = [river, reservoir, city]
+    for node in nodes:
+        node.step(CLIMATE)
+    constraints = {link.link_id: link.calculate_constraints() for link in links}
+
+    flows = TreeAllocationSolver().solve(nodes, links, constraints)
+
+    assert flows == {"inflow": pytest.approx(300.0), "supply": pytest.approx(120.0)}
+    assert reservoir.storage == pytest.approx(1000.0)
+
+
+def test_tree_solver_falls_back_for_loops():
+    """Networks with a loop are solved by the LP solver."""
+    source = SourceNode("source", ConstantGenerator(50.0))
+    reservoir = StorageNode("reservoir", initial_storage=100.0, eav_table=EAV, max_storage=1000.0)
+    demand = DemandNode("demand", ConstantDemand(30.0))
+    links = [
+        connect("a", source, reservoir, 100.0, 0.0),
+        connect("b", reservoir, demand, 100.0, COST_DEMAND),
+        connect("c", source, demand, 10.0, COST_DEMAND),
+    ]
+    nodes = [source, reservoir, demand]
+    for node in nodes:
+        node.step(CLIMATE)
+    constraints = {link.link_id: link.calculate_constraints() for link in links}
+
+    solver = TreeAllocationSolver()
+    flows = solver.solve(nodes, links, constraints)
+
+    assert not solver.is_tree
+    assert solver.stats['tree_solves'] == 0
+    assert solver.stats['lp_solves'] == 1
+    assert flows["b"] + flows["c"] == pytest.approx(30.0)
+
+
+def test_tree_solver_infeasible_raises():
+    """Infeasible days are passed to the LP solver, which reports them."""
+    source = SourceNode("source", ConstantGenerator(50.0))
+    junction = JunctionNode("junction")
+    reservoir = StorageNode("reservoir", initial_storage=100.0, eav_table=EAV, max_storage=1000.0)
+    links = [
+        connect("a", source, junction, 10.0, 0.0),
+        connect("b", junction, reservoir, 100.0, 0.0),
+    ]
+    nodes = [source, junction, reservoir]
+    for node in nodes:
+        node.step(CLIMATE)
+    constraints = {link.link_id: link.calculate_constraints() for link in links}
+
+    solver = TreeAllocationSolver()
+    with pytest.raises(InfeasibleNetworkError):
+        solver.solve(nodes, links, constraints)
+    assert solver.is_tree
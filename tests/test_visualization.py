@@ -0,0 +1,113 @@
+"""
+Tests for network visualization layouts and traces.
+
+These tests verify the layered and force-directed layouts and that links
+are drawn as a single batched WebGL trace.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+from hydrosim.config import NetworkGraph
+from hydrosim.nodes import JunctionNode
+from hydrosim.links import Link
+from hydrosim.visualization import (
+    ARROW_ANNOTATION_LIMIT, LARGE_NETWORK_NODES, _calculate_layout, _longest_path_layers, visualize_network
+)
+
+
+def build_network(edges):
+    """Create a network of junction nodes from (source, target) pairs."""
+    network = NetworkGraph()
+    nodes = {}
+    for source, target in edges:
+        for node_id in (source, target):
+            if node_id not in nodes:
+                nodes[node_id] = JunctionNode(node_id)
+                network.add_node(nodes[node_id])
+        network.add_link(Link(f"{source}_{target}", nodes[source], nodes[target], 1.0, 1.0))
+    return network
+
+
+def count_crossings(pos, edges):
+    """Count crossings between links joining the same pair of rows."""
+    crossings = 0
+    for i, (a, b) in enumerate(edges):
+        for c, d in edges[i + 1:]:
+            if pos[a][1] == pos[c][1] and pos[b][1] == pos[d][1]:
+                if (pos[a][0] - pos[c][0]) * (pos[b][0] - pos[d][0]) < 0:
+                    crossings += 1
+    return crossings
+
+
+def test_longest_path_layers_with_cycle():
+    """Test longest-path layering, including a spill link back upstream."""
+    sources = np.array([0, 1, 0, 2, 3])
+    targets = np.array([1, 2, 2, 3, 1])  # 3 -> 1 closes a cycle
+
+    layers = _longest_path_layers(4, sources, targets)
+
+    assert list(layers) == [0, 1, 2, 3]
+
+
+def test_layered_layout_reduces_crossings():
+    """Test that barycenter ordering removes avoidable crossings."""
+    edges = [('s1', 'd3'), ('s2', 'd2'), ('s3', 'd1'), ('s1', 'd2b')]
+    network = build_network(edges)
+
+    pos = _calculate_layout(network, 'layered')
+
+    assert {pos[n][1] for n in ('s1', 's2', 's3')} == {1.0}
+    assert {pos[n][1] for n in ('d1', 'd2', 'd3', 'd2b')} == {0.5}
+    assert count_crossings(pos, edges) == 0
+
+
+def test_force_layout_is_bounded():
+    """Test that the force-directed layout gives finite, distinct positions."""
+    edges = [(f"n{i}", f"n{i + 1}") for i in range(30)] + [("n0", "n15")]
+    network = build_network(edges)
+
+    pos = _calculate_layout(network, 'force')
+    coords = np.array(list(pos.values()))
+
+    assert np.all(np.isfinite(coords))
+    assert np.abs(coords).max() == pytest.approx(1.0)
+    assert len({tuple(np.round(c, 6)) for c in coords}) == len(coords)
+
+
+def test_edges_batched_into_one_trace():
+    """Test that all links share one SVG trace with None separators."""
+    network = build_network([('a', 'b'), ('b', 'c'), ('a', 'c')])
+
+    fig = visualize_network(network, layout='layered')
+
+    edge_trace = fig.data[0]
+    assert isinstance(edge_trace, go.Scatter)
+    assert len(edge_trace.x) == 9
+    assert edge_trace.x[2] is None and edge_trace.y[5] is None
+    assert len(fig.layout.annotations) == 3
+
+
+def test_large_network_uses_arrow_markers():
+    """Test that large networks draw direction with one marker trace."""
+    n = ARROW_ANNOTATION_LIMIT + 20
+    network = build_network([(f"n{i // 2}", f"n{i + 1}") for i in range(n)])
+
+    fig = visualize_network(network, layout='layered')
+
+    assert len(fig.layout.annotations) == 0
+    arrows = fig.data[1]
+    assert arrows.marker.symbol == 'arrow'
+    assert len(arrows.x) == n
+    assert isinstance(arrows, go.Scatter)
+
+
+def test_edge_trace_type_matches_nodes():
+    """Test that edges switch to WebGL together with the node markers."""
+    n = LARGE_NETWORK_NODES + 10
+    network = build_network([(f"n{i}", f"n{i + 1}") for i in range(n)])
+
+    fig = visualize_network(network, layout='layered')
+
+    assert all(isinstance(trace, go.Scattergl) for trace in fig.data)
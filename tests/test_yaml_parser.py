@@ -1282,4 +1282,173 @@ def test_awbm_strategy_invalid_initial_storage(temp_config_dir, sample_climate_c
     
     parser = YAMLParser(str(config_path))
     with pytest.raises(ValueError, match="initial_storage must be between 0.0 and 1.0"):
-        parser.parse()
\ No newline at end of file
+        parser.parse()
+
+def _write_cached_source_config(temp_config_dir):
+    """Write a configuration with a time series source for cache tests."""
+    config_path = temp_config_dir / "cached.yaml"
+    config = {
+        'climate': {
+            'source_type': 'timeseries',
+            'filepath': 'climate.csv',
+            'site': {'latitude': 45.0, 'elevation': 1000.0}
+        },
+        'nodes': {
+            'source1': {'type': 'source', 'strategy': 'timeseries',
+                        'filepath': 'inflow.csv', 'column': 'inflow'},
+            'demand1': {'type': 'demand', 'demand_type': 'municipal',
+                        'population': 10000.0, 'per_capita_demand': 0.2}
+        },
+        'links': {
+            'link1': {'source': 'source1', 'target': 'demand1', 'capacity': 5000.0, 'cost': 1.0}
+        }
+    }
+    with open(config_path, 'w') as f:
+        yaml.dump(config, f)
+    return config_path
+
+
+def test_yaml_parser_cache_warm_parse_skips_yaml(temp_config_dir, sample_climate_csv,
+                                                 sample_inflow_csv, monkeypatch):
+    """Test that a warm cache returns the network without parsing YAML or CSV."""
+    config_path = _write_cached_source_config(temp_config_dir)
+    cache_dir = temp_config_dir / "cache"
+    
+    cold = YAMLParser(str(config_path), cache_dir=str(cache_dir))
+    network, climate_source, site_config = cold.parse()
+    assert not cold.cache_hit
+    assert len(list(cache_dir.glob('*.pkl'))) == 1
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("parsing should be skipped on a warm cache")
+    monkeypatch.setattr(yaml, 'safe_load', fail)
+    monkeypatch.setattr(pd, 'read_csv', fail)
+    
+    warm = YAMLParser(str(config_path), cache_dir=str(cache_dir))
+    cached_network, cached_climate, cached_site = warm.parse()
+    
+    assert warm.cache_hit
+    assert set(cached_network.nodes) == set(network.nodes)
+    assert cached_network.links['link1'].target is cached_network.nodes['demand1']
+    assert cached_site.latitude == site_config.latitude
+    assert cached_network.nodes['source1'].generator.get_future_values(3).tolist() == \
+        network.nodes['source1'].generator.get_future_values(3).tolist()
+
+
+def test_yaml_parser_cache_invalidated_by_referenced_file(temp_config_dir, sample_climate_csv,
+                                                          sample_inflow_csv):
+    """Test that editing a referenced CSV invalidates the cached network."""
+    config_path = _write_cached_source_config(temp_config_dir)
+    cache_dir = temp_config_dir / "cache"
+    
+    YAMLParser(str(config_path), cache_dir=str(cache_dir)).parse()
+    
+    pd.DataFrame({'inflow': [999.0] * 10}).to_csv(sample_inflow_csv, index=False)
+    
+    parser = YAMLParser(str(config_path), cache_dir=str(cache_dir))
+    network, _, _ = parser.parse()
+    assert not parser.cache_hit
+    assert network.nodes['source1'].generator.get_future_values(1)[0] == 999.0
+    
+    rewarm = YAMLParser(str(config_path), cache_dir=str(cache_dir))
+    rewarm.parse()
+    assert rewarm.cache_hit
+
+
+def _parse_optimization_config(temp_config_dir, optimization):
+    """Parse a minimal network with the given optimization section."""
+    config_path = temp_config_dir / "optimization.yaml"
+    config = {
+        'climate': {
+            'source_type': 'timeseries',
+            'filepath': 'climate.csv',
+            'site': {'latitude': 45.0, 'elevation': 1000.0}
+        },
+        'nodes': {
+            'demand1': {'type': 'demand', 'demand_type': 'municipal',
+                        'population': 100.0, 'per_capita_demand': 0.2},
+            'junction1': {'type': 'junction'}
+        },
+        'links': {
+            'link1': {'source': 'junction1', 'target': 'demand1', 'capacity': 100.0, 'cost': 1.0}
+        },
+        'optimization': optimization
+    }
+    with open(config_path, 'w') as f:
+        yaml.dump(config, f)
+    network, _, _ = YAMLParser(str(config_path)).parse()
+    return network.opt_config
+
+
+def test_optimization_shadow_prices(temp_config_dir, sample_climate_csv):
+    """Test parsing of the shadow_prices option."""
+    assert _parse_optimization_config(temp_config_dir, {})['shadow_prices'] is False
+    assert _parse_optimization_config(temp_config_dir, {'shadow_prices': True})['shadow_prices'] is True
+    
+    for value in [1, 'yes']:
+        with pytest.raises(ValueError, match="shadow_prices"):
+            _parse_optimization_config(temp_config_dir, {'shadow_prices': value})
+
+
+def test_optimization_time_limit(temp_config_dir, sample_climate_csv):
+    """Test parsing of the time_limit option."""
+    assert _parse_optimization_config(temp_config_dir, {})['time_limit'] is None
+    assert _parse_optimization_config(temp_config_dir, {'time_limit': 2})['time_limit'] == 2.0
+    assert _parse_optimization_config(temp_config_dir, {'time_limit': 0.5})['time_limit'] == 0.5
+    
+    for value in [True, '2', 0, -1.0]:
+        with pytest.raises(ValueError, match="time_limit"):
+            _parse_optimization_config(temp_config_dir, {'time_limit': value})
+
+
+def test_optimization_horizon_schedule(temp_config_dir, sample_climate_csv):
+    """Test parsing of the horizon_schedule option."""
+    assert _parse_optimization_config(temp_config_dir, {})['horizon_schedule'] is None
+    
+    opt_config = _parse_optimization_config(temp_config_dir, {'horizon_schedule': [
+        {'period_days': 1, 'periods': 14},
+        {'period_days': 7, 'periods': 11},
+        {'period_days': 30.0, 'periods': 9},
+    ]})
+    assert opt_config['horizon_schedule'] == [(1, 14), (7, 11), (30, 9)]
+    assert opt_config['lookahead_days'] == 14 + 77 + 270
+    
+    for entry in [{'period_days': 1.7, 'periods': 2}, {'period_days': 1, 'periods': 2.5},
+                  {'period_days': 1, 'periods': 0}, {'period_days': True, 'periods': 2},
+                  {'period_days': '1', 'periods': 2}, {'period_days': 1},
+                  {'period_days': 1, 'periods': float('inf')}, {'period_days': float('nan'), 'periods': 2}]:
+        with pytest.raises(ValueError, match="horizon_schedule"):
+            _parse_optimization_config(temp_config_dir, {'horizon_schedule': [entry]})
+    
+    with pytest.raises(ValueError, match="one-day periods"):
+        _parse_optimization_config(temp_config_dir, {'horizon_schedule': [{'period_days': 7, 'periods': 4}]})
+    with pytest.raises(ValueError, match="non-empty list"):
+        _parse_optimization_config(temp_config_dir, {'horizon_schedule': []})
+
+
+def test_optimization_reoptimize_every(temp_config_dir, sample_climate_csv):
+    """Test parsing of the reoptimize_every and reoptimize_tolerance options."""
+    opt_config = _parse_optimization_config(temp_config_dir, {})
+    assert opt_config['reoptimize_every'] == 1
+    assert opt_config['reoptimize_tolerance'] == 1e-6
+    
+    opt_config = _parse_optimization_config(temp_config_dir, {
+        'lookahead_days': 7, 'reoptimize_every': 3, 'reoptimize_tolerance': 0
+    })
+    assert opt_config['reoptimize_every'] == 3
+    assert opt_config['reoptimize_tolerance'] == 0.0
+    
+    for value in [2.9, 0, True, '3', float('inf'), float('nan')]:
+        with pytest.raises(ValueError, match="reoptimize_every"):
+            _parse_optimization_config(temp_config_dir, {'lookahead_days': 7, 'reoptimize_every': value})
+    for value in [-0.1, True, '0.01']:
+        with pytest.raises(ValueError, match="reoptimize_tolerance"):
+            _parse_optimization_config(temp_config_dir, {'reoptimize_tolerance': value})
+    
+    # A myopic horizon has no plan to follow
+    with pytest.raises(ValueError, match="reoptimize_every > 1"):
+        _parse_optimization_config(temp_config_dir, {'reoptimize_every': 3})
+    with pytest.raises(ValueError, match="reoptimize_every > 1"):
+        _parse_optimization_config(temp_config_dir, {'reoptimize_every': 3, 'horizon_schedule': [
+            {'period_days': 1, 'periods': 1}, {'period_days': 7, 'periods': 4}]})
+    assert _parse_optimization_config(temp_config_dir, {'reoptimize_every': 1})['reoptimize_every'] == 1